@@ -11,6 +11,7 @@ from .orchestrator import (
     run_translation_phase,
     run_review_phase,
     run_validate_phase,
+    run_pipeline,
     get_workflow_status,
     retry_failed_tasks,
     check_phase_completion,
@@ -32,6 +33,7 @@ __all__ = [
     "run_translation_phase",
     "run_review_phase",
     "run_validate_phase",
+    "run_pipeline",
     "get_workflow_status",
     "retry_failed_tasks",
     "check_phase_completion",
@@ -1,49 +1,47 @@
 # Analyzer 에이전트 - Workshop 구조 분석
-# Explore 패턴 참고: 빠른 탐색, 병렬 실행
+# 파일 목록/구조는 로컬 인덱스로 결정하고, 언어 확장자가 없는 파일은 로컬 감지기로 먼저 판별 후 모호한 파일만 모델로 감지
 
 import os
-from strands import Agent, tool
-from strands_tools import file_read
-from model.load import load_haiku
+import re
+from typing import Dict, List, Tuple
+
+from strands import tool
+from model.invoke import converse
+from model.load import load_worker_model
 from prompts.system_prompts import ANALYZER_PROMPT
 from tools.file_tools import (
+    detect_file_languages,
     list_workshop_files,
+    list_unlabelled_files,
+    normalize_file_names,
     read_contentspec,
-    get_directory_structure,
+    read_text_sample,
     get_supported_languages,
-    read_workshop_file,
+    SUPPORTED_LANG_CODES,
 )
+from tools.workshop_index import get_search_path, get_workshop_index
 
+# 언어 감지 요청 설정 (파일당 본문 샘플 글자 수, 요청당 파일 수)
+DETECT_SAMPLE_CHARS = int(os.getenv("WSTRANSLATOR_DETECT_SAMPLE_CHARS", "600"))
+DETECT_BATCH_FILES = int(os.getenv("WSTRANSLATOR_DETECT_BATCH_FILES", "20"))
 
-def create_analyzer_agent() -> Agent:
-    """
-    Analyzer 에이전트 인스턴스를 생성합니다.
-    
-    Agent는 다음 도구들을 사용할 수 있습니다:
-    - file_read: 파일 내용 읽기 (strands 기본 도구)
-    
-    Returns:
-        Agent: Analyzer 에이전트 인스턴스
-    """
-    return Agent(
-        model=load_haiku(),
-        system_prompt=ANALYZER_PROMPT,
-        tools=[file_read],
-    )
+# 응답 한 줄 형식: "3: ko"
+_DETECT_LINE = re.compile(r'^\s*\[?(\d+)\]?\s*[:：]\s*([A-Za-z-]+)')
 
 
 @tool
 def analyze_workshop(workshop_path: str, source_lang: str = None) -> dict:
     """
     Workshop 구조를 분석하고 번역 대상 파일 목록을 반환합니다.
-    
-    이 도구는 Orchestrator가 호출하며, 내부에서 Analyzer Agent를 실행합니다.
-    Agent는 LLM을 사용하여 Workshop 구조를 분석하고 필요한 정보를 수집합니다.
-    
+
+    파일 목록, 소스 언어, 디렉토리 구조는 파일 인덱스로 결정하므로 모델을 호출하지 않습니다.
+    언어 확장자가 없는 .md 파일은 본문 샘플의 문자 체계/n-gram으로 언어를 감지하고,
+    로컬에서 판단하지 못한 파일만 Haiku로 보낸 뒤 파일명을 일괄 정규화합니다. (index.md → index.en.md)
+
     Args:
         workshop_path: Workshop 디렉토리 경로
         source_lang: 소스 언어 코드 (None이면 자동 감지)
-    
+
     Returns:
         dict: 분석 결과
             - workshop_path: Workshop 경로
@@ -54,11 +52,14 @@ def analyze_workshop(workshop_path: str, source_lang: str = None) -> dict:
             - files: 번역 대상 파일 목록
             - file_count: 파일 수
             - structure: 디렉토리 구조
+            - renamed: 파일명 정규화 내역 (원래 경로, 새 경로, 언어, 감지 방법 local/model)
+            - unlabelled_files: 언어를 감지하지 못해 남은 파일
+            - model_calls: 언어 감지 모델 호출 수
     """
     # 경로 정규화
     workshop_path = os.path.expanduser(workshop_path)
     workshop_path = os.path.abspath(workshop_path)
-    
+
     # 경로 존재 확인
     if not os.path.exists(workshop_path):
         return {
@@ -68,38 +69,35 @@ def analyze_workshop(workshop_path: str, source_lang: str = None) -> dict:
             "files": [],
             "file_count": 0,
         }
-    
-    # Agent 생성 및 실행
-    agent = create_analyzer_agent()
-    
-    # Agent에게 분석 요청
-    prompt = f"""
-Workshop 경로를 분석해주세요: {workshop_path}
-
-다음 정보를 수집하세요:
-1. 소스 언어 자동 감지 (.en.md 우선, 없으면 다른 언어 파일 탐색)
-2. contentspec.yaml 확인
-3. 번역 대상 파일 목록
-4. 디렉토리 구조
-
-반드시 ANALYZER_PROMPT에 명시된 XML 형식으로 결과를 반환하세요.
-"""
-    
+
     try:
-        response = agent(prompt)
-        
-        # Agent 응답을 파싱하여 구조화된 결과 생성
-        # 실제로는 헬퍼 함수를 사용하여 정확한 데이터 수집
+        # 언어 확장자가 없는 파일만 언어 감지 후 파일명 정규화
+        renamed = []
+        model_calls = 0
+        detection_error = None
+        model_detected = set()
+        unlabelled = list_unlabelled_files(workshop_path)
+        if unlabelled:
+            detected, ambiguous = detect_file_languages(unlabelled, DETECT_SAMPLE_CHARS)
+            if ambiguous:
+                try:
+                    model_result, model_calls = _detect_languages_with_model(ambiguous)
+                    detected.update(model_result)
+                    model_detected = set(model_result)
+                except Exception as e:
+                    # 감지 실패는 분석 실패로 보지 않음 (로컬에서 감지한 파일만 정규화)
+                    detection_error = f"언어 감지 실패: {str(e)}"
+            renamed = normalize_file_names(detected)
+            if renamed:
+                unlabelled = list_unlabelled_files(workshop_path)
+
         detected_lang, files = list_workshop_files(workshop_path, source_lang)
         supported_languages = get_supported_languages(workshop_path)
         contentspec = read_contentspec(workshop_path)
-        
-        content_path = os.path.join(workshop_path, "content")
-        if os.path.exists(content_path):
-            structure = get_directory_structure(content_path)
-        else:
-            structure = get_directory_structure(workshop_path)
-        
+
+        # 파일 목록 조회에서 갱신된 인덱스로 트리 생성 (디렉토리를 다시 순회하지 않음)
+        structure = get_workshop_index(workshop_path).tree()
+
         # 소스 언어 메시지
         if detected_lang == "none":
             lang_message = "번역 대상 파일을 찾을 수 없습니다."
@@ -109,8 +107,9 @@ Workshop 경로를 분석해주세요: {workshop_path}
             lang_message = f".en.md 파일이 없어 .{detected_lang}.md 파일을 소스로 사용합니다."
         else:
             lang_message = None
-        
-        return {
+
+        search_path = get_search_path(workshop_path)
+        result = {
             "workshop_path": workshop_path,
             "source_lang": detected_lang,
             "source_lang_message": lang_message,
@@ -119,9 +118,22 @@ Workshop 경로를 분석해주세요: {workshop_path}
             "files": files,
             "file_count": len(files),
             "structure": structure,
-            "agent_response": str(response),  # Agent의 원본 응답 포함
+            "renamed": [
+                {
+                    "from": os.path.relpath(old_path, search_path),
+                    "to": os.path.relpath(new_path, search_path),
+                    "lang": lang,
+                    "method": "model" if old_path in model_detected else "local",
+                }
+                for old_path, new_path, lang in renamed
+            ],
+            "unlabelled_files": [os.path.relpath(path, search_path) for path in unlabelled],
+            "model_calls": model_calls,
         }
-        
+        if detection_error:
+            result["detection_error"] = detection_error
+        return result
+
     except Exception as e:
         return {
             "error": f"분석 실패: {str(e)}",
@@ -130,3 +142,40 @@ Workshop 경로를 분석해주세요: {workshop_path}
             "files": [],
             "file_count": 0,
         }
+
+
+def _detect_languages_with_model(file_paths: List[str]) -> Tuple[Dict[str, str], int]:
+    """
+    본문 샘플을 DETECT_BATCH_FILES개씩 묶어 Haiku로 언어 감지 (내부 함수)
+
+    본문이 없는 파일(샘플이 비어 있음)과 unknown으로 판별된 파일은 결과에서 제외합니다.
+
+    Returns:
+        Tuple: (파일 경로 → 언어 코드, 모델 호출 수)
+    """
+    samples = []
+    for file_path in file_paths:
+        sample = read_text_sample(file_path, DETECT_SAMPLE_CHARS)
+        if sample:
+            samples.append((file_path, sample))
+
+    detected = {}
+    calls = 0
+    for start in range(0, len(samples), DETECT_BATCH_FILES):
+        batch = samples[start:start + DETECT_BATCH_FILES]
+        prompt = "\n\n".join(
+            f"[{i}] {os.path.basename(file_path)}\n{sample}"
+            for i, (file_path, sample) in enumerate(batch, 1)
+        )
+        response = converse(load_worker_model("haiku"), ANALYZER_PROMPT, prompt, max_tokens=16 * len(batch) + 32)
+        calls += 1
+
+        for line in response.text.splitlines():
+            match = _DETECT_LINE.match(line)
+            if not match:
+                continue
+            number = int(match.group(1))
+            lang = match.group(2).lower()[:2]  # zh-CN, en-US → zh, en
+            if 1 <= number <= len(batch) and lang in SUPPORTED_LANG_CODES:
+                detected[batch[number - 1][0]] = lang
+    return detected, calls
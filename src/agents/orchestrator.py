@@ -1,25 +1,34 @@
 # Orchestrator 도구 - 중앙 집중식 워크플로우 관리
 
+import asyncio
 import os
 import shutil
 import subprocess
 import signal
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Union
 from strands import tool
 
-from task_manager.manager import get_task_manager
+from model.concurrency import get_concurrency_controller
+from model.rate_limit import get_rate_limit_status
+from task_manager.manager import get_task_manager, find_task_manager, release_task_manager
 from task_manager.types import TaskType, TaskResult
-from agents.workers.translator_worker import translate_single_file
-from agents.workers.reviewer_worker import review_single_file
-from agents.workers.validator_worker import validate_single_file
+from agents.scheduler import execute_phase_async, execute_pipeline_async, PhaseExecution, ASYNC_MAX_IN_FLIGHT
 
 
 # Preview 프로세스 관리를 위한 전역 변수
 _preview_process = None
 _preview_port = None
 
+# Phase 요약에 포함할 최대 실패 태스크 수 (응답 크기 제한)
+MAX_FAILED_IN_SUMMARY = 20
+
+# 실패 태스크마다 포함할 블록 차이 수 (검증 실패 위치)
+MAX_BLOCK_DIFFS_IN_SUMMARY = 3
+
+# Phase 도구가 실행 중에 스트리밍하는 진행 이벤트의 event 값
+PROGRESS_EVENT = "task_progress"
+
 
 def _generate_review_report(manager, results: list) -> str:
     """검토 단계 리포트 생성"""
@@ -235,6 +244,7 @@ def initialize_workflow(
     TaskManager를 초기화하고 tasks.md 파일을 생성합니다.
     
     기존 tasks.md가 있으면 상태를 로드하여 이어서 작업할 수 있습니다.
+    이때 완료된 파일이라도 원본 내용이 바뀌었으면 다시 번역 대상이 됩니다.
     force_reset=True로 설정하면 기존 상태를 무시하고 새로 시작합니다.
     
     또한 workshop의 .gitignore에 translation/ 폴더를 자동으로 추가합니다.
@@ -252,11 +262,24 @@ def initialize_workflow(
             - file_count: 파일 수
             - resumed: 기존 상태에서 재개 여부
             - gitignore_updated: .gitignore 업데이트 여부
+            - changed_files: 원본 변경으로 재번역 대상이 된 파일 목록
     """
     manager = get_task_manager()
     
     # 기존 tasks.md 존재 여부 확인
     tasks_path_check = os.path.join(workshop_path, "translation", "tasks.md")
+    
+    # 같은 workshop을 다른 세션이 실행 중이면 tasks.md를 덮어쓰지 않도록 거부
+    # (유휴 세션이면 이 세션이 이어받음)
+    owner = find_task_manager(tasks_path_check, exclude_session=manager.session_id)
+    if owner is not None:
+        if owner.get_progress().in_progress:
+            return {
+                "error": f"다른 세션({owner.session_id})이 이 workshop의 태스크를 실행 중입니다.",
+                "tasks_path": tasks_path_check,
+            }
+        release_task_manager(owner.session_id)
+    
     had_existing = os.path.exists(tasks_path_check) and not force_reset
     
     tasks_path = manager.initialize(workshop_path, target_lang, files, force_reset=force_reset)
@@ -265,8 +288,12 @@ def initialize_workflow(
     # .gitignore에 translation/ 추가
     gitignore_updated = _add_translation_to_gitignore(workshop_path)
     
+    changed_files = manager.invalidated_files
+    
     if had_existing and progress.completed > 0:
         message = f"기존 워크플로우 재개. {progress.completed}/{progress.total} 태스크 완료 상태 로드됨."
+        if changed_files:
+            message += f" 원본이 변경된 {len(changed_files)}개 파일은 변경된 블록만 다시 번역합니다."
     else:
         message = f"워크플로우 초기화 완료. {len(files)}개 파일, {progress.total}개 태스크 생성됨."
     
@@ -279,239 +306,372 @@ def initialize_workflow(
         "file_count": len(files),
         "resumed": had_existing and progress.completed > 0,
         "gitignore_updated": gitignore_updated,
+        "changed_files": changed_files,
         "progress": progress.to_dict(),
         "message": message
     }
 
 
+def _summarize_execution(manager, task_type: TaskType, execution: PhaseExecution, report_path: str = None) -> dict:
+    """
+    Phase 실행 결과를 Orchestrator용 요약으로 변환
+
+    파일 수가 많아도 응답이 커지지 않도록 전체 결과 대신 실패 태스크만 포함합니다.
+    상세 결과는 리포트 파일과 tasks.md에서 확인할 수 있습니다.
+    """
+    progress = manager.get_phase_progress(task_type)
+
+    failed_tasks = []
+    for r in execution.results:
+        if r.success:
+            continue
+        path = r.metadata.get("source_path", "-") if r.metadata else "-"
+        error = str(r.error or "-")
+        failed_task = {
+            "task_id": r.task_id,
+            "path": path,
+            "error": error[:200] + ("..." if len(error) > 200 else ""),
+        }
+        if r.metadata and r.metadata.get("error_type"):
+            failed_task["error_type"] = r.metadata["error_type"]
+        if r.metadata and r.metadata.get("block_diffs"):
+            failed_task["block_diffs"] = r.metadata["block_diffs"][:MAX_BLOCK_DIFFS_IN_SUMMARY]
+        failed_tasks.append(failed_task)
+
+    summary = {
+        "executed": len(execution.results),
+        "succeeded": execution.succeeded,
+        "failed": execution.failed,
+        "elapsed_seconds": execution.elapsed_seconds,
+        "stopped_reason": execution.stopped_reason,
+        "concurrency_limit": get_concurrency_controller().limit,
+        "phase_progress": progress.to_dict(),
+        "failed_tasks": failed_tasks[:MAX_FAILED_IN_SUMMARY],
+    }
+    if len(failed_tasks) > MAX_FAILED_IN_SUMMARY:
+        summary["failed_tasks_omitted"] = len(failed_tasks) - MAX_FAILED_IN_SUMMARY
+    if report_path:
+        summary["report_path"] = report_path
+    return summary
+
+
+def _progress_event(manager, result: TaskResult) -> dict:
+    """태스크 결과 하나를 진행 이벤트로 변환 (내부 함수)"""
+    task = manager.get_task(result.task_id)
+    progress = manager.get_progress()
+    return {
+        "event": PROGRESS_EVENT,
+        "task_id": result.task_id,
+        "task_type": task.type.value,
+        "path": os.path.relpath(task.file_path, manager.workshop_path),
+        "success": result.success,
+        "completed": progress.completed,
+        "total": progress.total,
+    }
+
+
+async def _stream_execution(
+    manager,
+    run: Callable[[Callable[[TaskResult], None]], Awaitable[PhaseExecution]]
+) -> AsyncIterator[Union[dict, PhaseExecution]]:
+    """
+    비동기 Phase 실행을 진행 이벤트 스트림으로 변환 (내부 함수)
+
+    태스크 결과가 반영될 때마다 진행 이벤트를 yield하고, 마지막에 PhaseExecution을 yield합니다.
+    도구 호출이 취소되면 진행 중인 워커도 함께 취소됩니다.
+
+    Args:
+        manager: TaskManager 인스턴스
+        run: on_result 콜백을 받아 실행하는 코루틴 함수
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run_and_close() -> PhaseExecution:
+        try:
+            return await run(lambda result: queue.put_nowait(_progress_event(manager, result)))
+        finally:
+            queue.put_nowait(None)
+
+    runner = asyncio.ensure_future(run_and_close())
+    try:
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+            yield event
+        yield await runner
+    finally:
+        runner.cancel()
+
+
+async def _run_phase_tool(
+    manager,
+    task_type: TaskType,
+    max_concurrent: Optional[int],
+    max_duration_seconds: Optional[int],
+    max_tasks: Optional[int],
+    report: Optional[Callable[[object, list], str]] = None,
+    report_name: Optional[str] = None
+) -> AsyncIterator[dict]:
+    """
+    단일 Phase 실행 후 요약까지 스트리밍 (내부 함수)
+
+    진행 이벤트를 yield한 뒤 마지막으로 _summarize_execution 결과를 yield합니다.
+    """
+    execution = PhaseExecution()
+    stream = _stream_execution(
+        manager,
+        lambda on_result: execute_phase_async(
+            manager,
+            task_type,
+            max_in_flight=max_concurrent or ASYNC_MAX_IN_FLIGHT,
+            max_duration_seconds=max_duration_seconds,
+            max_tasks=max_tasks,
+            on_result=on_result,
+        ),
+    )
+    async for event in stream:
+        if isinstance(event, PhaseExecution):
+            execution = event
+        else:
+            yield event
+
+    # 리포트 생성 (결과가 있을 때)
+    report_path = None
+    if report and execution.results:
+        report_path = _save_report(manager, report(manager, execution.results), report_name)
+
+    yield _summarize_execution(manager, task_type, execution, report_path)
+
+
 @tool
-def run_translation_phase(max_concurrent: int = 5) -> dict:
+async def run_translation_phase(
+    max_concurrent: int = None,
+    max_duration_seconds: int = None,
+    max_tasks: int = None
+):
     """
     번역 단계 실행 (Orchestrator 전용)
     
     워크플로우:
     1. TaskManager에서 실행 가능한 번역 태스크 조회
-    2. 병렬로 Stateless 워커 실행
-    3. 결과 수집 후 TaskManager에 보고 (중앙 상태 업데이트)
-    4. tasks.md 자동 동기화
+    2. 이벤트 루프에서 Stateless 워커를 코루틴으로 유지하며, 하나가 끝나면 즉시 다음 태스크 투입
+    3. 결과 수집 후 TaskManager에 보고 (중앙 상태 업데이트), 태스크마다 진행 이벤트 스트리밍
+    4. 큐가 빌 때까지 (또는 시간/태스크 수 제한까지) 한 번의 호출로 처리
     
     Args:
-        max_concurrent: 최대 동시 실행 수 (기본: 5)
+        max_concurrent: 최대 동시 실행 수 (기본: 스로틀링/지연에 따라 자동 조절)
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간(초) (기본: 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (기본: 제한 없음)
     
     Returns:
-        dict: 실행 결과 요약
+        dict: 실행 결과 요약 (실패 태스크만 상세 포함)
     """
     manager = get_task_manager()
-    target_lang = manager.target_lang
-    
-    if not target_lang:
-        return {"error": "워크플로우가 초기화되지 않았습니다. initialize_workflow를 먼저 호출하세요."}
     
-    # 실행 가능한 번역 태스크 조회
-    ready_tasks = manager.get_ready_tasks(TaskType.TRANSLATE, limit=max_concurrent)
+    if not manager.target_lang:
+        yield {"error": "워크플로우가 초기화되지 않았습니다. initialize_workflow를 먼저 호출하세요."}
+        return
     
-    if not ready_tasks:
+    if not manager.get_ready_tasks(TaskType.TRANSLATE, limit=1):
         progress = manager.get_phase_progress(TaskType.TRANSLATE)
-        return {
+        yield {
             "message": "실행 가능한 번역 태스크가 없습니다.",
             "completed": progress.completed,
             "total": progress.total,
             "progress_percent": progress.progress_percent,
         }
+        return
     
-    results = []
-    
-    # 병렬 실행
-    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-        futures = {}
-        
-        for task in ready_tasks:
-            # 진행 중으로 표시
-            manager.mark_in_progress(task.id)
-            
-            # 워커 실행 (Stateless)
-            future = executor.submit(
-                translate_single_file,
-                task.file_path,
-                target_lang
-            )
-            futures[future] = task.id
-        
-        # 결과 수집
-        for future in as_completed(futures):
-            task_id = futures[future]
-            result = future.result()
-            result.task_id = task_id
-            
-            # Orchestrator가 중앙에서 상태 업데이트
-            manager.complete_task(result)
-            results.append(result)
-    
-    # 진행 상황 반환
-    progress = manager.get_phase_progress(TaskType.TRANSLATE)
-    
-    return {
-        "executed": len(results),
-        "succeeded": sum(1 for r in results if r.success),
-        "failed": sum(1 for r in results if not r.success),
-        "phase_progress": progress.to_dict(),
-        "results": [r.to_dict() for r in results],
-    }
+    async for event in _run_phase_tool(
+        manager, TaskType.TRANSLATE, max_concurrent, max_duration_seconds, max_tasks
+    ):
+        yield event
 
 
 @tool
-def run_review_phase(max_concurrent: int = 5) -> dict:
+async def run_review_phase(
+    max_concurrent: int = None,
+    max_duration_seconds: int = None,
+    max_tasks: int = None
+):
     """
     검토 단계 실행 (Orchestrator 전용)
     
     번역이 완료된 파일만 자동으로 선택하여 검토합니다.
-    의존성(번역 완료)이 충족된 태스크만 실행됩니다.
+    의존성(번역 완료)이 충족된 태스크가 소진될 때까지 연속으로 실행됩니다.
     
     Args:
-        max_concurrent: 최대 동시 실행 수 (기본: 5)
+        max_concurrent: 최대 동시 실행 수 (기본: 스로틀링/지연에 따라 자동 조절)
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간(초) (기본: 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (기본: 제한 없음)
     
     Returns:
         dict: 실행 결과 요약
     """
     manager = get_task_manager()
-    target_lang = manager.target_lang
-    
-    if not target_lang:
-        return {"error": "워크플로우가 초기화되지 않았습니다."}
     
-    # 실행 가능한 검토 태스크 조회 (번역 완료된 것만)
-    ready_tasks = manager.get_ready_tasks(TaskType.REVIEW, limit=max_concurrent)
+    if not manager.target_lang:
+        yield {"error": "워크플로우가 초기화되지 않았습니다."}
+        return
     
-    if not ready_tasks:
+    # 실행 가능한 검토 태스크 확인 (번역 완료된 것만)
+    if not manager.get_ready_tasks(TaskType.REVIEW, limit=1):
         progress = manager.get_phase_progress(TaskType.REVIEW)
-        return {
+        yield {
             "message": "실행 가능한 검토 태스크가 없습니다. 번역이 완료되었는지 확인하세요.",
             "completed": progress.completed,
             "total": progress.total,
             "progress_percent": progress.progress_percent,
         }
+        return
     
-    results = []
-    source_lang = "en"
-    
-    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-        futures = {}
-        
-        for task in ready_tasks:
-            manager.mark_in_progress(task.id)
-            
-            # 타겟 파일 경로 계산
-            target_path = task.file_path.replace(f".{source_lang}.md", f".{target_lang}.md")
-            
-            future = executor.submit(
-                review_single_file,
-                task.file_path,  # source_path
-                target_path,
-                target_lang,
-                source_lang
-            )
-            futures[future] = task.id
-        
-        for future in as_completed(futures):
-            task_id = futures[future]
-            result = future.result()
-            result.task_id = task_id
-            manager.complete_task(result)
-            results.append(result)
-    
-    progress = manager.get_phase_progress(TaskType.REVIEW)
-    
-    # 리포트 생성 (단계 완료 또는 결과가 있을 때)
-    report_path = None
-    if results:
-        # 전체 결과를 포함하여 리포트 생성
-        all_results = results  # 현재 실행 결과
-        report_content = _generate_review_report(manager, all_results)
-        report_path = _save_report(manager, report_content, "review_report.md")
-    
-    return {
-        "executed": len(results),
-        "succeeded": sum(1 for r in results if r.success),
-        "failed": sum(1 for r in results if not r.success),
-        "phase_progress": progress.to_dict(),
-        "results": [r.to_dict() for r in results],
-        "report_path": report_path,
-    }
+    async for event in _run_phase_tool(
+        manager, TaskType.REVIEW, max_concurrent, max_duration_seconds, max_tasks,
+        report=_generate_review_report, report_name="review_report.md",
+    ):
+        yield event
 
 
 @tool
-def run_validate_phase(max_concurrent: int = 5) -> dict:
+async def run_validate_phase(
+    max_concurrent: int = None,
+    max_duration_seconds: int = None,
+    max_tasks: int = None
+):
     """
     검증 단계 실행 (Orchestrator 전용)
     
     번역과 검토가 모두 완료된 파일만 자동으로 선택하여 검증합니다.
+    실행 가능한 태스크가 소진될 때까지 연속으로 실행됩니다.
     
     Args:
-        max_concurrent: 최대 동시 실행 수 (기본: 5)
+        max_concurrent: 최대 동시 실행 수 (기본: 스로틀링/지연에 따라 자동 조절)
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간(초) (기본: 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (기본: 제한 없음)
     
     Returns:
         dict: 실행 결과 요약
     """
     manager = get_task_manager()
-    target_lang = manager.target_lang
-    
-    if not target_lang:
-        return {"error": "워크플로우가 초기화되지 않았습니다."}
     
-    # 실행 가능한 검증 태스크 조회 (번역+검토 완료된 것만)
-    ready_tasks = manager.get_ready_tasks(TaskType.VALIDATE, limit=max_concurrent)
+    if not manager.target_lang:
+        yield {"error": "워크플로우가 초기화되지 않았습니다."}
+        return
     
-    if not ready_tasks:
+    # 실행 가능한 검증 태스크 확인 (번역+검토 완료된 것만)
+    if not manager.get_ready_tasks(TaskType.VALIDATE, limit=1):
         progress = manager.get_phase_progress(TaskType.VALIDATE)
-        return {
+        yield {
             "message": "실행 가능한 검증 태스크가 없습니다. 번역과 검토가 완료되었는지 확인하세요.",
             "completed": progress.completed,
             "total": progress.total,
             "progress_percent": progress.progress_percent,
         }
+        return
     
-    results = []
-    source_lang = "en"
+    async for event in _run_phase_tool(
+        manager, TaskType.VALIDATE, max_concurrent, max_duration_seconds, max_tasks,
+        report=_generate_validate_report, report_name="validate_report.md",
+    ):
+        yield event
+
+
+@tool
+async def run_pipeline(
+    max_concurrent: int = None,
+    max_duration_seconds: int = None,
+    max_tasks: int = None
+):
+    """
+    번역 → 검토 → 검증 파이프라인 실행 (Orchestrator 전용)
     
-    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-        futures = {}
+    Phase를 나누지 않고 태스크 의존성만 따라 실행합니다.
+    파일의 번역이 끝나는 즉시 해당 파일의 검토가, 검토가 끝나는 즉시 검증이 시작되며
+    서로 다른 파일의 번역/검토/검증이 동시에 진행됩니다.
+    
+    run_translation_phase → run_review_phase → run_validate_phase를 순서대로
+    호출하는 것과 같은 결과를 한 번의 호출로 얻을 수 있습니다.
+    
+    Args:
+        max_concurrent: 최대 동시 실행 수 (모든 단계 합산, 기본: 스로틀링/지연에 따라 자동 조절)
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간(초) (기본: 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (기본: 제한 없음)
+    
+    Returns:
+        dict: 단계별 실행 결과 요약
+    """
+    manager = get_task_manager()
+    
+    if not manager.target_lang:
+        yield {"error": "워크플로우가 초기화되지 않았습니다. initialize_workflow를 먼저 호출하세요."}
+        return
+    
+    if not manager.get_ready_tasks(None, limit=1):
+        overall = manager.get_progress()
+        yield {
+            "message": "실행 가능한 태스크가 없습니다. 실패한 태스크가 있으면 retry_failed_tasks를 호출하세요.",
+            "overall": overall.to_dict(),
+        }
+        return
+    
+    execution = PhaseExecution()
+    stream = _stream_execution(
+        manager,
+        lambda on_result: execute_pipeline_async(
+            manager,
+            max_in_flight=max_concurrent or ASYNC_MAX_IN_FLIGHT,
+            max_duration_seconds=max_duration_seconds,
+            max_tasks=max_tasks,
+            on_result=on_result,
+        ),
+    )
+    async for event in stream:
+        if isinstance(event, PhaseExecution):
+            execution = event
+        else:
+            yield event
+    
+    # 단계별 결과 분리 후 각각 요약
+    task_types = {
+        "translate": TaskType.TRANSLATE,
+        "review": TaskType.REVIEW,
+        "validate": TaskType.VALIDATE,
+    }
+    phases = {}
+    for phase, task_type in task_types.items():
+        phase_execution = PhaseExecution(
+            results=[
+                r for r in execution.results
+                if manager.get_task(r.task_id).type == task_type
+            ],
+            stopped_reason=execution.stopped_reason,
+            elapsed_seconds=execution.elapsed_seconds,
+        )
         
-        for task in ready_tasks:
-            manager.mark_in_progress(task.id)
-            
-            target_path = task.file_path.replace(f".{source_lang}.md", f".{target_lang}.md")
-            
-            future = executor.submit(
-                validate_single_file,
-                task.file_path,
-                target_path,
-                target_lang,
-                source_lang
-            )
-            futures[future] = task.id
+        report_path = None
+        if phase_execution.results and task_type == TaskType.REVIEW:
+            report_content = _generate_review_report(manager, phase_execution.results)
+            report_path = _save_report(manager, report_content, "review_report.md")
+        elif phase_execution.results and task_type == TaskType.VALIDATE:
+            report_content = _generate_validate_report(manager, phase_execution.results)
+            report_path = _save_report(manager, report_content, "validate_report.md")
         
-        for future in as_completed(futures):
-            task_id = futures[future]
-            result = future.result()
-            result.task_id = task_id
-            manager.complete_task(result)
-            results.append(result)
+        phase_summary = _summarize_execution(manager, task_type, phase_execution, report_path)
+        del phase_summary["elapsed_seconds"], phase_summary["stopped_reason"], phase_summary["concurrency_limit"]
+        phases[phase] = phase_summary
     
-    progress = manager.get_phase_progress(TaskType.VALIDATE)
-    
-    # 리포트 생성 (단계 완료 또는 결과가 있을 때)
-    report_path = None
-    if results:
-        report_content = _generate_validate_report(manager, results)
-        report_path = _save_report(manager, report_content, "validate_report.md")
+    overall = manager.get_progress()
     
-    return {
-        "executed": len(results),
-        "succeeded": sum(1 for r in results if r.success),
-        "failed": sum(1 for r in results if not r.success),
-        "phase_progress": progress.to_dict(),
-        "results": [r.to_dict() for r in results],
-        "report_path": report_path,
+    yield {
+        "executed": len(execution.results),
+        "succeeded": execution.succeeded,
+        "failed": execution.failed,
+        "elapsed_seconds": execution.elapsed_seconds,
+        "stopped_reason": execution.stopped_reason,
+        "concurrency_limit": get_concurrency_controller().limit,
+        "overall": overall.to_dict(),
+        "phases": phases,
     }
 
 
@@ -547,6 +707,8 @@ def get_workflow_status() -> dict:
         },
         "is_complete": overall.is_complete,
         "has_failures": overall.has_failures,
+        "concurrency": get_concurrency_controller().snapshot(),
+        "rate_limits": get_rate_limit_status(),
     }
 
 
@@ -651,7 +813,7 @@ def check_phase_completion(phase: str) -> dict:
         if progress.has_failures:
             result["next_action"] = f"retry_failed_tasks('{phase}')로 실패한 태스크를 재시도하거나, run_{phase}_phase를 다시 호출하세요."
         else:
-            result["next_action"] = f"run_{phase}_phase를 호출하여 남은 태스크를 처리하세요."
+            result["next_action"] = f"run_{phase}_phase 또는 run_pipeline을 호출하여 남은 태스크를 처리하세요."
     
     return result
 
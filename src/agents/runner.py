@@ -0,0 +1,194 @@
+# Headless 파이프라인 실행기
+# LLM Orchestrator 없이 분석 → 번역 → 검토 → 검증을 정해진 순서로 실행 (야간 배치용)
+
+import asyncio
+import os
+import time
+from typing import Callable, List, Optional
+
+from agents.orchestrator import (
+    _add_translation_to_gitignore,
+    _generate_review_report,
+    _generate_validate_report,
+    _save_report,
+)
+from agents.scheduler import execute_pipeline, execute_pipeline_async, PhaseExecution, ASYNC_MAX_IN_FLIGHT
+from model.concurrency import get_concurrency_controller
+from task_manager.manager import get_task_manager
+from task_manager.types import TaskResult, TaskType
+from tools.file_tools import list_workshop_files
+
+# 종료 코드
+EXIT_OK = 0            # 모든 태스크 완료
+EXIT_FAILED = 1        # 실패한 태스크 있음
+EXIT_ERROR = 2         # 실행 불가 (경로/파일/인자 오류)
+EXIT_INTERRUPTED = 130  # Ctrl+C
+
+# 실행 엔진
+ENGINE_THREAD = "thread"  # ThreadPoolExecutor sliding window
+ENGINE_ASYNC = "async"    # asyncio 이벤트 루프 (많은 태스크를 적은 스레드로)
+
+TASK_TYPE_NAMES = {
+    TaskType.TRANSLATE: "translate",
+    TaskType.REVIEW: "review",
+    TaskType.VALIDATE: "validate",
+}
+
+
+def run_headless(
+    workshop_path: str,
+    languages: List[str],
+    source_lang: Optional[str] = None,
+    max_concurrent: Optional[int] = None,
+    retries: int = 1,
+    force_reset: bool = False,
+    engine: str = ENGINE_THREAD,
+    log: Callable[[str], None] = print,
+) -> int:
+    """
+    Workshop 번역 파이프라인을 대화 없이 끝까지 실행합니다.
+
+    상태 전이:
+    1. 분석: list_workshop_files로 소스 언어와 대상 파일 결정
+    2. 언어별 초기화: TaskManager.initialize (저널 재개/해시 무효화/중단된 태스크 복구 포함)
+    3. 파이프라인: execute_pipeline으로 번역/검토/검증을 의존성 순서대로 실행
+    4. 재시도: 실패 태스크를 retries회까지 리셋 후 3단계 반복
+    5. 리포트: review_report.md, validate_report.md 저장
+
+    Args:
+        workshop_path: Workshop 디렉토리 경로
+        languages: 타겟 언어 코드 목록 (순서대로 실행)
+        source_lang: 소스 언어 코드 (None이면 자동 감지)
+        max_concurrent: 동시 실행 워커 수 상한 (None이면 동시성 제어기 한도, async 엔진은 ASYNC_MAX_IN_FLIGHT)
+        retries: 실패 태스크 재시도 라운드 수
+        force_reset: True면 기존 tasks.md 무시하고 새로 시작
+        engine: 실행 엔진 (ENGINE_THREAD 또는 ENGINE_ASYNC)
+        log: 진행 상황 출력 함수
+
+    Returns:
+        int: 종료 코드 (EXIT_*)
+    """
+    workshop_path = os.path.abspath(os.path.expanduser(workshop_path))
+    if not os.path.isdir(workshop_path):
+        log(f"Error: workshop path not found: {workshop_path}")
+        return EXIT_ERROR
+
+    detected_lang, files = list_workshop_files(workshop_path, source_lang)
+    if detected_lang in ("none", "unknown") or not files:
+        log(f"Error: no source files found in {workshop_path} (detected language: {detected_lang})")
+        return EXIT_ERROR
+
+    languages = [lang for lang in languages if lang != detected_lang]
+    if not languages:
+        log(f"Error: no target language other than the source language ({detected_lang})")
+        return EXIT_ERROR
+
+    log(f"Workshop: {workshop_path}")
+    log(f"Source: {detected_lang} ({len(files)} files) → Targets: {', '.join(languages)}")
+    if _add_translation_to_gitignore(workshop_path):
+        log("Added translation/ to .gitignore")
+
+    exit_code = EXIT_OK
+    try:
+        for lang in languages:
+            if _run_language(
+                workshop_path, lang, detected_lang, files, max_concurrent, retries, force_reset, engine, log
+            ):
+                exit_code = EXIT_FAILED
+    except KeyboardInterrupt:
+        log("\nInterrupted. Progress is saved in translation/tasks.md; run again to resume.")
+        return EXIT_INTERRUPTED
+
+    return exit_code
+
+
+def _run_language(
+    workshop_path: str,
+    target_lang: str,
+    source_lang: str,
+    files: List[str],
+    max_concurrent: Optional[int],
+    retries: int,
+    force_reset: bool,
+    engine: str,
+    log: Callable[[str], None],
+) -> bool:
+    """
+    타겟 언어 하나의 파이프라인 실행 (내부 함수)
+
+    Returns:
+        bool: 실패한 태스크가 남았으면 True
+    """
+    # workshop 경로를 세션 키로 사용 (한 프로세스에서 여러 workshop을 동시에 실행 가능)
+    manager = get_task_manager(workshop_path)
+    manager.initialize(workshop_path, target_lang, files, force_reset=force_reset, source_lang=source_lang)
+
+    progress = manager.get_progress()
+    log(f"\n[{target_lang}] {progress.completed}/{progress.total} tasks already completed")
+    if manager.invalidated_files:
+        log(f"[{target_lang}] {len(manager.invalidated_files)} files changed since last run")
+
+    started = time.monotonic()
+
+    def report(result: TaskResult):
+        task = manager.get_task(result.task_id)
+        done = manager.get_progress()
+        mark = "✓" if result.success else "✗"
+        path = os.path.relpath(task.file_path, workshop_path)
+        line = f"[{target_lang}] {done.completed}/{done.total} {mark} {TASK_TYPE_NAMES[task.type]:<9} {path}"
+        if not result.success:
+            line += f" - {str(result.error or '-')[:120]}"
+        log(line)
+
+    for round_index in range(retries + 1):
+        if round_index > 0:
+            failed = manager.get_failed_tasks()
+            if not failed:
+                break
+            for task in failed:
+                manager.reset_for_retry(task.id)
+            log(f"[{target_lang}] Retrying {len(failed)} failed tasks (round {round_index}/{retries})")
+
+        if engine == ENGINE_ASYNC:
+            asyncio.run(_execute_pipeline_async(manager, max_concurrent, source_lang, report))
+        else:
+            execute_pipeline(
+                manager,
+                max_concurrent=max_concurrent,
+                source_lang=source_lang,
+                on_result=report,
+            )
+
+    # 태스크별 마지막 결과 기준으로 리포트 생성 (이전 실행에서 완료되어 복원된 결과 포함)
+    review_results = manager.get_results(TaskType.REVIEW)
+    validate_results = manager.get_results(TaskType.VALIDATE)
+    if review_results:
+        path = _save_report(manager, _generate_review_report(manager, review_results), "review_report.md")
+        log(f"[{target_lang}] Review report: {path}")
+    if validate_results:
+        path = _save_report(manager, _generate_validate_report(manager, validate_results), "validate_report.md")
+        log(f"[{target_lang}] Validate report: {path}")
+
+    progress = manager.get_progress()
+    elapsed = round(time.monotonic() - started, 1)
+    log(
+        f"[{target_lang}] Done in {elapsed}s: {progress.completed}/{progress.total} completed, "
+        f"{progress.failed} failed, {progress.not_started} not started "
+        f"(concurrency limit {get_concurrency_controller().limit})"
+    )
+    return not progress.is_complete
+
+
+async def _execute_pipeline_async(
+    manager,
+    max_in_flight: Optional[int],
+    source_lang: str,
+    on_result: Callable[[TaskResult], None],
+) -> PhaseExecution:
+    """이벤트 루프에서 파이프라인 실행 (내부 함수)"""
+    return await execute_pipeline_async(
+        manager,
+        max_in_flight=max_in_flight or ASYNC_MAX_IN_FLIGHT,
+        source_lang=source_lang,
+        on_result=on_result,
+    )
@@ -0,0 +1,529 @@
+# Phase 실행기 - Sliding window 방식 태스크 실행
+# 배치 단위로 끊지 않고, 워커 슬롯이 비는 즉시 다음 태스크를 채워 넣음
+
+import asyncio
+import os
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from model.concurrency import get_concurrency_controller
+from model.load import configure_model_concurrency
+from task_manager.types import Task, TaskType, TaskResult
+from tools.file_tools import get_target_path
+from agents.workers.translator_worker import (
+    translate_single_file,
+    translate_files_packed,
+    translate_single_file_async,
+    translate_files_packed_async,
+    is_packable,
+    commit_translation,
+    PACK_MAX_FILES,
+)
+from agents.workers.reviewer_worker import review_single_file, review_single_file_async
+from agents.workers.validator_worker import validate_single_file, validate_single_file_async
+
+
+# 중단 사유
+STOP_QUEUE_EMPTY = "queue_empty"   # 실행 가능한 태스크 소진
+STOP_TIME_LIMIT = "time_limit"     # 시간 제한 도달
+STOP_TASK_LIMIT = "task_limit"     # 태스크 수 제한 도달
+
+# 비동기 실행 시 동시에 진행할 최대 태스크 수
+# (실제 모델 요청 수는 공유 동시성 제어기와 속도 제한기가 따로 제한)
+ASYNC_MAX_IN_FLIGHT = int(os.getenv("WSTRANSLATOR_ASYNC_MAX_IN_FLIGHT", "256"))
+
+# 이벤트 루프 기본 executor의 여유 스레드 수 (모델 스트림 외 동기 도구/파일 작업용)
+LOOP_EXECUTOR_HEADROOM = int(os.getenv("WSTRANSLATOR_LOOP_EXECUTOR_HEADROOM", "8"))
+
+# 기본 executor를 교체한 이벤트 루프 (루프당 한 번만 교체)
+_configured_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
+
+@dataclass
+class PhaseExecution:
+    """Phase 실행 결과 (한 번의 도구 호출 단위)"""
+    results: List[TaskResult] = field(default_factory=list)
+    stopped_reason: str = STOP_QUEUE_EMPTY
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if not r.success)
+
+
+def run_task(
+    task: Task,
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None
+) -> TaskResult:
+    """
+    태스크 유형에 맞는 Stateless 워커 실행
+
+    워커 스레드에서 호출되며 TaskManager에 접근하지 않음
+    검증을 통과한 번역은 번역 메모리/스냅샷에 확정 (검토/검증 전의 번역은 재사용하지 않음)
+    """
+    if task.type == TaskType.TRANSLATE:
+        return translate_single_file(task.file_path, target_lang, source_lang, workshop_path, _is_fresh(task))
+
+    target_path = get_target_path(task.file_path, target_lang, source_lang)
+    if task.type == TaskType.REVIEW:
+        return review_single_file(task.file_path, target_path, target_lang, source_lang)
+    result = validate_single_file(task.file_path, target_path, target_lang, source_lang)
+    return _commit_validated(result, task, target_lang, source_lang, workshop_path)
+
+
+def run_task_pack(
+    tasks: List[Task],
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None
+) -> List[TaskResult]:
+    """작은 번역 태스크 묶음을 한 요청으로 실행 (tasks 순서대로 결과 반환)"""
+    return translate_files_packed(
+        [task.file_path for task in tasks], target_lang, source_lang, workshop_path,
+        any(_is_fresh(task) for task in tasks),
+    )
+
+
+async def run_task_async(
+    task: Task,
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None
+) -> TaskResult:
+    """run_task의 비동기 버전"""
+    if task.type == TaskType.TRANSLATE:
+        return await translate_single_file_async(
+            task.file_path, target_lang, source_lang, workshop_path, _is_fresh(task)
+        )
+
+    target_path = get_target_path(task.file_path, target_lang, source_lang)
+    if task.type == TaskType.REVIEW:
+        return await review_single_file_async(task.file_path, target_path, target_lang, source_lang)
+    result = await validate_single_file_async(task.file_path, target_path, target_lang, source_lang)
+    return await asyncio.to_thread(_commit_validated, result, task, target_lang, source_lang, workshop_path)
+
+
+async def run_task_pack_async(
+    tasks: List[Task],
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None
+) -> List[TaskResult]:
+    """run_task_pack의 비동기 버전"""
+    return await translate_files_packed_async(
+        [task.file_path for task in tasks], target_lang, source_lang, workshop_path,
+        any(_is_fresh(task) for task in tasks),
+    )
+
+
+def _is_fresh(task: Task) -> bool:
+    """번역 메모리/이전 번역 없이 새로 번역할 태스크인지 (force_reset 또는 재시도, 내부 함수)"""
+    return task.fresh or task.retry_count > 0
+
+
+def _commit_validated(
+    result: TaskResult,
+    task: Task,
+    target_lang: str,
+    source_lang: str,
+    workshop_path: Optional[str]
+) -> TaskResult:
+    """검증을 통과한 번역을 확정 (실패해도 검증 결과는 유지하고 경고만 기록, 내부 함수)"""
+    if not result.success or not workshop_path:
+        return result
+    try:
+        commit_translation(workshop_path, task.file_path, target_lang, source_lang)
+    except Exception as e:
+        result.metadata = {**(result.metadata or {}), "commit_error": str(e)}
+    return result
+
+
+def execute_phase(
+    manager,
+    task_type: TaskType,
+    max_concurrent: Optional[int] = None,
+    max_duration_seconds: Optional[float] = None,
+    max_tasks: Optional[int] = None,
+    source_lang: str = "en",
+    worker: Callable[[Task, str, str, Optional[str]], TaskResult] = run_task,
+    pack_worker: Optional[Callable[[List[Task], str, str, Optional[str]], List[TaskResult]]] = run_task_pack,
+    on_result: Optional[Callable[[TaskResult], None]] = None,
+) -> PhaseExecution:
+    """
+    실행 가능한 태스크가 소진될 때까지 워커 슬롯을 계속 채워서 실행
+
+    배치 방식과 달리 가장 느린 파일을 기다리지 않고, 하나가 끝나면 즉시
+    다음 태스크를 투입합니다. TaskManager 상태 변경은 모두 호출 스레드에서만 수행합니다.
+
+    Args:
+        manager: TaskManager 인스턴스
+        task_type: 실행할 태스크 유형
+        max_concurrent: 동시 실행 워커 수 상한 (None이면 공유 동시성 제어기 한도를 따름)
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간 (None이면 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (None이면 제한 없음)
+        source_lang: 소스 언어 코드
+        worker: 태스크 실행 함수 (task, target_lang, source_lang, workshop_path) → TaskResult
+        pack_worker: 작은 번역 태스크 묶음 실행 함수 (None이면 묶지 않고 하나씩 실행)
+        on_result: 태스크 결과가 반영될 때마다 호출되는 함수 (진행 상황 출력용)
+
+    Returns:
+        PhaseExecution: 실행 결과 목록과 중단 사유
+    """
+    return _run_sliding_window(
+        manager,
+        lambda limit: manager.get_ready_tasks(task_type, limit=limit),
+        max_concurrent, max_duration_seconds, max_tasks, source_lang, worker, pack_worker, on_result,
+    )
+
+
+def execute_pipeline(
+    manager,
+    max_concurrent: Optional[int] = None,
+    max_duration_seconds: Optional[float] = None,
+    max_tasks: Optional[int] = None,
+    source_lang: str = "en",
+    worker: Callable[[Task, str, str, Optional[str]], TaskResult] = run_task,
+    pack_worker: Optional[Callable[[List[Task], str, str, Optional[str]], List[TaskResult]]] = run_task_pack,
+    on_result: Optional[Callable[[TaskResult], None]] = None,
+) -> PhaseExecution:
+    """
+    의존성 기반 파이프라인 실행 (번역 → 검토 → 검증을 파일별로 연속 진행)
+
+    Phase 경계 없이 TaskManager의 depends_on만 따라갑니다. 어떤 파일의 번역이
+    끝나면 그 파일의 검토가 즉시 ready가 되어 다른 파일의 번역과 동시에 실행되므로,
+    전체 소요 시간은 세 Phase 소요 시간의 합이 아니라 가장 느린 파일의 체인에 수렴합니다.
+
+    Args:
+        manager: TaskManager 인스턴스
+        max_concurrent: 동시 실행 워커 수 상한, 모든 유형 합산 (None이면 공유 동시성 제어기 한도를 따름)
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간 (None이면 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (None이면 제한 없음)
+        source_lang: 소스 언어 코드
+        worker: 태스크 실행 함수 (task, target_lang, source_lang, workshop_path) → TaskResult
+        pack_worker: 작은 번역 태스크 묶음 실행 함수 (None이면 묶지 않고 하나씩 실행)
+        on_result: 태스크 결과가 반영될 때마다 호출되는 함수 (진행 상황 출력용)
+
+    Returns:
+        PhaseExecution: 모든 유형의 실행 결과 목록과 중단 사유
+    """
+    return _run_sliding_window(
+        manager,
+        lambda limit: manager.get_ready_tasks(None, limit=limit),
+        max_concurrent, max_duration_seconds, max_tasks, source_lang, worker, pack_worker, on_result,
+    )
+
+
+def _run_sliding_window(
+    manager,
+    fetch_ready: Callable[[int], List[Task]],
+    max_concurrent: Optional[int],
+    max_duration_seconds: Optional[float],
+    max_tasks: Optional[int],
+    source_lang: str,
+    worker: Callable[[Task, str, str, Optional[str]], TaskResult],
+    pack_worker: Optional[Callable[[List[Task], str, str, Optional[str]], List[TaskResult]]],
+    on_result: Optional[Callable[[TaskResult], None]] = None,
+) -> PhaseExecution:
+    """
+    Sliding window 실행 루프 (내부 함수)
+
+    완료된 태스크가 생길 때마다 fetch_ready로 다시 조회하므로,
+    방금 완료된 태스크에 의존하던 후속 태스크도 같은 루프에서 바로 투입됩니다.
+    pack_worker가 있으면 작은 번역 태스크 여러 개를 하나의 슬롯(요청)으로 묶습니다.
+    슬롯 수는 매 반복마다 공유 동시성 제어기의 현재 한도(AIMD)로 다시 계산합니다.
+    """
+    target_lang = manager.target_lang
+    workshop_path = manager.workshop_path
+    execution = PhaseExecution()
+    started = time.monotonic()
+    submitted = 0
+    packable_cache: Dict[str, bool] = {}
+
+    controller = get_concurrency_controller()
+    max_workers = max_concurrent or controller.max_limit
+
+    # 모델 호출은 제어기 한도 이하로 유지되므로 연결 풀도 상한만큼 확보
+    configure_model_concurrency(controller.max_limit)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict = {}
+
+            while True:
+                # 빈 슬롯 보충 (제한에 걸리면 새 투입 중단, 실행 중인 것은 마저 수집)
+                if execution.stopped_reason == STOP_QUEUE_EMPTY:
+                    if max_duration_seconds is not None and time.monotonic() - started >= max_duration_seconds:
+                        execution.stopped_reason = STOP_TIME_LIMIT
+                    elif max_tasks is not None and submitted >= max_tasks:
+                        execution.stopped_reason = STOP_TASK_LIMIT
+
+                if execution.stopped_reason == STOP_QUEUE_EMPTY:
+                    free_slots = min(max_workers, controller.limit) - len(futures)
+                    if free_slots > 0:
+                        # 묶음 구성을 위해 슬롯 수보다 많이 조회 (투입하지 않은 태스크는 NOT_STARTED 유지)
+                        fetch_limit = free_slots * PACK_MAX_FILES if pack_worker else free_slots
+                        if max_tasks is not None:
+                            fetch_limit = min(fetch_limit, max_tasks - submitted)
+
+                        units = _build_units(fetch_ready(fetch_limit), pack_worker is not None, packable_cache)
+                        for unit in units[:free_slots]:
+                            for task in unit:
+                                manager.mark_in_progress(task.id)
+                            if len(unit) == 1:
+                                future = executor.submit(worker, unit[0], target_lang, source_lang, workshop_path)
+                            else:
+                                future = executor.submit(pack_worker, unit, target_lang, source_lang, workshop_path)
+                            futures[future] = [task.id for task in unit]
+                            submitted += len(unit)
+
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_ids = futures.pop(future)
+                    try:
+                        results = future.result()
+                        if isinstance(results, TaskResult):
+                            results = [results]
+                    except Exception as e:
+                        # 워커는 예외를 TaskResult로 감싸지만, 방어적으로 처리
+                        results = [TaskResult(task_id=task_id, success=False, error=str(e)) for task_id in task_ids]
+
+                    for task_id, result in zip(task_ids, _match_results(task_ids, results)):
+                        result.task_id = task_id
+
+                        # Orchestrator가 중앙에서 상태 업데이트
+                        manager.complete_task(result)
+                        execution.results.append(result)
+                        if on_result:
+                            on_result(result)
+    finally:
+        # 미뤄둔 tasks.md 갱신과 저널 fsync
+        manager.flush()
+
+    execution.elapsed_seconds = round(time.monotonic() - started, 1)
+    return execution
+
+
+def _match_results(task_ids: List[str], results: List[TaskResult]) -> List[TaskResult]:
+    """
+    실행 단위의 태스크 수에 맞춘 결과 목록 (내부 함수)
+
+    묶음 워커가 태스크보다 적은 결과를 반환하면 남은 태스크는 실패로 채워,
+    IN_PROGRESS 상태로 남지 않게 합니다. 남는 결과는 버립니다.
+    """
+    if len(results) >= len(task_ids):
+        return list(results[:len(task_ids)])
+    missing = [
+        TaskResult(
+            task_id=task_id,
+            success=False,
+            error=f"워커가 결과를 반환하지 않았습니다 (결과 {len(results)}개, 태스크 {len(task_ids)}개)",
+        )
+        for task_id in task_ids[len(results):]
+    ]
+    return list(results) + missing
+
+
+def _build_units(
+    tasks: List[Task],
+    pack_small_files: bool,
+    packable_cache: Dict[str, bool]
+) -> List[List[Task]]:
+    """
+    조회된 태스크를 실행 단위로 묶음 (내부 함수)
+
+    작은 파일의 번역 태스크는 PACK_MAX_FILES개씩 하나의 단위로 묶고,
+    나머지는 태스크 하나가 하나의 단위입니다. 조회 순서(우선순위)를 최대한 유지합니다.
+    """
+    units: List[List[Task]] = []
+    pack: List[Task] = []
+
+    for task in tasks:
+        if pack_small_files and task.type == TaskType.TRANSLATE:
+            if task.file_path not in packable_cache:
+                packable_cache[task.file_path] = is_packable(task.file_path)
+            if packable_cache[task.file_path]:
+                if not pack:
+                    units.append(pack)
+                pack.append(task)
+                if len(pack) >= PACK_MAX_FILES:
+                    pack = []
+                continue
+        units.append([task])
+
+    return [unit for unit in units if unit]
+
+
+def configure_loop_executor(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """
+    이벤트 루프의 기본 executor를 모델 동시성 상한에 맞게 교체 (루프당 한 번)
+
+    BedrockModel.stream과 asyncio.to_thread는 기본 executor 스레드에서 boto3 응답을 읽습니다.
+    기본 크기(CPU 수 + 4)로는 작은 컨테이너에서 한 세션의 요청만으로 스레드가 모두 차서
+    같은 루프를 쓰는 다른 세션의 호출이 뒤에 줄을 서게 됩니다.
+    """
+    loop = loop or asyncio.get_running_loop()
+    if loop in _configured_loops:
+        return
+    loop.set_default_executor(ThreadPoolExecutor(
+        max_workers=get_concurrency_controller().max_limit + LOOP_EXECUTOR_HEADROOM,
+        thread_name_prefix="wstranslator-io",
+    ))
+    _configured_loops.add(loop)
+
+
+async def execute_phase_async(
+    manager,
+    task_type: TaskType,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    max_duration_seconds: Optional[float] = None,
+    max_tasks: Optional[int] = None,
+    source_lang: str = "en",
+    worker: Callable[[Task, str, str, Optional[str]], Awaitable[TaskResult]] = run_task_async,
+    pack_worker: Optional[Callable[[List[Task], str, str, Optional[str]], Awaitable[List[TaskResult]]]] = run_task_pack_async,
+    on_result: Optional[Callable[[TaskResult], None]] = None,
+) -> PhaseExecution:
+    """
+    execute_phase의 비동기 버전
+
+    워커 스레드 대신 하나의 이벤트 루프에서 코루틴으로 실행하므로 수백 개의 태스크를
+    동시에 진행할 수 있습니다. 대기 중인 태스크는 스레드를 점유하지 않고,
+    실제 모델 요청 수는 공유 동시성 제어기(AIMD)와 모델별 속도 제한기가 제한합니다.
+
+    Args:
+        manager: TaskManager 인스턴스
+        task_type: 실행할 태스크 유형
+        max_in_flight: 동시에 진행할 최대 태스크 수
+        max_duration_seconds: 새 태스크 투입을 멈출 경과 시간 (None이면 제한 없음)
+        max_tasks: 이번 호출에서 실행할 최대 태스크 수 (None이면 제한 없음)
+        source_lang: 소스 언어 코드
+        worker: 태스크 실행 코루틴 함수
+        pack_worker: 작은 번역 태스크 묶음 실행 코루틴 함수 (None이면 묶지 않음)
+        on_result: 태스크 결과가 반영될 때마다 호출되는 함수
+
+    Returns:
+        PhaseExecution: 실행 결과 목록과 중단 사유
+    """
+    return await _run_async_window(
+        manager,
+        lambda limit: manager.get_ready_tasks(task_type, limit=limit),
+        max_in_flight, max_duration_seconds, max_tasks, source_lang, worker, pack_worker, on_result,
+    )
+
+
+async def execute_pipeline_async(
+    manager,
+    max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+    max_duration_seconds: Optional[float] = None,
+    max_tasks: Optional[int] = None,
+    source_lang: str = "en",
+    worker: Callable[[Task, str, str, Optional[str]], Awaitable[TaskResult]] = run_task_async,
+    pack_worker: Optional[Callable[[List[Task], str, str, Optional[str]], Awaitable[List[TaskResult]]]] = run_task_pack_async,
+    on_result: Optional[Callable[[TaskResult], None]] = None,
+) -> PhaseExecution:
+    """execute_pipeline의 비동기 버전 (의존성 순서는 동기 버전과 동일)"""
+    return await _run_async_window(
+        manager,
+        lambda limit: manager.get_ready_tasks(None, limit=limit),
+        max_in_flight, max_duration_seconds, max_tasks, source_lang, worker, pack_worker, on_result,
+    )
+
+
+async def _run_async_window(
+    manager,
+    fetch_ready: Callable[[int], List[Task]],
+    max_in_flight: int,
+    max_duration_seconds: Optional[float],
+    max_tasks: Optional[int],
+    source_lang: str,
+    worker: Callable[[Task, str, str, Optional[str]], Awaitable[TaskResult]],
+    pack_worker: Optional[Callable[[List[Task], str, str, Optional[str]], Awaitable[List[TaskResult]]]],
+    on_result: Optional[Callable[[TaskResult], None]] = None,
+) -> PhaseExecution:
+    """
+    비동기 sliding window 실행 루프 (내부 함수)
+
+    _run_sliding_window와 같은 규칙으로 태스크를 채우고 결과를 반영합니다.
+    TaskManager 상태 변경은 이벤트 루프 스레드에서만 수행됩니다.
+    """
+    target_lang = manager.target_lang
+    workshop_path = manager.workshop_path
+    execution = PhaseExecution()
+    started = time.monotonic()
+    submitted = 0
+    packable_cache: Dict[str, bool] = {}
+    running: Dict[asyncio.Task, List[str]] = {}
+
+    configure_model_concurrency(get_concurrency_controller().max_limit)
+    configure_loop_executor()
+
+    try:
+        while True:
+            if execution.stopped_reason == STOP_QUEUE_EMPTY:
+                if max_duration_seconds is not None and time.monotonic() - started >= max_duration_seconds:
+                    execution.stopped_reason = STOP_TIME_LIMIT
+                elif max_tasks is not None and submitted >= max_tasks:
+                    execution.stopped_reason = STOP_TASK_LIMIT
+
+            if execution.stopped_reason == STOP_QUEUE_EMPTY:
+                free_slots = max_in_flight - len(running)
+                if free_slots > 0:
+                    fetch_limit = free_slots * PACK_MAX_FILES if pack_worker else free_slots
+                    if max_tasks is not None:
+                        fetch_limit = min(fetch_limit, max_tasks - submitted)
+
+                    units = _build_units(fetch_ready(fetch_limit), pack_worker is not None, packable_cache)
+                    for unit in units[:free_slots]:
+                        for task in unit:
+                            manager.mark_in_progress(task.id)
+                        if len(unit) == 1:
+                            coroutine = worker(unit[0], target_lang, source_lang, workshop_path)
+                        else:
+                            coroutine = pack_worker(unit, target_lang, source_lang, workshop_path)
+                        running[asyncio.ensure_future(coroutine)] = [task.id for task in unit]
+                        submitted += len(unit)
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                task_ids = running.pop(future)
+                try:
+                    results = future.result()
+                    if isinstance(results, TaskResult):
+                        results = [results]
+                except Exception as e:
+                    results = [TaskResult(task_id=task_id, success=False, error=str(e)) for task_id in task_ids]
+
+                for task_id, result in zip(task_ids, _match_results(task_ids, results)):
+                    result.task_id = task_id
+                    manager.complete_task(result)
+                    execution.results.append(result)
+                    if on_result:
+                        on_result(result)
+    except BaseException:
+        # 취소(Ctrl+C, 클라이언트 연결 끊김 등) 시 진행 중인 코루틴을 취소하고
+        # 태스크를 대기 상태로 되돌려 다음 실행에서 다시 가져가게 함
+        for future, task_ids in running.items():
+            future.cancel()
+            for task_id in task_ids:
+                manager.mark_not_started(task_id)
+        running.clear()
+        raise
+    finally:
+        manager.flush()
+
+    execution.elapsed_seconds = round(time.monotonic() - started, 1)
+    return execution
@@ -1,12 +1,22 @@
 # Stateless 워커 모듈
 # Sub-agent는 결과만 반환, 상태 파일 직접 수정 안 함
 
-from .translator_worker import translate_single_file
-from .reviewer_worker import review_single_file
-from .validator_worker import validate_single_file
+from .translator_worker import (
+    translate_single_file,
+    translate_files_packed,
+    translate_single_file_async,
+    translate_files_packed_async,
+)
+from .reviewer_worker import review_single_file, review_single_file_async
+from .validator_worker import validate_single_file, validate_single_file_async
 
 __all__ = [
     "translate_single_file",
+    "translate_files_packed",
+    "translate_single_file_async",
+    "translate_files_packed_async",
     "review_single_file", 
+    "review_single_file_async",
     "validate_single_file",
+    "validate_single_file_async",
 ]
@@ -2,11 +2,14 @@
 # 결과만 반환, tasks.md 직접 수정 안 함
 # AWS Documentation MCP 연동으로 공식 용어 검증
 
+import asyncio
 import re
 from strands import Agent
 from strands_tools import file_read, file_write
 
-from model.load import load_sonnet
+from model.invoke import invoke_agent, invoke_agent_async
+from model.load import load_worker_model
+from model.retry import classify_error
 from prompts.system_prompts import REVIEWER_PROMPT
 from task_manager.types import TaskResult
 from tools.file_tools import read_workshop_file
@@ -39,62 +42,14 @@ def review_single_file(
         TaskResult: 검토 결과 (성공/실패, 점수, 피드백)
     """
     try:
-        # 파일 읽기
-        source_content = read_workshop_file(source_path)
-        target_content = read_workshop_file(target_path)
-        
-        if not source_content:
-            return TaskResult(
-                task_id="",
-                success=False,
-                error=f"원본 파일을 읽을 수 없습니다: {source_path}"
-            )
-        
-        if not target_content:
-            return TaskResult(
-                task_id="",
-                success=False,
-                error=f"번역 파일을 읽을 수 없습니다: {target_path}"
-            )
-        
-        # 언어 이름 매핑
-        lang_names = {
-            "ko": "한국어",
-            "ja": "일본어",
-            "zh": "중국어 간체",
-            "es": "스페인어",
-            "pt": "포르투갈어",
-            "fr": "프랑스어",
-            "de": "독일어",
-            "en": "영어",
-        }
-        target_lang_name = lang_names.get(target_lang, target_lang)
-        
-        # 도구 목록 구성
-        tools = [file_read, file_write]
-        mcp_client = None
-        
-        # AWS Documentation MCP 연동
-        if use_aws_docs:
-            try:
-                mcp_client = get_aws_docs_tools()
-                tools.append(mcp_client)
-            except Exception as e:
-                # MCP 연결 실패 시 기본 도구만 사용
-                print(f"AWS Documentation MCP 연결 실패, 기본 모드로 진행: {e}")
-                mcp_client = None
-        
-        # 검토 프롬프트 (MCP 사용 시 추가 지침)
-        aws_docs_instruction = ""
-        if mcp_client:
-            aws_docs_instruction = """
-## AWS 공식 문서 검증 (중요!)
-- `search_documentation` 도구로 AWS 서비스 용어의 공식 한국어 번역을 확인하세요
-- 특히 다음 용어들의 공식 번역을 검증하세요:
-  - Amazon SES 관련: Configuration Set, Suppression List, Dedicated IP 등
-  - 일반 AWS 용어: SNS topic, CloudWatch, Lambda 등
-- 공식 문서와 다른 번역이 있으면 issues에 명시하세요
-"""
+        prepared = _prepare_review(source_path, target_path, target_lang, use_aws_docs)
+        if isinstance(prepared, TaskResult):
+            return prepared
+        source_content, target_content, target_lang_name, mcp_client, aws_docs_instruction = prepared
+        prompt = _build_review_prompt(
+            source_path, target_path, source_content, target_content,
+            target_lang_name, aws_docs_instruction
+        )
         
         # Reviewer Agent 생성 (Stateless)
         # MCP 클라이언트가 있으면 컨텍스트 매니저로 감싸서 실행
@@ -102,52 +57,170 @@ def review_single_file(
             with mcp_client:
                 mcp_tools = mcp_client.list_tools_sync()
                 agent = Agent(
-                    model=load_sonnet(),
+                    model=load_worker_model("sonnet"),
                     system_prompt=REVIEWER_PROMPT,
                     tools=[file_read, file_write] + mcp_tools,
                 )
-                result = _run_review(
-                    agent, source_path, target_path, source_content, 
-                    target_content, target_lang_name, aws_docs_instruction
-                )
+                response_text = invoke_agent(agent, prompt)
         else:
             agent = Agent(
-                model=load_sonnet(),
+                model=load_worker_model("sonnet"),
                 system_prompt=REVIEWER_PROMPT,
-                tools=tools,
+                tools=[file_read, file_write],
             )
-            result = _run_review(
-                agent, source_path, target_path, source_content,
-                target_content, target_lang_name, aws_docs_instruction
+            response_text = invoke_agent(agent, prompt)
+        
+        return _parse_review(response_text, source_path, target_path)
+        
+    except Exception as e:
+        return _review_error(e, source_path, target_path)
+
+
+async def review_single_file_async(
+    source_path: str,
+    target_path: str,
+    target_lang: str,
+    source_lang: str = "en",
+    use_aws_docs: bool = True
+) -> TaskResult:
+    """
+    review_single_file의 비동기 버전 (Stateless Worker)
+    
+    Agent.invoke_async로 실행하여 검토 중에도 이벤트 루프를 점유하지 않습니다.
+    파일 읽기와 MCP 서버 프로세스 시작/종료(uvx), 도구 목록 조회는 블로킹 호출이므로
+    executor 스레드에서 실행합니다 (같은 루프의 다른 세션이 멈추지 않음).
+    """
+    try:
+        prepared = await asyncio.to_thread(_prepare_review, source_path, target_path, target_lang, use_aws_docs)
+        if isinstance(prepared, TaskResult):
+            return prepared
+        source_content, target_content, target_lang_name, mcp_client, aws_docs_instruction = prepared
+        prompt = _build_review_prompt(
+            source_path, target_path, source_content, target_content,
+            target_lang_name, aws_docs_instruction
+        )
+        
+        if mcp_client:
+            await asyncio.to_thread(mcp_client.start)
+            try:
+                mcp_tools = await asyncio.to_thread(mcp_client.list_tools_sync)
+                agent = Agent(
+                    model=load_worker_model("sonnet"),
+                    system_prompt=REVIEWER_PROMPT,
+                    tools=[file_read, file_write] + mcp_tools,
+                )
+                response_text = await invoke_agent_async(agent, prompt)
+            finally:
+                await asyncio.to_thread(mcp_client.stop, None, None, None)
+        else:
+            agent = Agent(
+                model=load_worker_model("sonnet"),
+                system_prompt=REVIEWER_PROMPT,
+                tools=[file_read, file_write],
             )
+            response_text = await invoke_agent_async(agent, prompt)
         
-        return result
+        return _parse_review(response_text, source_path, target_path)
         
     except Exception as e:
+        return _review_error(e, source_path, target_path)
+
+
+def _review_error(error: Exception, source_path: str, target_path: str) -> TaskResult:
+    """검토 중 예외를 실패 결과로 변환 (내부 함수)"""
+    return TaskResult(
+        task_id="",
+        success=False,
+        error=str(error),
+        metadata={
+            "source_path": source_path,
+            "target_path": target_path,
+            "error_type": classify_error(error),
+        }
+    )
+
+
+def _prepare_review(
+    source_path: str,
+    target_path: str,
+    target_lang: str,
+    use_aws_docs: bool
+):
+    """
+    검토 준비: 파일 읽기, 언어 이름, AWS Documentation MCP 연결 (내부 함수)
+    
+    Returns:
+        실패 시 TaskResult, 성공 시
+        (원본 내용, 번역 내용, 타겟 언어 이름, MCP 클라이언트 또는 None, MCP 추가 지침)
+    """
+    # 파일 읽기
+    source_content = read_workshop_file(source_path)
+    target_content = read_workshop_file(target_path)
+    
+    if not source_content:
         return TaskResult(
             task_id="",
             success=False,
-            error=str(e),
-            metadata={
-                "source_path": source_path,
-                "target_path": target_path,
-            }
+            error=f"원본 파일을 읽을 수 없습니다: {source_path}"
         )
+    
+    if not target_content:
+        return TaskResult(
+            task_id="",
+            success=False,
+            error=f"번역 파일을 읽을 수 없습니다: {target_path}"
+        )
+    
+    # 언어 이름 매핑
+    lang_names = {
+        "ko": "한국어",
+        "ja": "일본어",
+        "zh": "중국어 간체",
+        "es": "스페인어",
+        "pt": "포르투갈어",
+        "fr": "프랑스어",
+        "de": "독일어",
+        "en": "영어",
+    }
+    target_lang_name = lang_names.get(target_lang, target_lang)
+    
+    mcp_client = None
+    
+    # AWS Documentation MCP 연동
+    if use_aws_docs:
+        try:
+            mcp_client = get_aws_docs_tools()
+        except Exception as e:
+            # MCP 연결 실패 시 기본 도구만 사용
+            print(f"AWS Documentation MCP 연결 실패, 기본 모드로 진행: {e}")
+            mcp_client = None
+    
+    # 검토 프롬프트 (MCP 사용 시 추가 지침)
+    aws_docs_instruction = ""
+    if mcp_client:
+        aws_docs_instruction = """
+## AWS 공식 문서 검증 (중요!)
+- `search_documentation` 도구로 AWS 서비스 용어의 공식 한국어 번역을 확인하세요
+- 특히 다음 용어들의 공식 번역을 검증하세요:
+  - Amazon SES 관련: Configuration Set, Suppression List, Dedicated IP 등
+  - 일반 AWS 용어: SNS topic, CloudWatch, Lambda 등
+- 공식 문서와 다른 번역이 있으면 issues에 명시하세요
+"""
+    
+    return source_content, target_content, target_lang_name, mcp_client, aws_docs_instruction
 
 
-def _run_review(
-    agent: Agent,
+def _build_review_prompt(
     source_path: str,
     target_path: str,
     source_content: str,
     target_content: str,
     target_lang_name: str,
     aws_docs_instruction: str = ""
-) -> TaskResult:
-    """검토 실행 (내부 함수)"""
+) -> str:
+    """검토 프롬프트 생성 (내부 함수)"""
     
-    # 검토 프롬프트
-    prompt = f"""다음 AWS Workshop 번역의 품질을 검토해주세요.
+    return f"""다음 AWS Workshop 번역의 품질을 검토해주세요.
 
 ## 파일 정보
 - 원본: {source_path}
@@ -188,9 +261,9 @@ def _run_review(
 <verdict>PASS 또는 FAIL (80점 이상이면 PASS)</verdict>
 </review>"""
 
-    # Agent 실행
-    response = agent(prompt)
-    response_text = str(response)
+
+def _parse_review(response_text: str, source_path: str, target_path: str) -> TaskResult:
+    """검토 응답(XML) 파싱 (내부 함수)"""
     
     # XML 파싱
     def extract_xml(text: str, tag: str) -> str:
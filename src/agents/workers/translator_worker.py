@@ -1,20 +1,86 @@
 # Translator Worker - Stateless 번역 워커
 # 결과만 반환, tasks.md 직접 수정 안 함
 
+import asyncio
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 from strands import Agent
 from strands_tools import file_read, file_write
 
-from model.load import load_sonnet
+from model.invoke import converse, converse_async, invoke_agent, invoke_agent_async
+from model.load import load_worker_model
+from model.retry import classify_error
 from prompts.system_prompts import TRANSLATOR_PROMPT
 from task_manager.types import TaskResult
-from tools.file_tools import read_workshop_file, write_translated_file
+from tools.file_tools import (
+    read_workshop_file,
+    read_workshop_file_with_hash,
+    write_translated_file,
+    get_target_path,
+    compute_file_hash,
+)
+from tools.markdown_blocks import (
+    Segment,
+    split_segments,
+    match_unchanged_segments,
+    chunk_segments,
+)
+from tools.markdown_mask import mask_text, unmask_text, needs_translation
+from tools.translation_memory import get_translation_memory, get_glossary_version, NO_GLOSSARY
+
+
+# 언어 이름 매핑
+LANG_NAMES = {
+    "en": "영어 (English)",
+    "ko": "한국어 (Korean)",
+    "ja": "일본어 (Japanese)",
+    "zh": "중국어 간체 (Simplified Chinese)",
+    "es": "스페인어 (Spanish)",
+    "pt": "포르투갈어 (Portuguese)",
+    "fr": "프랑스어 (French)",
+    "de": "독일어 (German)",
+}
+
+# 세그먼트 응답 패턴
+SEGMENT_PATTERN = re.compile(r'<segment id="([^"]+)">(.*?)</segment>', re.DOTALL)
+
+# 청크 분할 설정 (요청 1회당 원문 토큰 예산, 파일 내 청크 동시 번역 수)
+CHUNK_MAX_TOKENS = int(os.getenv("WSTRANSLATOR_CHUNK_TOKENS", "2500"))
+CHUNK_CONCURRENCY = int(os.getenv("WSTRANSLATOR_CHUNK_CONCURRENCY", "4"))
+
+# 작은 파일 묶음 번역 설정 (묶음 대상 최대 줄 수, 한 묶음의 최대 파일 수)
+PACK_MAX_LINES = int(os.getenv("WSTRANSLATOR_PACK_MAX_LINES", "50"))
+PACK_MAX_FILES = int(os.getenv("WSTRANSLATOR_PACK_MAX_FILES", "10"))
+
+# 번역 엔진 ("direct": Converse API 직접 호출, "agent": 도구를 가진 Strands Agent)
+TRANSLATOR_ENGINE = os.getenv("WSTRANSLATOR_TRANSLATOR_ENGINE", "direct")
+
+# 직접 호출 시 요청당 최대 출력 토큰 수
+TRANSLATE_MAX_TOKENS = int(os.getenv("WSTRANSLATOR_TRANSLATE_MAX_TOKENS", "8192"))
+
+
+@dataclass
+class _FileJob:
+    """번역 준비가 끝난 파일 (모델 호출 전 상태)"""
+    source_path: str
+    source_content: str
+    source_hash: str                    # 번역한 원본 내용의 해시 (완료 시점에 다시 읽지 않음)
+    segments: List[Segment]
+    translations: Dict[str, str]        # 세그먼트 ID → 확정된 번역
+    pending: Dict[str, str]             # 세그먼트 ID → 모델에 보낼 마스킹된 원문
+    masks: Dict[str, List[str]]         # 세그먼트 ID → 자리표시자 원문
+    stats: Dict[str, int] = field(default_factory=dict)
 
 
 def translate_single_file(
     source_path: str,
     target_lang: str,
-    source_lang: str = "en"
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None,
+    fresh: bool = False
 ) -> TaskResult:
     """
     단일 파일 번역 (Stateless Worker)
@@ -24,108 +90,709 @@ def translate_single_file(
     - 결과만 TaskResult로 반환
     - Orchestrator가 결과를 받아 상태 업데이트
     
+    증분 번역 (workshop_path 지정 시):
+    - 파일을 Markdown 블록(세그먼트) 단위로 나눔
+    - 이전 번역 시점의 원본 스냅샷과 비교하여 바뀌지 않은 블록은 현재 번역 파일에서 재사용
+    - 나머지는 번역 메모리를 조회하고, 적중하지 않은 세그먼트만 모델에 전달
+    - 코드 블록/shortcode/URL/인라인 코드는 자리표시자로 마스킹하여 문장만 전달 후 원문 복원
+    - 모델에 전달할 세그먼트가 많으면 토큰 예산 단위 청크로 나누어 동시에 번역
+    - 번역 메모리와 스냅샷은 검증을 통과한 뒤 commit_translation에서 갱신
+    
     Args:
         source_path: 원본 파일 경로
         target_lang: 타겟 언어 코드
         source_lang: 소스 언어 코드
+        workshop_path: Workshop 루트 경로 (지정 시 translation/ 아래 번역 메모리 사용)
+        fresh: True면 번역 메모리와 이전 번역을 재사용하지 않고 모두 모델로 번역 (force_reset, 재시도)
     
     Returns:
         TaskResult: 번역 결과 (성공/실패, 출력 경로, 메타데이터)
     """
     try:
-        # 원본 파일 읽기
-        source_content = read_workshop_file(source_path)
+        job = _prepare_file(source_path, target_lang, source_lang, workshop_path, fresh)
+        if isinstance(job, TaskResult):
+            return job
         
-        if not source_content:
-            return TaskResult(
-                task_id="",  # Orchestrator가 채움
-                success=False,
-                error=f"원본 파일을 읽을 수 없습니다: {source_path}"
+        # 누락된 세그먼트만 모델로 번역
+        translated: Dict[str, str] = {}
+        if job.pending:
+            chunks = chunk_segments(list(job.pending.items()), CHUNK_MAX_TOKENS)
+            job.stats["chunks"] = len(chunks)
+            translated = _translate_chunks(
+                chunks, job.masks, f"- 경로: {source_path}",
+                LANG_NAMES.get(source_lang, source_lang),
+                LANG_NAMES.get(target_lang, target_lang),
             )
         
-        # 언어 이름 매핑
-        lang_names = {
-            "ko": "한국어 (Korean)",
-            "ja": "일본어 (Japanese)",
-            "zh": "중국어 간체 (Simplified Chinese)",
-            "es": "스페인어 (Spanish)",
-            "pt": "포르투갈어 (Portuguese)",
-            "fr": "프랑스어 (French)",
-            "de": "독일어 (German)",
-        }
-        target_lang_name = lang_names.get(target_lang, target_lang)
-        source_lang_name = lang_names.get(source_lang, source_lang)
+        return _finish_file(job, translated, target_lang, source_lang, workshop_path)
         
-        # Translator Agent 생성 (Stateless)
-        agent = Agent(
-            model=load_sonnet(),
-            system_prompt=TRANSLATOR_PROMPT,
-            tools=[file_read, file_write],
+    except Exception as e:
+        return TaskResult(
+            task_id="",
+            success=False,
+            error=str(e),
+            metadata={"source_path": source_path, "error_type": classify_error(e)}
         )
-        
-        # 번역 프롬프트
-        prompt = f"""다음 AWS Workshop 콘텐츠를 {source_lang_name}에서 {target_lang_name}로 번역해주세요.
-
-## 원본 파일
-- 경로: {source_path}
 
-## 원본 내용
-```markdown
-{source_content}
-```
 
-## 번역 지침
-1. Markdown 구조 유지 (헤더, 리스트, 코드 블록 등)
-2. AWS 서비스명, 기술 용어는 영어 유지
-3. 코드 블록 내용은 번역하지 않음
-4. Hugo shortcode 구문 유지 ({{{{< >}}}}, {{{{%  %}}}})
-5. 자연스러운 {target_lang_name} 표현 사용
+def translate_files_packed(
+    source_paths: List[str],
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None,
+    fresh: bool = False
+) -> List[TaskResult]:
+    """
+    작은 파일 여러 개를 하나의 요청으로 묶어 번역 (Stateless Worker)
+    
+    _index.en.md 같은 짧은 페이지는 내용보다 요청당 오버헤드(Agent 생성, 시스템 프롬프트,
+    왕복 지연)가 더 크므로, 세그먼트 ID에 파일 번호를 붙여 한 요청에 담고
+    응답을 파일별로 나누어 각각 저장합니다.
+    
+    Args:
+        source_paths: 원본 파일 경로 목록
+        target_lang: 타겟 언어 코드
+        source_lang: 소스 언어 코드
+        workshop_path: Workshop 루트 경로 (지정 시 번역 메모리 사용)
+        fresh: True면 번역 메모리와 이전 번역을 재사용하지 않음
+    
+    Returns:
+        List[TaskResult]: source_paths 순서와 같은 파일별 번역 결과
+    """
+    pack = _prepare_pack(source_paths, target_lang, source_lang, workshop_path, fresh)
+    if pack.chunks:
+        try:
+            pack.translated = _translate_chunks(
+                pack.chunks, pack.masks, pack.description,
+                LANG_NAMES.get(source_lang, source_lang),
+                LANG_NAMES.get(target_lang, target_lang),
+            )
+        except Exception as e:
+            pack.error = e
+    return _finish_pack(pack, target_lang, source_lang, workshop_path)
 
-번역된 전체 내용만 출력해주세요. 설명이나 주석 없이 번역 결과만 반환합니다."""
 
-        # Agent 실행
-        response = agent(prompt)
-        
-        # 응답에서 번역 내용 추출
-        translated_content = str(response)
-        
-        # 코드 블록 마커 제거 (있는 경우)
-        if translated_content.startswith("```markdown"):
-            translated_content = translated_content[len("```markdown"):].strip()
-        if translated_content.startswith("```"):
-            translated_content = translated_content[3:].strip()
-        if translated_content.endswith("```"):
-            translated_content = translated_content[:-3].strip()
+async def translate_single_file_async(
+    source_path: str,
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None,
+    fresh: bool = False
+) -> TaskResult:
+    """
+    translate_single_file의 비동기 버전 (Stateless Worker)
+    
+    준비/저장 단계(파일 읽기/쓰기, 번역 메모리 조회, 스냅샷 저장)는 동기 버전과 같은 함수를
+    executor 스레드에서 실행하고, 모델 호출만 코루틴으로 실행하여 하나의 이벤트 루프에서
+    많은 파일을 동시에 처리할 수 있습니다.
+    """
+    try:
+        job = await asyncio.to_thread(_prepare_file, source_path, target_lang, source_lang, workshop_path, fresh)
+        if isinstance(job, TaskResult):
+            return job
         
-        # 번역 파일 저장
-        target_path = write_translated_file(
-            source_path, 
-            translated_content, 
-            target_lang, 
-            source_lang
-        )
+        translated: Dict[str, str] = {}
+        if job.pending:
+            chunks = chunk_segments(list(job.pending.items()), CHUNK_MAX_TOKENS)
+            job.stats["chunks"] = len(chunks)
+            translated = await _translate_chunks_async(
+                chunks, job.masks, f"- 경로: {source_path}",
+                LANG_NAMES.get(source_lang, source_lang),
+                LANG_NAMES.get(target_lang, target_lang),
+            )
         
-        # 통계 계산
-        source_lines = len(source_content.split("\n"))
-        target_lines = len(translated_content.split("\n"))
-        
-        return TaskResult(
-            task_id="",  # Orchestrator가 채움
-            success=True,
-            output_path=target_path,
-            metadata={
-                "source_path": source_path,
-                "source_lang": source_lang,
-                "target_lang": target_lang,
-                "source_lines": source_lines,
-                "target_lines": target_lines,
-            }
-        )
+        return await asyncio.to_thread(_finish_file, job, translated, target_lang, source_lang, workshop_path)
         
     except Exception as e:
         return TaskResult(
             task_id="",
             success=False,
             error=str(e),
-            metadata={"source_path": source_path}
+            metadata={"source_path": source_path, "error_type": classify_error(e)}
+        )
+
+
+async def translate_files_packed_async(
+    source_paths: List[str],
+    target_lang: str,
+    source_lang: str = "en",
+    workshop_path: Optional[str] = None,
+    fresh: bool = False
+) -> List[TaskResult]:
+    """translate_files_packed의 비동기 버전 (준비/저장 단계는 executor 스레드에서 실행, Stateless Worker)"""
+    pack = await asyncio.to_thread(_prepare_pack, source_paths, target_lang, source_lang, workshop_path, fresh)
+    if pack.chunks:
+        try:
+            pack.translated = await _translate_chunks_async(
+                pack.chunks, pack.masks, pack.description,
+                LANG_NAMES.get(source_lang, source_lang),
+                LANG_NAMES.get(target_lang, target_lang),
+            )
+        except Exception as e:
+            pack.error = e
+    return await asyncio.to_thread(_finish_pack, pack, target_lang, source_lang, workshop_path)
+
+
+@dataclass
+class _PackJob:
+    """묶음 번역 준비 상태 (모델 호출 전후)"""
+    results: List[Optional[TaskResult]]
+    jobs: Dict[int, _FileJob]
+    chunks: List[List[Tuple[str, str]]]
+    masks: Dict[str, List[str]]
+    description: str
+    translated: Dict[str, str] = field(default_factory=dict)
+    error: Optional[Exception] = None
+
+
+def _prepare_pack(
+    source_paths: List[str],
+    target_lang: str,
+    source_lang: str,
+    workshop_path: Optional[str],
+    fresh: bool = False
+) -> _PackJob:
+    """파일별 준비 후 세그먼트를 "{파일 번호}.{세그먼트 ID}"로 합쳐 청크 구성 (내부 함수)"""
+    results: List[Optional[TaskResult]] = [None] * len(source_paths)
+    jobs: Dict[int, _FileJob] = {}
+    
+    # 파일별 준비 (읽기 실패 등은 해당 파일만 실패 처리)
+    for index, source_path in enumerate(source_paths):
+        try:
+            job = _prepare_file(source_path, target_lang, source_lang, workshop_path, fresh)
+        except Exception as e:
+            job = TaskResult(task_id="", success=False, error=str(e), metadata={"source_path": source_path})
+        if isinstance(job, TaskResult):
+            results[index] = job
+        else:
+            jobs[index] = job
+    
+    packed: List[Tuple[str, str]] = []
+    packed_masks: Dict[str, List[str]] = {}
+    for index, job in jobs.items():
+        for seg_id, text in job.pending.items():
+            packed.append((f"{index}.{seg_id}", text))
+            packed_masks[f"{index}.{seg_id}"] = job.masks[seg_id]
+    
+    return _PackJob(
+        results=results,
+        jobs=jobs,
+        chunks=chunk_segments(packed, CHUNK_MAX_TOKENS) if packed else [],
+        masks=packed_masks,
+        description="\n".join(f"- 파일 {index}: {jobs[index].source_path}" for index in jobs),
+    )
+
+
+def _finish_pack(
+    pack: _PackJob,
+    target_lang: str,
+    source_lang: str,
+    workshop_path: Optional[str]
+) -> List[TaskResult]:
+    """묶음 번역 결과를 파일별로 나누어 저장 (내부 함수)"""
+    results = pack.results
+    for index, job in pack.jobs.items():
+        if pack.error and job.pending:
+            results[index] = TaskResult(
+                task_id="",
+                success=False,
+                error=str(pack.error),
+                metadata={"source_path": job.source_path, "error_type": classify_error(pack.error)}
+            )
+            continue
+        
+        prefix = f"{index}."
+        file_translated = {
+            packed_id[len(prefix):]: text
+            for packed_id, text in pack.translated.items()
+            if packed_id.startswith(prefix)
+        }
+        job.stats["packed_files"] = len(pack.jobs)
+        try:
+            results[index] = _finish_file(job, file_translated, target_lang, source_lang, workshop_path)
+        except Exception as e:
+            results[index] = TaskResult(
+                task_id="",
+                success=False,
+                error=str(e),
+                metadata={"source_path": job.source_path}
+            )
+    
+    return results
+
+
+def is_packable(source_path: str) -> bool:
+    """여러 파일을 한 요청으로 묶어 번역할 만큼 작은 파일인지 확인"""
+    try:
+        with open(source_path, "r", encoding="utf-8") as f:
+            for line_count, _ in enumerate(f, start=1):
+                if line_count > PACK_MAX_LINES:
+                    return False
+        return True
+    except OSError:
+        return False
+
+
+def _prepare_file(
+    source_path: str,
+    target_lang: str,
+    source_lang: str,
+    workshop_path: Optional[str],
+    fresh: bool = False
+):
+    """
+    파일을 세그먼트로 나누고 재사용 가능한 번역을 채운 뒤 모델에 보낼 세그먼트를 마스킹 (내부 함수)
+    
+    fresh이면 이전 번역과 번역 메모리를 조회하지 않습니다.
+    
+    Returns:
+        _FileJob: 번역 준비 결과 (원본을 읽을 수 없으면 실패 TaskResult)
+    """
+    # 원본 파일 읽기
+    source_content, source_hash = read_workshop_file_with_hash(source_path)
+    
+    if not source_content:
+        return TaskResult(
+            task_id="",  # Orchestrator가 채움
+            success=False,
+            error=f"원본 파일을 읽을 수 없습니다: {source_path}"
+        )
+    
+    # 세그먼트 분할 (빈 세그먼트는 그대로 유지)
+    segments = split_segments(source_content)
+    translations: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    for i, segment in enumerate(segments):
+        if segment.is_empty:
+            translations[str(i)] = segment.text
+        else:
+            pending[str(i)] = segment.text
+    
+    # 이전 번역과 블록 단위 비교 (변경되지 않은 블록은 기존 번역 유지)
+    reused_segments = 0
+    previous = _load_previous_translation(workshop_path, source_path, target_lang, source_lang) \
+        if workshop_path and not fresh else None
+    if previous and pending:
+        old_segments, target_segments = previous
+        for new_index, old_index in match_unchanged_segments(old_segments, segments).items():
+            seg_id = str(new_index)
+            if seg_id in pending:
+                translations[seg_id] = target_segments[old_index].text
+                del pending[seg_id]
+                reused_segments += 1
+    
+    # 번역 메모리 조회
+    memory = get_translation_memory(workshop_path) if workshop_path and not fresh else None
+    glossary_version = get_glossary_version(workshop_path) if memory else NO_GLOSSARY
+    memory_hits = 0
+    
+    if memory and pending:
+        hits = memory.lookup(
+            (segments[int(seg_id)].hash for seg_id in pending),
+            source_lang, target_lang, glossary_version
+        )
+        for seg_id in list(pending):
+            segment_hash = segments[int(seg_id)].hash
+            if segment_hash in hits:
+                translations[seg_id] = hits[segment_hash]
+                del pending[seg_id]
+                memory_hits += 1
+    
+    # 번역하지 않을 구간(코드 블록, shortcode, URL, 인라인 코드) 마스킹
+    # 마스킹 후 번역할 문장이 없으면 원문 그대로 사용
+    masks: Dict[str, List[str]] = {}
+    passthrough_segments = 0
+    for seg_id in list(pending):
+        masked, originals = mask_text(pending[seg_id])
+        if not needs_translation(masked):
+            translations[seg_id] = pending.pop(seg_id)
+            passthrough_segments += 1
+            continue
+        pending[seg_id] = masked
+        masks[seg_id] = originals
+    
+    return _FileJob(
+        source_path=source_path,
+        source_content=source_content,
+        source_hash=source_hash,
+        segments=segments,
+        translations=translations,
+        pending=pending,
+        masks=masks,
+        stats={
+            "segments": len(segments),
+            "reused_segments": reused_segments,
+            "memory_hits": memory_hits,
+            "passthrough_segments": passthrough_segments,
+            "model_segments": len(pending),
+            "chunks": 0,
+        },
+    )
+
+
+def _finish_file(
+    job: _FileJob,
+    translated: Dict[str, str],
+    target_lang: str,
+    source_lang: str,
+    workshop_path: Optional[str]
+) -> TaskResult:
+    """
+    모델 번역 결과를 합쳐 파일로 저장 (내부 함수)
+    
+    번역에 사용한 원본은 검증 대기 스냅샷으로 저장하고, 이전에 확정된 스냅샷은 지웁니다.
+    (검증 전의 번역이 다음 실행에서 재사용되지 않도록 함, 확정은 commit_translation)
+    
+    Raises:
+        ValueError: 번역되지 않은 세그먼트가 남은 경우
+    """
+    missing = [seg_id for seg_id in job.pending if seg_id not in translated]
+    if missing:
+        raise ValueError(f"번역 응답에서 누락된 세그먼트: {', '.join(missing[:10])}")
+    
+    translations = dict(job.translations)
+    translations.update(translated)
+    
+    # 원본 블록 순서대로 재조립 (블록 사이 개행은 원본 유지)
+    translated_content = "".join(
+        segment.prefix + translations[str(i)] + segment.suffix
+        for i, segment in enumerate(job.segments)
+    )
+    
+    # 번역 파일 저장
+    target_path = write_translated_file(
+        job.source_path, 
+        translated_content, 
+        target_lang, 
+        source_lang
+    )
+    
+    # 검증 통과 후 확정할 원본 스냅샷 저장 (다음 증분 번역용)
+    if workshop_path:
+        _save_source_snapshot(workshop_path, job.source_path, target_lang, job.source_content)
+    
+    # 통계 계산
+    source_lines = len(job.source_content.split("\n"))
+    target_lines = len(translated_content.split("\n"))
+    
+    return TaskResult(
+        task_id="",  # Orchestrator가 채움
+        success=True,
+        output_path=target_path,
+        metadata={
+            "source_path": job.source_path,
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "source_lines": source_lines,
+            "target_lines": target_lines,
+            **job.stats,
+            "source_hash": job.source_hash,
+            "target_hash": compute_file_hash(target_path),
+        }
+    )
+
+
+def _translate_chunks(
+    chunks: List[List[Tuple[str, str]]],
+    masks: Dict[str, List[str]],
+    source_description: str,
+    source_lang_name: str,
+    target_lang_name: str
+) -> Dict[str, str]:
+    """
+    청크들을 동시에 번역하여 세그먼트 ID → 번역문으로 합침 (내부 함수)
+    
+    파일 처리 시간이 파일 길이가 아니라 가장 큰 청크에 따라 결정되도록 합니다.
+    하나라도 실패하면 예외가 전파되어 파일 전체가 실패 처리됩니다.
+    """
+    if len(chunks) == 1:
+        return _translate_segments(
+            dict(chunks[0]), masks, source_description, source_lang_name, target_lang_name
         )
+    
+    translated: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(CHUNK_CONCURRENCY, len(chunks))) as executor:
+        futures = [
+            executor.submit(
+                _translate_segments, dict(chunk), masks,
+                source_description, source_lang_name, target_lang_name
+            )
+            for chunk in chunks
+        ]
+        for future in futures:
+            translated.update(future.result())
+    return translated
+
+
+async def _translate_chunks_async(
+    chunks: List[List[Tuple[str, str]]],
+    masks: Dict[str, List[str]],
+    source_description: str,
+    source_lang_name: str,
+    target_lang_name: str
+) -> Dict[str, str]:
+    """_translate_chunks의 비동기 버전 (청크를 한 이벤트 루프에서 동시에 번역)"""
+    results = await asyncio.gather(*(
+        _translate_segments_async(dict(chunk), masks, source_description, source_lang_name, target_lang_name)
+        for chunk in chunks
+    ))
+    translated: Dict[str, str] = {}
+    for result in results:
+        translated.update(result)
+    return translated
+
+
+def _translate_segments(
+    segments: Dict[str, str],
+    masks: Dict[str, List[str]],
+    source_description: str,
+    source_lang_name: str,
+    target_lang_name: str
+) -> Dict[str, str]:
+    """
+    세그먼트 묶음을 한 번의 요청으로 번역 (내부 함수)
+    
+    응답에서 누락되었거나 자리표시자가 깨진 세그먼트는 한 번 더 요청하고,
+    그래도 없으면 예외를 발생시킵니다.
+    
+    Args:
+        segments: 세그먼트 ID → 마스킹된 원문
+        masks: 세그먼트 ID → 자리표시자 원문 목록
+        source_description: 원본 파일 정보 (프롬프트 컨텍스트용, "- 경로: ..." 형식)
+        source_lang_name: 소스 언어 이름
+        target_lang_name: 타겟 언어 이름
+    
+    Returns:
+        Dict[str, str]: 세그먼트 ID → 번역문 (자리표시자 복원 완료)
+    
+    Raises:
+        ValueError: 재요청 후에도 누락된 세그먼트가 있는 경우
+    """
+    send = _create_sender()
+    
+    translated: Dict[str, str] = {}
+    pending = dict(segments)
+    
+    for _ in range(2):
+        prompt = _build_translation_prompt(pending, source_description, source_lang_name, target_lang_name)
+        _apply_segment_response(send(prompt), pending, masks, translated)
+        if not pending:
+            return translated
+    
+    raise ValueError(f"번역 응답에서 누락된 세그먼트: {', '.join(list(pending)[:10])}")
+
+
+async def _translate_segments_async(
+    segments: Dict[str, str],
+    masks: Dict[str, List[str]],
+    source_description: str,
+    source_lang_name: str,
+    target_lang_name: str
+) -> Dict[str, str]:
+    """_translate_segments의 비동기 버전 (내부 함수)"""
+    send = _create_async_sender()
+    
+    translated: Dict[str, str] = {}
+    pending = dict(segments)
+    
+    for _ in range(2):
+        prompt = _build_translation_prompt(pending, source_description, source_lang_name, target_lang_name)
+        _apply_segment_response(await send(prompt), pending, masks, translated)
+        if not pending:
+            return translated
+    
+    raise ValueError(f"번역 응답에서 누락된 세그먼트: {', '.join(list(pending)[:10])}")
+
+
+def _build_translation_prompt(
+    pending: Dict[str, str],
+    source_description: str,
+    source_lang_name: str,
+    target_lang_name: str
+) -> str:
+    """세그먼트 번역 프롬프트 생성 (내부 함수)"""
+    segment_text = "\n\n".join(
+        f'<segment id="{seg_id}">\n{text}\n</segment>'
+        for seg_id, text in pending.items()
+    )
+    
+    return f"""다음 AWS Workshop 콘텐츠를 {source_lang_name}에서 {target_lang_name}로 번역해주세요.
+
+## 원본 파일
+{source_description}
+
+## 번역 지침
+1. Markdown 구조 유지 (헤더, 리스트, 코드 블록 등)
+2. AWS 서비스명, 기술 용어는 영어 유지
+3. ⟦0⟧, ⟦1⟧ 같은 자리표시자는 코드/shortcode/URL이므로 번역하거나 삭제하지 말고 그대로 유지
+4. 자리표시자는 문장 구조에 맞게 위치를 옮길 수 있지만 각각 정확히 한 번씩 포함
+5. 자연스러운 {target_lang_name} 표현 사용
+6. 원본은 <segment id="N"> 태그로 나뉘어 있습니다. 각 세그먼트를 같은 id의 태그로 감싸 순서대로 출력하세요.
+
+## 원본 세그먼트
+{segment_text}
+
+번역된 세그먼트만 출력해주세요. 설명이나 주석 없이 <segment> 태그로 감싼 번역 결과만 반환합니다."""
+
+
+def _apply_segment_response(
+    response_text: str,
+    pending: Dict[str, str],
+    masks: Dict[str, List[str]],
+    translated: Dict[str, str]
+):
+    """응답의 세그먼트를 복원하여 translated로 옮기고 pending에서 제거 (내부 함수)"""
+    for seg_id, text in _parse_segments(response_text).items():
+        if seg_id not in pending:
+            continue
+        restored = unmask_text(text, masks.get(seg_id, []))
+        if restored is None:
+            continue  # 자리표시자 손상 → 재요청
+        translated[seg_id] = restored
+        del pending[seg_id]
+
+
+def _create_sender():
+    """
+    번역 요청 함수 생성 (내부 함수)
+    
+    기본은 Converse API 직접 호출이며, 원문이 프롬프트에 모두 들어 있으므로
+    도구가 필요 없습니다. WSTRANSLATOR_TRANSLATOR_ENGINE=agent이면 기존처럼
+    file_read/file_write 도구를 가진 Agent로 실행합니다.
+    """
+    if TRANSLATOR_ENGINE == "agent":
+        # Translator Agent 생성 (Stateless)
+        agent = Agent(
+            model=load_worker_model("sonnet"),
+            system_prompt=TRANSLATOR_PROMPT,
+            tools=[file_read, file_write],
+        )
+        return lambda prompt: invoke_agent(agent, prompt)
+    
+    model = load_worker_model("sonnet")
+    return lambda prompt: converse(model, TRANSLATOR_PROMPT, prompt, TRANSLATE_MAX_TOKENS).text
+
+
+def _create_async_sender():
+    """_create_sender의 비동기 버전 (Agent.invoke_async 또는 BedrockModel.stream)"""
+    if TRANSLATOR_ENGINE == "agent":
+        agent = Agent(
+            model=load_worker_model("sonnet"),
+            system_prompt=TRANSLATOR_PROMPT,
+            tools=[file_read, file_write],
+        )
+        return lambda prompt: invoke_agent_async(agent, prompt)
+    
+    model = load_worker_model("sonnet", max_tokens=TRANSLATE_MAX_TOKENS)
+    
+    async def send(prompt: str) -> str:
+        return (await converse_async(model, TRANSLATOR_PROMPT, prompt)).text
+    
+    return send
+
+
+def _parse_segments(response_text: str) -> Dict[str, str]:
+    """모델 응답에서 <segment id="N">...</segment> 추출"""
+    return {
+        match.group(1): match.group(2).strip("\n")
+        for match in SEGMENT_PATTERN.finditer(response_text)
+    }
+
+
+def _snapshot_path(workshop_path: str, source_path: str, target_lang: str, pending: bool = False) -> Optional[str]:
+    """
+    원본 스냅샷 경로
+
+    - 확정: translation/snapshots/{target_lang}/{상대 경로}
+    - 검증 대기: translation/snapshots/{target_lang}.pending/{상대 경로}
+    """
+    rel_path = os.path.relpath(os.path.abspath(source_path), os.path.abspath(workshop_path))
+    if rel_path.startswith(".."):
+        return None
+    lang_dir = f"{target_lang}.pending" if pending else target_lang
+    return os.path.join(workshop_path, "translation", "snapshots", lang_dir, rel_path)
+
+
+def _save_source_snapshot(workshop_path: str, source_path: str, target_lang: str, source_content: str):
+    """번역에 사용한 원본 내용을 검증 대기 스냅샷으로 저장하고 확정 스냅샷은 삭제"""
+    pending_path = _snapshot_path(workshop_path, source_path, target_lang, pending=True)
+    if not pending_path:
+        return
+    os.makedirs(os.path.dirname(pending_path), exist_ok=True)
+    with open(pending_path, "w", encoding="utf-8") as f:
+        f.write(source_content)
+    snapshot_path = _snapshot_path(workshop_path, source_path, target_lang)
+    if os.path.exists(snapshot_path):
+        os.remove(snapshot_path)
+
+
+def commit_translation(
+    workshop_path: str,
+    source_path: str,
+    target_lang: str,
+    source_lang: str = "en"
+) -> int:
+    """
+    검증을 통과한 번역을 확정하여 다음 번역에서 재사용할 수 있게 합니다.
+
+    검증 대기 스냅샷을 확정 스냅샷으로 옮기고, 스냅샷과 번역 파일의 블록이 1:1로 대응되면
+    번역이 필요한 블록을 번역 메모리에 저장합니다. 검토/자동 복구로 고쳐진 내용이 저장됩니다.
+
+    Args:
+        workshop_path: Workshop 루트 경로
+        source_path: 원본 파일 경로
+        target_lang: 타겟 언어 코드
+        source_lang: 소스 언어 코드
+
+    Returns:
+        int: 번역 메모리에 저장한 세그먼트 수 (대기 스냅샷이 없으면 0)
+    """
+    pending_path = _snapshot_path(workshop_path, source_path, target_lang, pending=True)
+    target_path = get_target_path(source_path, target_lang, source_lang)
+    if not pending_path or not os.path.exists(pending_path) or not os.path.exists(target_path):
+        return 0
+
+    source_segments = split_segments(read_workshop_file(pending_path))
+    target_segments = split_segments(read_workshop_file(target_path))
+    entries = []
+    if len(source_segments) == len(target_segments):
+        entries = [
+            (source.hash, target.text)
+            for source, target in zip(source_segments, target_segments)
+            if not source.is_empty and needs_translation(mask_text(source.text)[0])
+        ]
+    memory = get_translation_memory(workshop_path)
+    if memory and entries:
+        memory.store(entries, source_lang, target_lang, get_glossary_version(workshop_path))
+
+    snapshot_path = _snapshot_path(workshop_path, source_path, target_lang)
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    os.replace(pending_path, snapshot_path)
+    return len(entries)
+
+
+def _load_previous_translation(
+    workshop_path: str,
+    source_path: str,
+    target_lang: str,
+    source_lang: str
+) -> Optional[Tuple[List[Segment], List[Segment]]]:
+    """
+    이전 번역 시점의 원본 세그먼트와 현재 번역 파일 세그먼트 로드
+    
+    두 파일의 블록 수가 같아 1:1로 대응될 때만 반환합니다.
+    (번역 파일이 수동으로 크게 수정된 경우 블록 재사용을 건너뜀)
+    
+    Returns:
+        Tuple: (이전 원본 세그먼트, 현재 번역 세그먼트) 또는 None
+    """
+    snapshot_path = _snapshot_path(workshop_path, source_path, target_lang)
+    target_path = get_target_path(source_path, target_lang, source_lang)
+    if not snapshot_path or not os.path.exists(snapshot_path) or not os.path.exists(target_path):
+        return None
+    
+    old_segments = split_segments(read_workshop_file(snapshot_path))
+    target_segments = split_segments(read_workshop_file(target_path))
+    if len(old_segments) != len(target_segments):
+        return None
+    return old_segments, target_segments
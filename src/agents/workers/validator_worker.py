@@ -1,14 +1,32 @@
 # Validator Worker - Stateless 구조 검증 워커
 # 결과만 반환, tasks.md 직접 수정 안 함
 
-import re
+import asyncio
+import os
+from typing import List, Tuple
+
 from strands import Agent
 from strands_tools import file_read, file_write
 
 from model.load import load_sonnet
 from prompts.system_prompts import VALIDATOR_PROMPT
 from task_manager.types import TaskResult
-from tools.file_tools import read_workshop_file
+from tools.file_tools import compute_file_hash, read_workshop_file
+from tools.markdown_repair import repair_structure
+from tools.markdown_structure import (
+    BlockDiff,
+    MarkdownStructure,
+    align_blocks,
+    scan_file_structure,
+    scan_structure,
+)
+
+# 메타데이터에 기록할 블록 차이 최대 개수, 메시지에 표시할 개수
+MAX_BLOCK_DIFFS = 50
+MAX_BLOCK_DIFFS_IN_MESSAGE = 3
+
+# 구조 오류를 원본 기준으로 자동 복구 후 재검증 (0이면 끔, 복구 실패 시 기존 실패/재시도 흐름)
+AUTO_REPAIR = os.getenv("WSTRANSLATOR_AUTO_REPAIR", "1") != "0"
 
 
 def validate_single_file(
@@ -25,6 +43,9 @@ def validate_single_file(
     - 결과만 TaskResult로 반환
     - Orchestrator가 결과를 받아 상태 업데이트
     
+    구조 오류가 있으면 repair_structure로 복구한 뒤 다시 검증하고, 오류가 모두 사라진 경우에만
+    번역 파일에 저장합니다. 수정 내역은 metadata["repairs"], 새 번역 해시는 metadata["target_hash"]에 기록합니다.
+    
     Args:
         source_path: 원본 파일 경로
         target_path: 번역 파일 경로
@@ -53,56 +74,33 @@ def validate_single_file(
                 error=f"번역 파일을 읽을 수 없습니다: {target_path}"
             )
         
-        # 기본 구조 검증 (Agent 호출 전 빠른 체크)
-        errors = []
-        warnings = []
-        
-        # 1. 헤더 구조 비교
-        source_headers = re.findall(r'^(#{1,6})\s+', source_content, re.MULTILINE)
-        target_headers = re.findall(r'^(#{1,6})\s+', target_content, re.MULTILINE)
-        
-        if len(source_headers) != len(target_headers):
-            warnings.append(f"헤더 수 불일치: 원본 {len(source_headers)}개, 번역 {len(target_headers)}개")
-        
-        # 2. 코드 블록 수 비교
-        source_code_blocks = len(re.findall(r'```', source_content))
-        target_code_blocks = len(re.findall(r'```', target_content))
-        
-        if source_code_blocks != target_code_blocks:
-            errors.append(f"코드 블록 수 불일치: 원본 {source_code_blocks//2}개, 번역 {target_code_blocks//2}개")
-        
-        # 3. Hugo shortcode 검증
-        source_shortcodes = re.findall(r'\{\{[<%].*?[%>]\}\}', source_content)
-        target_shortcodes = re.findall(r'\{\{[<%].*?[%>]\}\}', target_content)
-        
-        if len(source_shortcodes) != len(target_shortcodes):
-            errors.append(f"Hugo shortcode 수 불일치: 원본 {len(source_shortcodes)}개, 번역 {len(target_shortcodes)}개")
-        
-        # 4. 링크 검증
-        source_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', source_content)
-        target_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', target_content)
-        
-        if len(source_links) != len(target_links):
-            warnings.append(f"링크 수 불일치: 원본 {len(source_links)}개, 번역 {len(target_links)}개")
-        
-        # 5. 이미지 참조 검증
-        source_images = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', source_content)
-        target_images = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', target_content)
-        
-        # 이미지 경로가 동일한지 확인
-        source_image_paths = set(img[1] for img in source_images)
-        target_image_paths = set(img[1] for img in target_images)
+        # 구조 지문 비교 (원본은 타겟 언어마다 재사용되므로 캐시)
+        source = scan_file_structure(source_path, source_content)
+        target, errors, warnings, block_diffs = check_structure(source, target_content)
         
-        missing_images = source_image_paths - target_image_paths
-        if missing_images:
-            errors.append(f"누락된 이미지 참조: {', '.join(missing_images)}")
+        # 번역 대상이 아닌 구간(구분자, 펜스, shortcode, 이미지 경로)은 원본에서 옮겨 복구 후 재검증
+        # 복구해도 오류가 남으면 파일은 그대로 두고 실패 반환 (재번역으로 넘어감)
+        repair = {}
+        if errors and AUTO_REPAIR:
+            try:
+                repaired_content, repairs = repair_structure(source_content, target_content, source)
+            except Exception as e:
+                # 복구 실패는 검증 결과에 영향을 주지 않음
+                repaired_content, repairs = target_content, []
+                repair["repair_error"] = str(e)
+            repair.update({"repair_attempted": True, "repairs": repairs, "repaired": False})
+            if repairs:
+                repaired = check_structure(source, repaired_content)
+                if not repaired[1]:
+                    with open(target_path, "w", encoding="utf-8") as f:
+                        f.write(repaired_content)
+                    target, errors, warnings, block_diffs = repaired
+                    repair["repaired"] = True
+                    repair["target_hash"] = compute_file_hash(target_path)
         
-        # 6. Front matter 검증 (있는 경우)
-        source_has_frontmatter = source_content.startswith('---')
-        target_has_frontmatter = target_content.startswith('---')
-        
-        if source_has_frontmatter != target_has_frontmatter:
-            errors.append("Front matter 불일치")
+        source_images = [path for path, _ in source.images]
+        target_images = [path for path, _ in target.images]
+        missing_images = set(source_images) - set(target_images)
         
         # 심각한 오류가 없으면 성공
         is_valid = len(errors) == 0
@@ -117,24 +115,33 @@ def validate_single_file(
                 "target_path": target_path,
                 "errors": errors,
                 "warnings": warnings,
+                "block_diffs": [diff.to_dict() for diff in block_diffs[:MAX_BLOCK_DIFFS]],
                 "checks": {
-                    "headers": len(source_headers) == len(target_headers),
-                    "code_blocks": source_code_blocks == target_code_blocks,
-                    "shortcodes": len(source_shortcodes) == len(target_shortcodes),
-                    "links": len(source_links) == len(target_links),
+                    "headers": source.heading_levels == target.heading_levels,
+                    "code_blocks": len(source.fences) == len(target.fences) and not target.unclosed_fences,
+                    "shortcodes": source.shortcode_sequence == target.shortcode_sequence
+                    and not target.unclosed_shortcodes and not target.stray_shortcodes,
+                    "links": len(source.links) == len(target.links),
                     "images": len(missing_images) == 0,
-                    "frontmatter": source_has_frontmatter == target_has_frontmatter,
+                    "frontmatter": source.has_front_matter == target.has_front_matter
+                    and (target.front_matter is None or target.front_matter[1] is not None),
+                    "blocks": not block_diffs,
                 },
                 "stats": {
-                    "source_headers": len(source_headers),
-                    "target_headers": len(target_headers),
-                    "source_code_blocks": source_code_blocks // 2,
-                    "target_code_blocks": target_code_blocks // 2,
-                    "source_links": len(source_links),
-                    "target_links": len(target_links),
+                    "source_headers": len(source.headings),
+                    "target_headers": len(target.headings),
+                    "source_code_blocks": len(source.fences),
+                    "target_code_blocks": len(target.fences),
+                    "source_shortcodes": len(source.shortcodes),
+                    "target_shortcodes": len(target.shortcodes),
+                    "source_links": len(source.links),
+                    "target_links": len(target.links),
                     "source_images": len(source_images),
                     "target_images": len(target_images),
-                }
+                    "source_blocks": len(source.blocks),
+                    "target_blocks": len(target.blocks),
+                },
+                **repair,
             }
         )
         
@@ -148,3 +155,107 @@ def validate_single_file(
                 "target_path": target_path,
             }
         )
+
+
+def check_structure(
+    source: MarkdownStructure,
+    target_content: str,
+) -> Tuple[MarkdownStructure, List[str], List[str], List[BlockDiff]]:
+    """
+    번역 내용을 스캔하여 원본 구조 지문과 비교
+    
+    블록 단위 정렬로 차이 위치를 확인하여 오류가 있으면 오류 메시지에, 없으면 경고에 위치를 추가합니다.
+    
+    Returns:
+        Tuple: (번역본 구조 지문, 오류 목록, 경고 목록, 블록 차이 목록)
+    """
+    target = scan_structure(target_content)
+    errors, warnings = compare_structures(source, target)
+    block_diffs = align_blocks(source.blocks, target.blocks)
+    if block_diffs:
+        (errors if errors else warnings).append(describe_block_diffs(block_diffs))
+    return target, errors, warnings, block_diffs
+
+
+def compare_structures(source: MarkdownStructure, target: MarkdownStructure) -> Tuple[List[str], List[str]]:
+    """
+    원본과 번역본의 구조 지문 비교
+    
+    Args:
+        source: 원본 구조 지문
+        target: 번역본 구조 지문
+    
+    Returns:
+        Tuple[List[str], List[str]]: (오류 목록, 경고 목록)
+    """
+    errors = []
+    warnings = []
+    
+    # 1. 헤더 구조 (레벨 순서까지 비교)
+    if len(source.headings) != len(target.headings):
+        warnings.append(f"헤더 수 불일치: 원본 {len(source.headings)}개, 번역 {len(target.headings)}개")
+    elif source.heading_levels != target.heading_levels:
+        warnings.append("헤더 레벨 불일치")
+    
+    # 2. 코드 블록 (펜스 짝 기준)
+    if len(source.fences) != len(target.fences):
+        errors.append(f"코드 블록 수 불일치: 원본 {len(source.fences)}개, 번역 {len(target.fences)}개")
+    if len(target.unclosed_fences) > len(source.unclosed_fences):
+        lines = ", ".join(str(fence.start_line + 1) for fence in target.unclosed_fences)
+        errors.append(f"닫히지 않은 코드 블록: 번역 {lines}번째 줄")
+    
+    # 3. Hugo shortcode (열림/닫힘 순서와 짝)
+    if len(source.shortcodes) != len(target.shortcodes):
+        errors.append(f"Hugo shortcode 수 불일치: 원본 {len(source.shortcodes)}개, 번역 {len(target.shortcodes)}개")
+    elif source.shortcode_sequence != target.shortcode_sequence:
+        errors.append("Hugo shortcode 순서 불일치")
+    unbalanced = target.unclosed_shortcodes + target.stray_shortcodes
+    if len(unbalanced) > len(source.unclosed_shortcodes) + len(source.stray_shortcodes):
+        details = ", ".join(f"{shortcode.name}({shortcode.start_line + 1}번째 줄)" for shortcode in unbalanced)
+        errors.append(f"짝이 맞지 않는 Hugo shortcode: {details}")
+    
+    # 4. 링크
+    if len(source.links) != len(target.links):
+        warnings.append(f"링크 수 불일치: 원본 {len(source.links)}개, 번역 {len(target.links)}개")
+    
+    # 5. 이미지 참조 (경로가 그대로 유지되었는지)
+    missing_images = set(path for path, _ in source.images) - set(path for path, _ in target.images)
+    if missing_images:
+        errors.append(f"누락된 이미지 참조: {', '.join(sorted(missing_images))}")
+    
+    # 6. Front matter (구분자와 최상위 키)
+    if source.has_front_matter != target.has_front_matter:
+        errors.append("Front matter 불일치")
+    elif target.front_matter is not None and target.front_matter[1] is None:
+        errors.append("Front matter가 닫히지 않았습니다")
+    missing_keys = [key for key in source.front_matter_keys if key not in target.front_matter_keys]
+    if target.has_front_matter and missing_keys:
+        warnings.append(f"Front matter 키 누락: {', '.join(missing_keys)}")
+    
+    return errors, warnings
+
+
+def describe_block_diffs(block_diffs: List[BlockDiff]) -> str:
+    """
+    블록 차이 요약 메시지
+    
+    예: "구조 차이 2곳: 원본 블록 #5 fence(40-52줄) 누락; 번역 블록 #9 shortcode(61줄) 추가됨"
+    """
+    shown = "; ".join(diff.describe() for diff in block_diffs[:MAX_BLOCK_DIFFS_IN_MESSAGE])
+    more = len(block_diffs) - MAX_BLOCK_DIFFS_IN_MESSAGE
+    return f"구조 차이 {len(block_diffs)}곳: {shown}" + (f" 외 {more}곳" if more > 0 else "")
+
+
+async def validate_single_file_async(
+    source_path: str,
+    target_path: str,
+    target_lang: str,
+    source_lang: str = "en"
+) -> TaskResult:
+    """
+    validate_single_file의 비동기 버전 (Stateless Worker)
+    
+    구조 검증은 모델 호출이 없지만 파일 읽기와 파싱이 이벤트 루프를 막지 않도록
+    executor 스레드에서 실행합니다 (같은 루프의 다른 세션이 멈추지 않음).
+    """
+    return await asyncio.to_thread(validate_single_file, source_path, target_path, target_lang, source_lang)
@@ -7,12 +7,77 @@ Command-line interface for running the workshop translator locally
 import sys
 import argparse
 
-# Local execution
-from main import run_cli
+
+def build_run_parser() -> argparse.ArgumentParser:
+    """Parser for the headless `run` command"""
+    parser = argparse.ArgumentParser(
+        prog="wstranslator run",
+        description="Run analyze → translate → review → validate without the interactive orchestrator",
+    )
+    parser.add_argument(
+        '--workshop',
+        required=True,
+        help='Workshop directory path'
+    )
+    parser.add_argument(
+        '--lang',
+        required=True,
+        help='Target language code(s), comma separated (e.g. ko or ko,ja)'
+    )
+    parser.add_argument(
+        '--source-lang',
+        default=None,
+        help='Source language code (auto-detected if omitted)'
+    )
+    parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        default=None,
+        help='Upper bound on concurrent workers (adaptive if omitted)'
+    )
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=1,
+        help='Retry rounds for failed tasks (default: 1)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=['thread', 'async'],
+        default='thread',
+        help='Worker engine: thread pool or asyncio event loop (default: thread)'
+    )
+    parser.add_argument(
+        '--force-reset',
+        action='store_true',
+        help='Ignore existing translation/tasks.md and start over'
+    )
+    return parser
+
+
+def run_command(argv) -> int:
+    """Headless pipeline entry point, returns the process exit code"""
+    args = build_run_parser().parse_args(argv)
+    languages = [lang.strip() for lang in args.lang.split(",") if lang.strip()]
+
+    from agents.runner import run_headless
+    return run_headless(
+        args.workshop,
+        languages,
+        source_lang=args.source_lang,
+        max_concurrent=args.max_concurrent,
+        retries=args.retries,
+        force_reset=args.force_reset,
+        engine=args.engine,
+    )
 
 
 def main():
     """CLI main entry point"""
+    # Headless mode: wstranslator run --workshop PATH --lang ko[,ja]
+    if len(sys.argv) > 1 and sys.argv[1] == "run":
+        sys.exit(run_command(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description="Workshop Translator - AI-powered workshop document translation agent",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -20,9 +85,9 @@ def main():
 Examples:
   # Interactive mode
   wstranslator
-  
-  # Single query
-  wstranslator "analyze workshop"
+
+  # Headless pipeline (no orchestrator conversation, exit code 0 when all tasks complete)
+  wstranslator run --workshop ./my-workshop --lang ko,ja
 
 Notes:
   - Requires Amazon Bedrock model access permissions
@@ -30,23 +95,24 @@ Notes:
   - See cli_remote_backup.py for remote mode
         """
     )
-    
+
     parser.add_argument(
         'prompt',
         type=str,
         nargs='?',
         help='Single query prompt (interactive mode if omitted)'
     )
-    
+
     args = parser.parse_args()
-    
+
     # Single query mode
     if args.prompt:
         print(f"\n⚠️  Single query mode is not yet implemented.")
-        print(f"Please use interactive mode: wstranslator\n")
+        print(f"Please use interactive mode (wstranslator) or headless mode (wstranslator run).\n")
         sys.exit(1)
-    
-    # Run interactive mode
+
+    # Run interactive mode (local execution)
+    from main import run_cli
     run_cli()
 
 
@@ -24,12 +24,16 @@ from agents.orchestrator import (
     run_translation_phase,
     run_review_phase,
     run_validate_phase,
+    run_pipeline,
     run_preview_phase,
     stop_preview,
     get_workflow_status,
     retry_failed_tasks,
     check_phase_completion,
+    PROGRESS_EVENT,
 )
+from agents.scheduler import configure_loop_executor
+from task_manager.manager import set_current_session
 
 # BedrockAgentCoreApp instance
 app = BedrockAgentCoreApp()
@@ -42,9 +46,15 @@ REGION = os.getenv("AWS_REGION", "us-west-2")
 @app.entrypoint
 async def invoke(payload, context):
     """Agent invocation entry point"""
-    session_id = getattr(context, 'session_id', 'default')
+    session_id = getattr(context, 'session_id', None)
     prompt = payload.get("prompt", "")
     
+    # 이 요청에서 호출되는 Orchestrator 도구가 세션 전용 TaskManager를 사용하도록 설정
+    set_current_session(session_id)
+    
+    # 여러 세션이 같은 이벤트 루프를 공유하므로 모델 스트림용 스레드를 동시성 상한만큼 확보
+    configure_loop_executor()
+    
     # Conversation Manager setup
     conversation_manager = SummarizingConversationManager(
         summary_ratio=0.3,
@@ -69,6 +79,7 @@ async def invoke(payload, context):
             run_translation_phase,    # Run translation phase
             run_review_phase,         # Run review phase
             run_validate_phase,       # Run validation phase
+            run_pipeline,             # Run translate → review → validate pipeline
             run_preview_phase,        # Run local preview
             stop_preview,             # Stop preview
             get_workflow_status,      # Get status
@@ -87,6 +98,11 @@ async def invoke(payload, context):
             tool_use = event["current_tool_use"]
             tool_name = tool_use.get("name", "unknown")
             log.info(f"Tool call: {tool_name}")
+        elif "tool_stream_event" in event:
+            # Phase 도구의 태스크별 진행 이벤트를 클라이언트로 전달
+            data = event["tool_stream_event"].get("data")
+            if isinstance(data, dict) and data.get("event") == PROGRESS_EVENT:
+                yield {"progress": data}
 
 
 def sanitize_input(text: str) -> str:
@@ -140,6 +156,8 @@ TOOL_COLORS = {
     "run_review_phase": Colors.YELLOW,
     # Validation - cyan
     "run_validate_phase": Colors.CYAN,
+    # Pipeline (all phases) - green
+    "run_pipeline": Colors.GREEN,
     # Preview - green (bright)
     "run_preview_phase": Colors.GREEN,
     "stop_preview": Colors.RED,
@@ -197,6 +215,17 @@ def tool_callback_handler(**kwargs):
                 else:
                     print_tool_start(tool_name, tool_input)
     
+    # Phase tool progress (tool stream event)
+    if "tool_stream_event" in kwargs:
+        data = kwargs["tool_stream_event"].get("data")
+        if isinstance(data, dict) and data.get("event") == PROGRESS_EVENT:
+            status = f"{Colors.GREEN}✓{Colors.RESET}" if data["success"] else f"{Colors.RED}✗{Colors.RESET}"
+            print(
+                f"{Colors.DIM}   {data['completed']}/{data['total']}{Colors.RESET} {status} "
+                f"{Colors.DIM}{data['task_type']:<9} {data['path']}{Colors.RESET}",
+                flush=True
+            )
+    
     # Text output (data event)
     if "data" in kwargs:
         print(kwargs["data"], end="", flush=True)
@@ -241,6 +270,7 @@ def run_cli():
             run_translation_phase,
             run_review_phase,
             run_validate_phase,
+            run_pipeline,
             run_preview_phase,
             stop_preview,
             get_workflow_status,
@@ -5,8 +5,15 @@ from .load import (
     load_opus,
     load_sonnet,
     load_haiku,
+    load_worker_model,
+    configure_model_concurrency,
+    clear_model_cache,
     MODELS,
 )
+from .invoke import converse, converse_async, invoke_agent, invoke_agent_async, ModelResponse
+from .concurrency import AdaptiveConcurrencyController, get_concurrency_controller
+from .rate_limit import get_rate_limiter, get_rate_limit_status, rate_limited
+from .retry import call_with_retry, classify_error, CircuitOpenError
 
 __all__ = [
     "load_model",
@@ -14,5 +21,21 @@ __all__ = [
     "load_opus",
     "load_sonnet",
     "load_haiku",
+    "load_worker_model",
+    "configure_model_concurrency",
+    "clear_model_cache",
     "MODELS",
+    "converse",
+    "converse_async",
+    "invoke_agent",
+    "invoke_agent_async",
+    "ModelResponse",
+    "AdaptiveConcurrencyController",
+    "get_concurrency_controller",
+    "get_rate_limiter",
+    "get_rate_limit_status",
+    "rate_limited",
+    "call_with_retry",
+    "classify_error",
+    "CircuitOpenError",
 ]
@@ -0,0 +1,271 @@
+# 적응형 동시성 제어 (AIMD)
+# 모든 워커의 모델 호출이 하나의 제어기를 공유하며, 계정 할당량에 맞춰 동시 요청 수를 조절
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Deque, Optional
+
+# 동시 요청 수 설정 (초기값, 하한, 상한)
+INITIAL_CONCURRENCY = int(os.getenv("WSTRANSLATOR_CONCURRENCY_INITIAL", "5"))
+MIN_CONCURRENCY = int(os.getenv("WSTRANSLATOR_CONCURRENCY_MIN", "1"))
+MAX_CONCURRENCY = int(os.getenv("WSTRANSLATOR_CONCURRENCY_MAX", "32"))
+
+# p95 지연 판단 설정 (표본 수, 기준 대비 허용 배율)
+LATENCY_WINDOW = 20
+LATENCY_TOLERANCE = 2.0
+
+# 스로틀링으로 판단하는 예외 (boto3 ClientError 코드 또는 예외 클래스 이름)
+THROTTLING_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceQuotaExceededException",
+    "ModelThrottledException",
+}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """스로틀링(할당량 초과) 예외인지 확인"""
+    if type(error).__name__ in THROTTLING_CODES:
+        return True
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code") in THROTTLING_CODES
+    return False
+
+
+class _AsyncWaiter:
+    """슬롯을 기다리는 코루틴 (release 시 도착 순서대로 슬롯을 넘겨받음, 내부 클래스)"""
+
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future: asyncio.Future = loop.create_future()
+        self.granted = False
+
+
+def _resolve_waiter(future: asyncio.Future, started: float):
+    if not future.done():
+        future.set_result(started)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD 동시성 제어기
+
+    - 정상 응답: 현재 한도만큼 성공할 때마다 한도 +1 (additive increase)
+    - 스로틀링 또는 p95 지연 급증: 한도 × 0.5 (multiplicative decrease)
+
+    감소 직전에 시작된 요청들의 스로틀링이 연달아 도착해도 한 번만 줄이도록,
+    마지막 감소 이후에 시작된 요청의 신호만 반영합니다.
+
+    비동기 대기자는 FIFO 큐에 들어가고, 슬롯이 반환되거나 한도가 바뀔 때 도착 순서대로
+    슬롯을 직접 넘겨받습니다 (폴링 없음). 스레드 대기자는 비동기 대기자가 없을 때만 슬롯을 가져갑니다.
+    """
+
+    def __init__(
+        self,
+        initial: int = INITIAL_CONCURRENCY,
+        min_limit: int = MIN_CONCURRENCY,
+        max_limit: int = MAX_CONCURRENCY,
+        decrease_factor: float = 0.5,
+    ):
+        self._min = max(1, min_limit)
+        self._max = max(self._min, max_limit)
+        self._limit = float(min(max(initial, self._min), self._max))
+        self._decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._async_waiters: Deque[_AsyncWaiter] = deque()
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._baseline_p95: Optional[float] = None
+        self._last_p95: Optional[float] = None
+        self._last_decrease = 0.0
+        self._throttled = 0
+        self._completed = 0
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도"""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """동시 요청 한도 상한"""
+        return self._max
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """
+        요청 슬롯 획득 (한도에 도달했으면 빈 슬롯이 생길 때까지 대기)
+
+        Returns:
+            float: 요청 시작 시각 (release에 전달)
+        """
+        with self._cond:
+            while self._in_flight >= int(self._limit) or self._async_waiters:
+                self._cond.wait()
+            self._in_flight += 1
+            return time.monotonic()
+
+    def try_acquire(self) -> Optional[float]:
+        """대기 없이 슬롯 획득 시도 (실패하면 None)"""
+        with self._cond:
+            if self._in_flight >= int(self._limit) or self._async_waiters:
+                return None
+            self._in_flight += 1
+            return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        """
+        acquire의 비동기 버전 (이벤트 루프를 막지 않고 빈 슬롯을 기다림)
+
+        빈 슬롯이 없으면 FIFO 큐에서 기다리다가 release가 넘겨준 슬롯을 받습니다.
+        대기 중 취소되면 큐에서 빠지고, 이미 넘겨받은 슬롯은 다음 대기자에게 돌려줍니다.
+        """
+        with self._cond:
+            if self._in_flight < int(self._limit) and not self._async_waiters:
+                self._in_flight += 1
+                return time.monotonic()
+            waiter = _AsyncWaiter(asyncio.get_running_loop())
+            self._async_waiters.append(waiter)
+
+        try:
+            return await waiter.future
+        except BaseException:
+            with self._cond:
+                if waiter.granted:
+                    self._in_flight -= 1
+                    self._grant_async_waiters()
+                    self._cond.notify_all()
+                else:
+                    self._async_waiters.remove(waiter)
+                    self._cond.notify_all()
+            raise
+
+    def release(self, started: float, throttled: bool = False, failed: bool = False):
+        """
+        요청 슬롯 반환 및 결과 반영
+
+        Args:
+            started: acquire가 반환한 시작 시각
+            throttled: 스로틀링으로 실패했는지 여부
+            failed: 스로틀링 외 오류로 실패했는지 여부 (한도 증가 없이 반환만)
+        """
+        latency = time.monotonic() - started
+        with self._cond:
+            self._in_flight -= 1
+            self._completed += 1
+            if throttled:
+                self._throttled += 1
+                self._decrease(started)
+            elif not failed:
+                self._latencies.append(latency)
+                if self._latency_degraded():
+                    self._decrease(started)
+                else:
+                    self._limit = min(self._max, self._limit + 1.0 / max(self._limit, 1.0))
+            self._grant_async_waiters()
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        모델 호출 한 번을 감싸는 컨텍스트 매니저
+
+        with controller.slot():
+            response = client.converse(...)
+        """
+        started = self.acquire()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started, throttled=is_throttling_error(e), failed=True)
+            raise
+        self.release(started)
+
+    @asynccontextmanager
+    async def async_slot(self):
+        """slot의 비동기 버전"""
+        started = await self.acquire_async()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started, throttled=is_throttling_error(e), failed=True)
+            raise
+        self.release(started)
+
+    def snapshot(self) -> dict:
+        """상태 출력용 현재 값"""
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "async_waiters": len(self._async_waiters),
+                "min": self._min,
+                "max": self._max,
+                "p95_seconds": round(self._last_p95, 2) if self._last_p95 is not None else None,
+                "throttled": self._throttled,
+                "completed": self._completed,
+            }
+
+    def _grant_async_waiters(self):
+        """빈 슬롯을 비동기 대기자에게 도착 순서대로 넘김 (락 보유 상태에서 호출, 내부 함수)"""
+        while self._async_waiters and self._in_flight < int(self._limit):
+            waiter = self._async_waiters.popleft()
+            if waiter.future.done():
+                continue
+            started = time.monotonic()
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve_waiter, waiter.future, started)
+            except RuntimeError:
+                continue  # 이벤트 루프가 이미 닫힘
+            waiter.granted = True
+            self._in_flight += 1
+
+    def _decrease(self, started: float):
+        """한도 감소 (락 보유 상태에서 호출, 내부 함수)"""
+        if started < self._last_decrease:
+            return
+        self._limit = max(float(self._min), self._limit * self._decrease_factor)
+        self._last_decrease = time.monotonic()
+        self._latencies.clear()
+
+    def _p95(self) -> float:
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def _latency_degraded(self) -> bool:
+        """
+        표본이 가득 찰 때마다 p95를 기준값과 비교 (내부 함수)
+
+        기준값은 정상 구간의 p95 이동 평균이며, 허용 배율을 넘으면 지연 급증으로 판단합니다.
+        """
+        if len(self._latencies) < LATENCY_WINDOW:
+            return False
+        p95 = self._p95()
+        self._last_p95 = p95
+        self._latencies.clear()
+        if self._baseline_p95 is None:
+            self._baseline_p95 = p95
+            return False
+        if p95 > self._baseline_p95 * LATENCY_TOLERANCE:
+            return True
+        self._baseline_p95 = 0.8 * self._baseline_p95 + 0.2 * p95
+        return False
+
+
+# 프로세스 전역 제어기 (모든 워커와 Phase가 공유)
+_controller = AdaptiveConcurrencyController()
+
+
+def get_concurrency_controller() -> AdaptiveConcurrencyController:
+    """공유 동시성 제어기 반환"""
+    return _controller
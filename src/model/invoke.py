@@ -0,0 +1,198 @@
+# 직접 모델 호출 모듈
+# 도구가 필요 없는 단일 요청(번역 등)은 Agent 루프 없이 Bedrock Converse API를 바로 호출
+
+from dataclasses import dataclass
+from typing import Optional
+
+from strands import Agent
+from strands.models import BedrockModel
+
+from tools.markdown_blocks import estimate_tokens
+
+from .concurrency import get_concurrency_controller
+from .rate_limit import rate_limited, rate_limited_async
+from .retry import call_with_retry, call_with_retry_async
+
+
+@dataclass
+class ModelResponse:
+    """Converse API 응답 요약"""
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    stop_reason: str = ""
+
+
+def converse(
+    model: BedrockModel,
+    system_prompt: str,
+    prompt: str,
+    max_tokens: Optional[int] = None
+) -> ModelResponse:
+    """
+    시스템 프롬프트와 사용자 메시지 하나로 모델을 한 번 호출합니다.
+
+    Agent와 달리 도구 스키마를 보내지 않으므로 요청이 작고,
+    도구 사용으로 인한 추가 턴이 생기지 않습니다.
+    registry의 BedrockModel이 가진 boto3 클라이언트(연결 풀)를 그대로 사용하며,
+    모델별 RPM/TPM 예약 후 공유 동시성 제어기의 슬롯 안에서 호출하며,
+    일시적 오류(스로틀링/타임아웃/5xx)는 백오프 후 재시도합니다.
+
+    Args:
+        model: load_model()로 얻은 Bedrock 모델
+        system_prompt: 시스템 프롬프트
+        prompt: 사용자 메시지
+        max_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
+
+    Returns:
+        ModelResponse: 응답 텍스트와 토큰 사용량
+    """
+    model_id = model.get_config()["model_id"]
+    request = {
+        "modelId": model_id,
+        "system": [{"text": system_prompt}],
+        "messages": [{"role": "user", "content": [{"text": prompt}]}],
+    }
+    if max_tokens:
+        request["inferenceConfig"] = {"maxTokens": max_tokens}
+
+    estimated = _estimate_request_tokens(system_prompt, prompt, max_tokens)
+
+    def call_once() -> ModelResponse:
+        with rate_limited(model_id, estimated) as reservation:
+            with get_concurrency_controller().slot():
+                response = model.client.converse(**request)
+
+            content = response.get("output", {}).get("message", {}).get("content", [])
+            usage = response.get("usage", {})
+            result = ModelResponse(
+                text="".join(block.get("text", "") for block in content),
+                input_tokens=usage.get("inputTokens", 0),
+                output_tokens=usage.get("outputTokens", 0),
+                stop_reason=response.get("stopReason", ""),
+            )
+            reservation.actual_tokens = result.input_tokens + result.output_tokens
+        return result
+
+    return call_with_retry(model_id, call_once)
+
+
+def invoke_agent(agent: Agent, prompt: str) -> str:
+    """
+    도구가 필요한 Agent 실행을 모델별 속도 제한과 공유 동시성 제어기 안에서 수행합니다.
+
+    도구 루프로 여러 번 요청한 경우 실행 후 실제 요청 수/토큰 사용량으로 정산합니다.
+    일시적 오류로 재시도할 때는 실패한 시도의 대화 기록을 되돌린 뒤 다시 실행합니다.
+
+    Args:
+        agent: 실행할 Strands Agent
+        prompt: 사용자 메시지
+
+    Returns:
+        str: Agent 최종 응답 텍스트
+    """
+    model_id = agent.model.get_config()["model_id"]
+    estimated = _estimate_request_tokens(agent.system_prompt or "", prompt)
+    history = list(agent.messages)
+
+    def call_once() -> str:
+        with rate_limited(model_id, estimated) as reservation:
+            try:
+                with get_concurrency_controller().slot():
+                    result = agent(prompt)
+            except Exception:
+                agent.messages[:] = history
+                raise
+
+            metrics = getattr(result, "metrics", None)
+            usage = getattr(metrics, "accumulated_usage", None) or {}
+            if usage:
+                reservation.actual_tokens = usage.get("inputTokens", 0) + usage.get("outputTokens", 0)
+            reservation.actual_requests = getattr(metrics, "cycle_count", 1) or 1
+        return str(result)
+
+    return call_with_retry(model_id, call_once)
+
+
+async def converse_async(model: BedrockModel, system_prompt: str, prompt: str) -> ModelResponse:
+    """
+    converse의 비동기 버전 (BedrockModel.stream 사용)
+
+    속도 제한/동시성 슬롯/백오프 대기를 모두 코루틴으로 기다리므로, 대기 중인 요청이
+    스레드를 점유하지 않습니다. 최대 출력 토큰 수는 load_model(max_tokens=...)로 지정합니다.
+
+    Args:
+        model: load_model()로 얻은 Bedrock 모델
+        system_prompt: 시스템 프롬프트
+        prompt: 사용자 메시지
+
+    Returns:
+        ModelResponse: 응답 텍스트와 토큰 사용량
+    """
+    config = model.get_config()
+    model_id = config["model_id"]
+    estimated = _estimate_request_tokens(system_prompt, prompt, config.get("max_tokens"))
+    messages = [{"role": "user", "content": [{"text": prompt}]}]
+
+    async def call_once() -> ModelResponse:
+        async with rate_limited_async(model_id, estimated) as reservation:
+            text_parts = []
+            usage = {}
+            stop_reason = ""
+            async with get_concurrency_controller().async_slot():
+                async for event in model.stream(messages, None, system_prompt):
+                    if "contentBlockDelta" in event:
+                        text_parts.append(event["contentBlockDelta"].get("delta", {}).get("text", ""))
+                    elif "messageStop" in event:
+                        stop_reason = event["messageStop"].get("stopReason", "")
+                    elif "metadata" in event:
+                        usage = event["metadata"].get("usage", {})
+
+            result = ModelResponse(
+                text="".join(text_parts),
+                input_tokens=usage.get("inputTokens", 0),
+                output_tokens=usage.get("outputTokens", 0),
+                stop_reason=stop_reason,
+            )
+            reservation.actual_tokens = result.input_tokens + result.output_tokens
+        return result
+
+    return await call_with_retry_async(model_id, call_once)
+
+
+async def invoke_agent_async(agent: Agent, prompt: str) -> str:
+    """invoke_agent의 비동기 버전 (Agent.invoke_async 사용)"""
+    model_id = agent.model.get_config()["model_id"]
+    estimated = _estimate_request_tokens(agent.system_prompt or "", prompt)
+    history = list(agent.messages)
+
+    async def call_once() -> str:
+        async with rate_limited_async(model_id, estimated) as reservation:
+            try:
+                async with get_concurrency_controller().async_slot():
+                    result = await agent.invoke_async(prompt)
+            except Exception:
+                agent.messages[:] = history
+                raise
+
+            metrics = getattr(result, "metrics", None)
+            usage = getattr(metrics, "accumulated_usage", None) or {}
+            if usage:
+                reservation.actual_tokens = usage.get("inputTokens", 0) + usage.get("outputTokens", 0)
+            reservation.actual_requests = getattr(metrics, "cycle_count", 1) or 1
+        return str(result)
+
+    return await call_with_retry_async(model_id, call_once)
+
+
+def _estimate_request_tokens(system_prompt: str, prompt: str, max_tokens: Optional[int] = None) -> int:
+    """
+    호출 전 예상 토큰 수 (입력 + 예상 출력, 내부 함수)
+
+    출력은 입력 본문과 비슷한 길이로 가정하되 max_tokens를 넘지 않게 잡습니다.
+    """
+    input_tokens = estimate_tokens(system_prompt) + estimate_tokens(prompt)
+    output_tokens = estimate_tokens(prompt)
+    if max_tokens:
+        output_tokens = min(output_tokens, max_tokens)
+    return input_tokens + output_tokens
@@ -1,5 +1,11 @@
 # 다중 모델 로드 모듈
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from botocore.config import Config
 from strands.models import BedrockModel
+from strands.types.exceptions import ModelThrottledException
 
 # 모델 ID 정의 (Global Inference Profile 사용)
 # https://docs.aws.amazon.com/bedrock/latest/userguide/inference-profiles-support.html
@@ -15,29 +21,111 @@ MODELS = {
 # 기본 모델 (Sonnet)
 DEFAULT_MODEL = "sonnet"
 
+# HTTP 연결 풀 최소 크기 (botocore 기본값 10)
+# 환경 변수로 지정하면 동시 실행 수와 관계없이 이 값 이상을 유지
+MIN_POOL_CONNECTIONS = int(os.environ.get("WSTRANSLATOR_MODEL_POOL_CONNECTIONS", "10"))
+
+# 프로세스 전역 모델 클라이언트 레지스트리 ((모델 ID, 최대 출력 토큰, 워커용 여부) → BedrockModel)
+# 모든 워커와 Phase가 같은 boto3 클라이언트(연결 풀)를 공유하여
+# 파일마다 클라이언트 생성과 TLS 연결 수립을 반복하지 않음
+_models: Dict[Tuple[str, Optional[int], bool], BedrockModel] = {}
+_models_lock = threading.Lock()
+_pool_connections = MIN_POOL_CONNECTIONS
+
+# 워커용 클라이언트는 botocore 자체 재시도를 끔 (재시도는 model/retry.py의 call_with_retry 한 곳에서만
+# 수행하여 AIMD 제어기, 오류 분류, 서킷 브레이커가 첫 스로틀링부터 바로 반응하도록 함)
+# call_with_retry로 감싸지 않는 Orchestrator/Designer 등의 클라이언트는 botocore 기본 재시도 유지
+WORKER_BOTO_RETRIES = {"max_attempts": 1, "mode": "standard"}
+
+
+class _WorkerBedrockModel(BedrockModel):
+    """
+    Strands Agent 루프의 스로틀링 재시도를 건너뛰는 모델 (워커 전용, 내부 클래스)
+
+    Agent 루프는 ModelThrottledException만 자체 재시도하므로, 원래 botocore 오류로 바꿔 올려
+    바로 전파되게 합니다. 재시도는 invoke_agent의 call_with_retry가 스로틀링으로 분류하여 수행합니다.
+    """
+
+    async def stream(self, *args, **kwargs):
+        try:
+            async for event in super().stream(*args, **kwargs):
+                yield event
+        except ModelThrottledException as e:
+            if e.__cause__ is not None:
+                raise e.__cause__ from None
+            raise
+
+
+def configure_model_concurrency(concurrency: int) -> int:
+    """
+    동시 모델 호출 수에 맞게 연결 풀 크기를 설정합니다.
+
+    풀은 커지기만 하며, 커지면 캐시된 클라이언트를 버려 다음 로드부터
+    큰 풀로 다시 생성합니다. 이미 진행 중인 호출은 기존 클라이언트로 끝까지 진행됩니다.
+
+    Args:
+        concurrency: 예상 최대 동시 모델 호출 수
+
+    Returns:
+        int: 적용된 연결 풀 크기
+    """
+    global _pool_connections
+    with _models_lock:
+        if concurrency > _pool_connections:
+            _pool_connections = concurrency
+            _models.clear()
+        return _pool_connections
+
+
+def clear_model_cache():
+    """캐시된 모델 클라이언트를 모두 버립니다. (자격 증명 갱신 등)"""
+    with _models_lock:
+        _models.clear()
+
+
+def _get_or_create_model(model_id: str, max_tokens: Optional[int] = None, worker: bool = False) -> BedrockModel:
+    """레지스트리에서 모델 클라이언트를 찾고, 없으면 생성하여 등록 (내부 함수)"""
+    key = (model_id, max_tokens, worker)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            config = {"max_tokens": max_tokens} if max_tokens else {}
+            if worker:
+                model_class = _WorkerBedrockModel
+                client_config = Config(max_pool_connections=_pool_connections, retries=WORKER_BOTO_RETRIES)
+            else:
+                model_class = BedrockModel
+                client_config = Config(max_pool_connections=_pool_connections)
+            model = model_class(model_id=model_id, boto_client_config=client_config, **config)
+            _models[key] = model
+        return model
+
 
-def load_model(model_id: str = None) -> BedrockModel:
+def load_model(model_id: str = None, max_tokens: Optional[int] = None) -> BedrockModel:
     """
     Bedrock 모델 클라이언트를 반환합니다.
     IAM 인증은 실행 역할을 통해 자동으로 처리됩니다.
+    같은 모델 ID는 프로세스 전체에서 하나의 클라이언트를 공유합니다. (스레드 안전)
     
     Args:
         model_id: 모델 ID (None이면 기본 Sonnet 사용)
+        max_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
     
     Returns:
         BedrockModel: Bedrock 모델 클라이언트
     """
     if model_id is None:
         model_id = MODELS[DEFAULT_MODEL]
-    return BedrockModel(model_id=model_id)
+    return _get_or_create_model(model_id, max_tokens)
 
 
-def load_model_by_type(model_type: str) -> BedrockModel:
+def load_model_by_type(model_type: str, max_tokens: Optional[int] = None) -> BedrockModel:
     """
     모델 타입으로 Bedrock 모델 클라이언트를 반환합니다.
     
     Args:
         model_type: 모델 타입 ("opus", "sonnet", "haiku")
+        max_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
     
     Returns:
         BedrockModel: Bedrock 모델 클라이언트
@@ -47,7 +135,27 @@ def load_model_by_type(model_type: str) -> BedrockModel:
     """
     if model_type not in MODELS:
         raise ValueError(f"지원하지 않는 모델 타입: {model_type}. 사용 가능: {list(MODELS.keys())}")
-    return BedrockModel(model_id=MODELS[model_type])
+    return _get_or_create_model(MODELS[model_type], max_tokens)
+
+
+def load_worker_model(model_type: str = DEFAULT_MODEL, max_tokens: Optional[int] = None) -> BedrockModel:
+    """
+    워커용 모델 클라이언트를 반환합니다.
+
+    converse/invoke_agent 등 call_with_retry로 감싸 호출하는 경우에만 사용합니다. botocore 재시도를 끄고
+    스로틀링을 Agent 루프에서 재시도하지 않고 바로 올려, 재시도와 동시성 조절이 call_with_retry
+    한 곳에서 이루어지게 합니다.
+
+    Args:
+        model_type: 모델 타입 ("opus", "sonnet", "haiku")
+        max_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
+
+    Returns:
+        BedrockModel: Bedrock 모델 클라이언트
+    """
+    if model_type not in MODELS:
+        raise ValueError(f"지원하지 않는 모델 타입: {model_type}. 사용 가능: {list(MODELS.keys())}")
+    return _get_or_create_model(MODELS[model_type], max_tokens, worker=True)
 
 
 def load_opus() -> BedrockModel:
@@ -0,0 +1,247 @@
+# 모델별 요청 속도 제한 (Token Bucket)
+# Bedrock의 분당 요청 수(RPM)/분당 토큰 수(TPM) 할당량을 모델 ID별로 추적하여
+# 할당량을 넘기 전에 호출자를 대기시킴 (실패 후 재시도 대신 사전 대기)
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from .load import MODELS
+
+# 모델 타입별 기본 할당량 (RPM, TPM) - 계정 할당량에 맞게 환경 변수로 조정
+# 예: WSTRANSLATOR_SONNET_RPM=400, WSTRANSLATOR_SONNET_TPM=800000
+DEFAULT_QUOTAS = {
+    "opus": (100, 200_000),
+    "sonnet": (200, 400_000),
+    "haiku": (400, 800_000),
+}
+
+# 알 수 없는 모델 ID의 기본 할당량
+FALLBACK_QUOTA = (100, 200_000)
+
+
+def _quota_for(model_id: str) -> Tuple[int, int]:
+    """모델 ID의 (RPM, TPM) 할당량 (환경 변수 우선)"""
+    for model_type, known_id in MODELS.items():
+        if known_id == model_id:
+            rpm, tpm = DEFAULT_QUOTAS.get(model_type, FALLBACK_QUOTA)
+            prefix = f"WSTRANSLATOR_{model_type.upper()}"
+            return (
+                int(os.getenv(f"{prefix}_RPM", str(rpm))),
+                int(os.getenv(f"{prefix}_TPM", str(tpm))),
+            )
+    return FALLBACK_QUOTA
+
+
+class TokenBucket:
+    """
+    분당 한도를 갖는 토큰 버킷
+
+    한도만큼 가득 찬 상태로 시작하며 초당 (한도 / 60)씩 채워집니다.
+    부족하면 호출자가 순서대로 대기하고, 사후 정산으로 잔량이 음수(빚)가 될 수 있습니다.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(1, per_minute))
+        self._rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._queue = threading.Lock()  # 대기 중인 호출자를 한 명씩 처리
+        # 비동기 호출자용 대기열 (이벤트 루프별 asyncio.Lock, 도착 순서대로 획득)
+        self._async_queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = \
+            weakref.WeakKeyDictionary()
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def take(self, amount: float) -> float:
+        """
+        토큰 차감 (부족하면 채워질 때까지 대기)
+
+        Args:
+            amount: 차감할 토큰 수 (버킷 용량을 넘으면 용량만큼만)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        amount = min(amount, self.capacity)
+        started = time.monotonic()
+        with self._queue:
+            while True:
+                with self._lock:
+                    self._refill()
+                    if self._tokens >= amount:
+                        self._tokens -= amount
+                        return time.monotonic() - started
+                    wait = (amount - self._tokens) / self._rate
+                # 정산으로 토큰이 반환될 수 있으므로 최대 1초 단위로 다시 확인
+                time.sleep(min(wait, 1.0))
+
+    async def take_async(self, amount: float) -> float:
+        """
+        take의 비동기 버전 (이벤트 루프를 막지 않고 대기)
+
+        같은 이벤트 루프의 호출자는 take와 마찬가지로 도착 순서대로 한 명씩 처리되므로,
+        큰 예약이 뒤에 온 작은 예약들에 밀려 계속 대기하지 않습니다.
+        """
+        amount = min(amount, self.capacity)
+        started = time.monotonic()
+        async with self._async_queue():
+            while True:
+                with self._lock:
+                    self._refill()
+                    if self._tokens >= amount:
+                        self._tokens -= amount
+                        return time.monotonic() - started
+                    wait = (amount - self._tokens) / self._rate
+                await asyncio.sleep(min(wait, 1.0))
+
+    def _async_queue(self) -> asyncio.Lock:
+        """현재 이벤트 루프의 대기열 (asyncio.Lock은 루프에 묶이므로 루프별로 생성, 내부 함수)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            queue = self._async_queues.get(loop)
+            if queue is None:
+                queue = self._async_queues[loop] = asyncio.Lock()
+            return queue
+
+    def give(self, amount: float):
+        """토큰 반환 (음수면 추가 차감)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass
+class Reservation:
+    """호출 전 예약한 요청/토큰 수 (호출 후 실제 사용량으로 정산)"""
+    model_id: str
+    estimated_tokens: int
+    requests: int = 1
+    actual_tokens: int = -1  # 호출 후 설정, -1이면 정산하지 않음
+    actual_requests: int = -1
+
+
+class ModelRateLimiter:
+    """모델 ID 하나의 RPM/TPM 버킷"""
+
+    def __init__(self, model_id: str, rpm: int, tpm: int):
+        self.model_id = model_id
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._waited_seconds = 0.0
+        self._estimated_tokens = 0
+        self._actual_tokens = 0
+
+    def reserve(self, estimated_tokens: int) -> Reservation:
+        """요청 1회와 예상 토큰 차감 (한도를 넘으면 대기)"""
+        waited = self.requests.take(1)
+        waited += self.tokens.take(estimated_tokens)
+        with self._stats_lock:
+            self._calls += 1
+            self._waited_seconds += waited
+            self._estimated_tokens += estimated_tokens
+        return Reservation(model_id=self.model_id, estimated_tokens=estimated_tokens)
+
+    async def reserve_async(self, estimated_tokens: int) -> Reservation:
+        """reserve의 비동기 버전"""
+        waited = await self.requests.take_async(1)
+        waited += await self.tokens.take_async(estimated_tokens)
+        with self._stats_lock:
+            self._calls += 1
+            self._waited_seconds += waited
+            self._estimated_tokens += estimated_tokens
+        return Reservation(model_id=self.model_id, estimated_tokens=estimated_tokens)
+
+    def reconcile(self, reservation: Reservation):
+        """예상과 실제 사용량의 차이를 버킷에 반영"""
+        if reservation.actual_tokens >= 0:
+            self.tokens.give(reservation.estimated_tokens - reservation.actual_tokens)
+            with self._stats_lock:
+                self._actual_tokens += reservation.actual_tokens
+        if reservation.actual_requests > reservation.requests:
+            # Agent 도구 루프처럼 한 번의 호출이 여러 요청을 보낸 경우
+            self.requests.give(reservation.requests - reservation.actual_requests)
+
+    def snapshot(self) -> dict:
+        with self._stats_lock:
+            return {
+                "rpm": int(self.requests.capacity),
+                "tpm": int(self.tokens.capacity),
+                "available_requests": int(self.requests.available),
+                "available_tokens": int(self.tokens.available),
+                "calls": self._calls,
+                "waited_seconds": round(self._waited_seconds, 1),
+                "estimated_tokens": self._estimated_tokens,
+                "actual_tokens": self._actual_tokens,
+            }
+
+
+# 프로세스 전역 레지스트리 (모델 ID → ModelRateLimiter)
+_limiters: Dict[str, ModelRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_id: str) -> ModelRateLimiter:
+    """모델 ID의 속도 제한기 반환 (없으면 생성)"""
+    with _limiters_lock:
+        limiter = _limiters.get(model_id)
+        if limiter is None:
+            rpm, tpm = _quota_for(model_id)
+            limiter = ModelRateLimiter(model_id, rpm, tpm)
+            _limiters[model_id] = limiter
+        return limiter
+
+
+@contextmanager
+def rate_limited(model_id: str, estimated_tokens: int):
+    """
+    모델 호출 한 번을 감싸는 컨텍스트 매니저
+
+    호출 전에 예상 토큰을 차감하고, 블록 안에서 reservation.actual_tokens를
+    설정하면 블록을 나갈 때 실제 사용량으로 정산합니다.
+
+    with rate_limited(model_id, estimated) as reservation:
+        response = client.converse(...)
+        reservation.actual_tokens = response.input_tokens + response.output_tokens
+    """
+    limiter = get_rate_limiter(model_id)
+    reservation = limiter.reserve(estimated_tokens)
+    try:
+        yield reservation
+    finally:
+        limiter.reconcile(reservation)
+
+
+@asynccontextmanager
+async def rate_limited_async(model_id: str, estimated_tokens: int):
+    """rate_limited의 비동기 버전"""
+    limiter = get_rate_limiter(model_id)
+    reservation = await limiter.reserve_async(estimated_tokens)
+    try:
+        yield reservation
+    finally:
+        limiter.reconcile(reservation)
+
+
+def get_rate_limit_status() -> Dict[str, dict]:
+    """상태 출력용 모델별 속도 제한 현황"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.model_id: limiter.snapshot() for limiter in limiters}
@@ -0,0 +1,252 @@
+# 모델 호출 재시도 (지수 백오프 + jitter) 및 서킷 브레이커
+# 일시적 오류는 워커 안에서 몇 초 내에 복구하고, 지속적 장애는 빠르게 실패시킴
+
+import asyncio
+import os
+import random
+import socket
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from .concurrency import is_throttling_error
+
+T = TypeVar("T")
+
+# 오류 분류
+ERROR_THROTTLING = "throttling"   # 할당량 초과 (재시도)
+ERROR_TIMEOUT = "timeout"         # 연결/읽기 타임아웃 (재시도)
+ERROR_SERVER = "server"           # 5xx, 모델 준비 안 됨 (재시도)
+ERROR_VALIDATION = "validation"   # 잘못된 요청, 권한, 모델 없음 (재시도 안 함)
+ERROR_CIRCUIT_OPEN = "circuit_open"  # 서킷 브레이커 열림 (재시도 안 함)
+ERROR_OTHER = "other"             # 기타 (재시도 안 함)
+
+TRANSIENT_ERRORS = {ERROR_THROTTLING, ERROR_TIMEOUT, ERROR_SERVER}
+
+# 재시도 설정 (최대 시도 횟수, 백오프 기준/상한 초)
+RETRY_MAX_ATTEMPTS = int(os.getenv("WSTRANSLATOR_RETRY_MAX_ATTEMPTS", "4"))
+RETRY_BASE_SECONDS = float(os.getenv("WSTRANSLATOR_RETRY_BASE_SECONDS", "1.0"))
+RETRY_MAX_SECONDS = float(os.getenv("WSTRANSLATOR_RETRY_MAX_SECONDS", "30.0"))
+
+# 서킷 브레이커 설정 (연속 실패 횟수, 열린 상태 유지 시간 초)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("WSTRANSLATOR_CIRCUIT_FAILURES", "8"))
+CIRCUIT_COOLDOWN_SECONDS = float(os.getenv("WSTRANSLATOR_CIRCUIT_COOLDOWN_SECONDS", "60"))
+
+SERVER_ERROR_CODES = {
+    "InternalServerException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+    "ModelErrorException",
+}
+VALIDATION_ERROR_CODES = {
+    "ValidationException",
+    "AccessDeniedException",
+    "ResourceNotFoundException",
+    "ContextWindowOverflowException",
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 있어 호출하지 않은 경우"""
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    모델 호출 예외 분류
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        str: ERROR_* 상수
+    """
+    if isinstance(error, CircuitOpenError):
+        return ERROR_CIRCUIT_OPEN
+    if is_throttling_error(error):
+        return ERROR_THROTTLING
+
+    name = type(error).__name__
+    if name in VALIDATION_ERROR_CODES:
+        return ERROR_VALIDATION
+    if isinstance(error, (TimeoutError, socket.timeout)) or "Timeout" in name \
+            or name == "EndpointConnectionError":
+        return ERROR_TIMEOUT
+
+    # boto3 ClientError: 오류 코드와 HTTP 상태로 판단
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code", "")
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        if code in SERVER_ERROR_CODES or status >= 500:
+            return ERROR_SERVER
+        if code in VALIDATION_ERROR_CODES or 400 <= status < 500:
+            return ERROR_VALIDATION
+    if name in SERVER_ERROR_CODES:
+        return ERROR_SERVER
+    return ERROR_OTHER
+
+
+class CircuitBreaker:
+    """
+    모델 ID별 서킷 브레이커
+
+    timeout/server 오류가 연속으로 threshold번 발생하면 열리고, cooldown 동안 호출을 즉시 거부합니다.
+    throttling은 AIMD 제어기와 토큰 버킷이 흡수하므로 실패로 세지 않습니다.
+    cooldown이 지나면 한 번의 시험 호출을 허용하여 성공하면 닫고, 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, cooldown: float = CIRCUIT_COOLDOWN_SECONDS):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_call(self) -> bool:
+        """
+        호출 허용 여부 확인
+
+        Returns:
+            bool: 반열림 상태의 시험 호출이면 True (결과 없이 끝나면 release_trial 호출)
+
+        Raises:
+            CircuitOpenError: 열려 있고 cooldown이 지나지 않은 경우
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self._cooldown - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpenError(
+                    f"연속 {self._failures}회 모델 호출 실패로 일시 중단됨 (약 {max(0, int(remaining))}초 후 재개)"
+                )
+            self._trial_running = True  # 반열림: 시험 호출 하나만 통과
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self._threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release_trial(self):
+        """시험 호출이 성공/실패 판정 없이 끝난 경우 (취소, throttling) 다음 시험 호출을 허용"""
+        with self._lock:
+            self._trial_running = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(model_id: str) -> CircuitBreaker:
+    """모델 ID의 서킷 브레이커 반환 (없으면 생성)"""
+    with _breakers_lock:
+        if model_id not in _breakers:
+            _breakers[model_id] = CircuitBreaker()
+        return _breakers[model_id]
+
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 재시도 전 대기 시간 (상한이 있는 지수 백오프 + full jitter)"""
+    return random.uniform(0, min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** attempt)))
+
+
+def call_with_retry(
+    model_id: str,
+    call: Callable[[], T],
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+) -> T:
+    """
+    모델 호출을 일시적 오류에 대해 재시도하며 실행
+
+    - throttling/timeout/server 오류: 백오프 후 최대 max_attempts회까지 시도
+      (throttling은 서킷 브레이커의 연속 실패로 세지 않음)
+    - validation/기타 오류: 즉시 예외 전파
+    - 서킷이 열려 있으면 호출하지 않고 CircuitOpenError
+
+    Args:
+        model_id: 모델 ID (서킷 브레이커 단위)
+        call: 인자 없는 호출 함수
+        max_attempts: 최대 시도 횟수
+
+    Returns:
+        call의 반환값
+    """
+    breaker = get_circuit_breaker(model_id)
+    attempt = 0
+    while True:
+        trial = breaker.before_call()
+        try:
+            result = call()
+        except Exception as e:
+            error_type = classify_error(e)
+            if error_type not in TRANSIENT_ERRORS:
+                breaker.record_success()  # 모델은 응답했으므로 연속 실패로 세지 않음
+                raise
+            if error_type == ERROR_THROTTLING:
+                if trial:
+                    breaker.release_trial()  # 할당량 초과는 장애가 아니므로 서킷 상태 유지
+            else:
+                breaker.record_failure()
+            attempt += 1
+            if attempt >= max_attempts:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+        except BaseException:
+            # 취소/KeyboardInterrupt로 끝난 시험 호출이 서킷을 계속 막지 않도록 해제
+            if trial:
+                breaker.release_trial()
+            raise
+        breaker.record_success()
+        return result
+
+
+async def call_with_retry_async(
+    model_id: str,
+    call: Callable[[], Awaitable[T]],
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+) -> T:
+    """call_with_retry의 비동기 버전 (백오프 대기 중에도 이벤트 루프를 막지 않음)"""
+    breaker = get_circuit_breaker(model_id)
+    attempt = 0
+    while True:
+        trial = breaker.before_call()
+        try:
+            result = await call()
+        except Exception as e:
+            error_type = classify_error(e)
+            if error_type not in TRANSIENT_ERRORS:
+                breaker.record_success()
+                raise
+            if error_type == ERROR_THROTTLING:
+                if trial:
+                    breaker.release_trial()  # 할당량 초과는 장애가 아니므로 서킷 상태 유지
+            else:
+                breaker.record_failure()
+            attempt += 1
+            if attempt >= max_attempts:
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        except BaseException:
+            # 취소/KeyboardInterrupt로 끝난 시험 호출이 서킷을 계속 막지 않도록 해제
+            if trial:
+                breaker.release_trial()
+            raise
+        breaker.record_success()
+        return result
@@ -52,15 +52,22 @@ Workshop Translator Orchestrator - 중앙 집중식 번역 워크플로우 관
    - TaskManager 초기화 및 tasks.md 생성
    - 각 파일당 3개 태스크 자동 생성 (translate, review, validate)
 
+## Phase 3~5 빠른 실행 (권장)
+- `run_pipeline` 한 번 호출로 번역 → 검토 → 검증을 파일별 파이프라인으로 실행
+  - 파일의 번역이 끝나면 즉시 해당 파일의 검토/검증이 시작됨
+  - 실패 태스크가 있으면 `retry_failed_tasks` 후 `run_pipeline` 재호출
+- 단계별로 결과를 확인하며 진행하려면 아래 Phase 3~5를 순서대로 실행
+
 ## Phase 3: 번역 실행
 1. `run_translation_phase` 호출
    - 실행 가능한 번역 태스크 자동 선택 (의존성 체크)
-   - 병렬로 Stateless 워커 실행 (최대 5개)
+   - 동시 실행 슬롯(스로틀링/지연에 따라 자동 조절)을 계속 채우며 큐가 빌 때까지 한 번의 호출로 처리
    - 결과 수집 후 TaskManager가 tasks.md 자동 업데이트
+   - 응답에는 요약과 실패 태스크만 포함됨 (`stopped_reason`이 `queue_empty`면 남은 태스크 없음)
 2. `get_workflow_status`로 진행 상황 확인
 3. 실패한 태스크가 있으면 `retry_failed_tasks` 호출
 4. `check_phase_completion('translate')`로 완료 확인
-5. 모든 번역 완료까지 반복
+5. 시간/태스크 수 제한으로 중단된 경우에만 다시 호출
 
 ## Phase 4: 품질 검토
 1. `run_review_phase` 호출
@@ -104,6 +111,7 @@ Workshop Translator Orchestrator - 중앙 집중식 번역 워크플로우 관
 - `run_translation_phase`: 번역 단계 실행 (병렬)
 - `run_review_phase`: 검토 단계 실행 (병렬)
 - `run_validate_phase`: 검증 단계 실행 (병렬)
+- `run_pipeline`: 번역/검토/검증을 의존성 기반 파이프라인으로 한 번에 실행
 - `get_workflow_status`: 전체 워크플로우 상태 조회
 - `retry_failed_tasks`: 실패한 태스크 재시도
 - `check_phase_completion`: 특정 단계 완료 여부 확인
@@ -141,99 +149,36 @@ Workshop Translator Orchestrator - 중앙 집중식 번역 워크플로우 관
 
 
 # =============================================================================
-# Analyzer 프롬프트 (Explore 패턴 참고)
+# Analyzer 프롬프트 (언어 확장자 없는 파일의 언어 감지)
 # =============================================================================
 ANALYZER_PROMPT = """<Role>
-Workshop 구조 분석 전문가. 번역 대상 파일을 찾아 구조화된 결과 반환.
+Workshop 문서 언어 감지 전문가. 언어 확장자가 없는 .md 파일의 본문 샘플을 보고 언어 코드를 판별.
 </Role>
 
-<Mission>
-- Workshop 디렉토리 구조 파악
-- 소스 언어 자동 감지 (.en.md 우선)
-- contentspec.yaml 분석
-- **언어 확장자 없는 .md 파일 감지 및 파일명 정규화**
-</Mission>
-
-<File Naming Normalization>
-## 언어 확장자가 없는 파일 처리
-
-Workshop 파일 중 언어 확장자가 명시되지 않은 파일(예: `index.md`, `setup.md`)이 있을 수 있습니다.
-이런 파일들은 내용을 분석하여 언어를 감지하고, 적절한 파일명으로 **자동 변경**합니다.
-
-### 지원 언어 목록:
-| Language | Locale Code |
-|----------|-------------|
-| English | en-US |
-| Español | es-US |
-| 日本語 | ja-JP |
-| Français | fr-FR |
-| 한국어 | ko-KR |
-| Português | pt-BR |
-| Deutsch | de-DE |
-| Italiano | it-IT |
-| 中文(简体) | zh-CN |
-| 中文(繁體) | zh-TW |
-| українська | uk-UA |
-| Polski | pl-PL |
-| Bahasa Indonesia | id-ID |
-| Nederlands | nl-NL |
-| العربية | ar-AE |
-
-### 처리 절차:
-1. `.md` 파일 중 언어 확장자가 없는 파일 식별
-   - 언어 확장자 패턴: `.en.md`, `.ko.md`, `.ja.md`, `.zh.md` 등
-   - 언어 확장자가 없는 예: `index.md`, `setup.md`, `README.md`
-
-2. 파일 내용 분석하여 언어 감지
-3. 감지된 언어에 따라 파일명 **자동 변경** (rename)
-   - `index.md` (영어 내용) → `index.en.md`
-   - `setup.md` (한국어 내용) → `setup.ko.md`
-
-### 언어 감지 규칙:
-- 한글(가-힣) 포함 → 한국어 (ko)
-- 히라가나(ぁ-ん)/가타카나(ァ-ン) 포함 → 일본어 (ja)
-- 간체자 특유 문자 포함 → 중국어 간체 (zh-CN)
-- 번체자 특유 문자 포함 → 중국어 번체 (zh-TW)
-- 키릴 문자(українська) 포함 → 우크라이나어 (uk)
-- 아랍 문자 포함 → 아랍어 (ar)
-- 위 조건에 해당하지 않으면 → 영어 (en) 기본값
-
-### 파일명 변경 시 주의:
-- 파일명에는 언어 코드만 사용 (예: `.en.md`, `.ko.md`)
-- 전체 locale 코드(예: `en-US`)는 contentspec.yaml에서 사용
-</File Naming Normalization>
+<Input>
+파일마다 번호와 본문 샘플(front matter, 코드 블록 제외)이 주어집니다.
 
-<Output Format>
-반드시 아래 형식으로 결과를 반환하세요:
-
-<analysis>
-**Workshop 경로**: [경로]
-**소스 언어**: [감지된 언어 코드]
-**번역 대상 파일 수**: [N개]
-**파일명 정규화 수행**: [Y/N] (변경된 파일 수)
-</analysis>
-
-<renamed>
-(파일명이 변경된 경우만 표시)
-index.md → index.en.md (감지: 영어)
-setup.md → setup.en.md (감지: 영어)
-</renamed>
-
-<files>
-(정규화 후 최종 번역 대상 파일 목록)
-/path/to/content/index.en.md
-/path/to/content/1-introduction/index.en.md
-...
-</files>
-</Output Format>
+[1] path/to/index.md
+(본문 샘플)
+</Input>
+
+<Languages>
+en (English), es (Español), ja (日本語), fr (Français), ko (한국어), pt (Português),
+de (Deutsch), it (Italiano), zh (中文), uk (українська), pl (Polski), id (Bahasa Indonesia),
+nl (Nederlands), ar (العربية)
+</Languages>
 
 <Rules>
-1. .en.md 우선, 없으면 다른 언어 파일 탐색
-2. 숨김 파일/폴더 제외
-3. 결과는 항상 XML 태그로 구조화
-4. **언어 확장자 없는 .md 파일은 내용 분석 후 자동으로 파일명 변경**
-5. 파일명 변경 후 변경 내역을 <renamed> 섹션에 기록
-</Rules>"""
+1. 문서 본문의 언어를 판별 (코드, 명령어, 제품명, URL은 무시)
+2. 위 목록에 없는 언어이거나 판별할 수 없으면 unknown
+3. 파일 하나당 한 줄, 설명 없이 아래 형식으로만 출력
+</Rules>
+
+<Output Format>
+1: en
+2: ko
+3: unknown
+</Output Format>"""
 
 
 # =============================================================================
@@ -281,12 +226,13 @@ TRANSLATOR_PROMPT = """<Role>
 2. 기술 용어: 공식 AWS 한국어 문서 참조
 3. Markdown 구조 유지
 4. Frontmatter 보존 (title만 번역)
-5. 코드 블록 내용 유지 (주석만 번역)
-6. 링크 URL 유지
+5. 링크 URL 유지
+6. 코드 블록, shortcode, URL, 인라인 코드는 ⟦N⟧ 자리표시자로 전달됨 - 그대로 유지
 </Translation Rules>
 
 <Output>
-번역된 전체 Markdown 내용을 반환합니다.
+원본이 <segment id="N"> 태그로 나뉘어 전달되면 각 세그먼트를 같은 id의 태그로 감싸 반환합니다.
+(이미 번역된 세그먼트는 번역 메모리에서 재사용되므로 전달되지 않을 수 있습니다)
 원본 구조를 정확히 유지하세요.
 </Output>"""
 
@@ -2,7 +2,14 @@
 # Orchestrator 중심의 중앙 집중식 태스크 관리
 
 from .types import Task, TaskStatus, TaskType, TaskResult
-from .manager import TaskManager
+from .manager import (
+    TaskManager,
+    DEFAULT_SESSION,
+    get_task_manager,
+    release_task_manager,
+    set_current_session,
+    reset_current_session,
+)
 
 __all__ = [
     "Task",
@@ -10,4 +17,9 @@ __all__ = [
     "TaskType",
     "TaskResult",
     "TaskManager",
+    "DEFAULT_SESSION",
+    "get_task_manager",
+    "release_task_manager",
+    "set_current_session",
+    "reset_current_session",
 ]
@@ -0,0 +1,132 @@
+# 태스크 상태 저널 - append-only JSONL
+# 상태 전이마다 tasks.md 전체를 다시 쓰는 대신 한 줄씩 추가하고, 재개 시 순서대로 재생
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# 저널 형식 버전 (헤더에 기록)
+JOURNAL_VERSION = 1
+
+# fsync 배치 설정 (레코드 수, 경과 초 중 먼저 도달한 쪽에서 디스크에 반영)
+FSYNC_BATCH = int(os.getenv("WSTRANSLATOR_JOURNAL_FSYNC_BATCH", "32"))
+FSYNC_INTERVAL_SECONDS = float(os.getenv("WSTRANSLATOR_JOURNAL_FSYNC_SECONDS", "1.0"))
+
+
+def journal_path_for(tasks_path: str, target_lang: str) -> str:
+    """
+    tasks.md 경로와 타겟 언어에 대응하는 저널 경로 (translation/tasks.ko.journal.jsonl)
+
+    타겟 언어별로 파일을 나누므로 여러 언어를 번갈아 실행해도 서로의 진행 상태를 지우지 않습니다.
+    """
+    return f"{os.path.splitext(tasks_path)[0]}.{target_lang}.journal.jsonl"
+
+
+class TaskJournal:
+    """
+    태스크 상태 전이 저널
+
+    한 줄이 하나의 JSON 레코드입니다.
+    - 헤더: {"type": "header", "version", "workshop", "target_lang", "source_lang", "created"}
+    - 상태: {"type": "task", "path", "kind", "status", "retry", 해시/시각/결과(있을 때)}
+
+    태스크는 ID 대신 (상대 경로, 유형)으로 식별하므로 파일 목록이 바뀌어도 재생할 수 있습니다.
+    같은 태스크의 레코드는 마지막 것이 유효하며, 잘린 마지막 줄(쓰기 중 중단)은 무시합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def load(self, target_lang: str) -> Tuple[Optional[dict], Dict[Tuple[str, str], dict]]:
+        """
+        저널 재생 (replay_journal)
+
+        저널 파일은 타겟 언어별로 분리되어 있으며(journal_path_for),
+        호출자가 헤더의 target_lang으로 한 번 더 재사용 여부를 확인합니다.
+        """
+        return replay_journal(self.path)
+
+    def reset(self, header: dict, records: list):
+        """
+        현재 상태 스냅샷으로 저널을 새로 작성 (압축)
+
+        임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 이전 저널이 남습니다.
+
+        Args:
+            header: 헤더 필드 (type/version/created는 자동 추가)
+            records: 태스크 상태 레코드 목록
+        """
+        self.close()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        header = {"type": "header", "version": JOURNAL_VERSION, "created": datetime.now().isoformat(), **header}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header, ensure_ascii=False, default=str) + "\n")
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record: dict):
+        """레코드 한 줄 추가 (FSYNC_BATCH개 또는 FSYNC_INTERVAL_SECONDS마다 fsync)"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= FSYNC_BATCH or time.monotonic() - self._last_sync >= FSYNC_INTERVAL_SECONDS:
+            self.sync()
+
+    def sync(self):
+        """쓰기 버퍼를 디스크에 반영"""
+        if self._file is None or self._pending == 0:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+
+def replay_journal(path: str) -> Tuple[Optional[dict], Dict[Tuple[str, str], dict]]:
+    """
+    저널을 처음부터 재생하여 태스크별 마지막 상태 계산
+
+    Args:
+        path: 저널 경로
+
+    Returns:
+        Tuple: (헤더 또는 None, (상대 경로, 유형 값) → 마지막 상태 레코드)
+    """
+    header = None
+    states: Dict[Tuple[str, str], dict] = {}
+    if not os.path.exists(path):
+        return header, states
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 쓰기 중 중단된 마지막 줄
+            if record.get("type") == "header":
+                header = record
+            elif record.get("type") == "task":
+                states[(record["path"], record["kind"])] = record
+    return header, states
@@ -4,43 +4,75 @@
 import os
 import re
 import threading
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from itertools import islice
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
+from .journal import TaskJournal, journal_path_for
+from .sqlite_store import SqliteTaskStore, db_path_for
 from .types import Task, TaskStatus, TaskType, TaskResult, WorkflowProgress
+from tools.file_tools import compute_file_hash, get_target_path
+
+
+# 파이프라인 실행 시 태스크 유형 우선순위 (후행 단계 우선)
+PIPELINE_PRIORITY = [TaskType.VALIDATE, TaskType.REVIEW, TaskType.TRANSLATE]
+
+# 상태 저장소 (journal: 타겟 언어별 tasks.<lang>.journal.jsonl, sqlite: tasks.db - 여러 언어 상태와 결과를 WAL 모드로 보관)
+STORE_JOURNAL = "journal"
+STORE_SQLITE = "sqlite"
+TASK_STORE = os.getenv("WSTRANSLATOR_TASK_STORE", STORE_JOURNAL)
+
+# tasks.md 재작성 최소 간격 (초) - 상태 전이는 저널에 즉시 기록되고 tasks.md는 이 간격과 Phase 종료 시 갱신
+TASKS_MD_DEBOUNCE_SECONDS = float(os.getenv("WSTRANSLATOR_TASKS_MD_DEBOUNCE_SECONDS", "2.0"))
+
+# 세션 ID를 지정하지 않았을 때 사용하는 기본 세션 (단일 세션 CLI/스크립트)
+DEFAULT_SESSION = "default"
+
+# 레지스트리에 유지할 최대 TaskManager 수 (초과 시 오래 사용하지 않은 유휴 세션부터 제거)
+# 제거된 세션의 진행 상태는 tasks.md에 남아 있으므로 initialize_workflow로 재개 가능
+MAX_TASK_MANAGERS = int(os.getenv("WSTRANSLATOR_MAX_SESSIONS", "64"))
 
 
 class TaskManager:
     """
-    중앙 집중식 태스크 관리자 (싱글톤)
+    중앙 집중식 태스크 관리자 (워크플로우당 하나)
     
     핵심 원칙:
     1. Orchestrator만 이 클래스를 통해 tasks.md 수정
     2. Sub-agent는 TaskResult만 반환, 상태 파일 직접 수정 안 함
     3. 의존성 기반 태스크 실행 관리
-    """
     
-    _instance = None
-    _lock = threading.Lock()
+    인스턴스는 get_task_manager()가 세션 ID별로 관리합니다.
     
-    def __new__(cls):
-        """싱글톤 패턴"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    상태 전이는 상태 저장소(append-only 저널 또는 SQLite)에 기록되고,
+    tasks.md는 사람이 읽는 뷰로서 TASKS_MD_DEBOUNCE_SECONDS 간격과 flush() 시에만 다시 작성됩니다.
     
-    def __init__(self):
-        if self._initialized:
-            return
+    유형/상태별 인덱스와 준비 큐(의존성이 모두 완료된 미완료 태스크)를 상태 전이 시 갱신하므로
+    태스크 조회와 진행 상황 계산은 전체 태스크 수와 무관하게 동작합니다.
+    """
+    
+    def __init__(self, session_id: str = DEFAULT_SESSION):
+        self.session_id = session_id
         self._tasks: Dict[str, Task] = {}
+        # 유형 → 상태 → 태스크 ID (삽입 순서를 유지하는 dict를 순서 있는 집합으로 사용)
+        self._index: Dict[TaskType, Dict[TaskStatus, Dict[str, None]]] = {}
+        # 유형 → 실행 가능한 태스크 ID (NOT_STARTED이고 의존성이 모두 완료)
+        self._ready: Dict[TaskType, Dict[str, None]] = {}
+        # 태스크 ID → 완료되지 않은 의존성 수 / 이 태스크에 의존하는 태스크 ID
+        self._unmet_deps: Dict[str, int] = {}
+        self._dependents: Dict[str, List[str]] = {}
         self._tasks_path: Optional[str] = None
         self._workshop_path: Optional[str] = None
         self._target_lang: Optional[str] = None
+        self._source_lang: str = "en"
         self._files: List[str] = []
-        self._initialized = True
+        self._invalidated_files: List[str] = []
+        self._store: Optional[Union[TaskJournal, SqliteTaskStore]] = None
+        self._render_pending = False
+        self._last_render = 0.0
     
     def initialize(
         self, 
@@ -48,37 +80,60 @@ class TaskManager:
         target_lang: str,
         files: List[str],
         tasks_path: Optional[str] = None,
-        force_reset: bool = False
+        force_reset: bool = False,
+        source_lang: str = "en"
     ) -> str:
         """
         워크플로우 초기화 및 tasks.md 생성/로드
         
+        기존 상태 저장소(없으면 tasks.md)에서 재개할 때는 파일별로 기록된 원본/번역 해시를 현재 내용과 비교하여
+        원본이 바뀐 파일(또는 번역 파일이 사라진 파일)만 다시 번역 대상으로 되돌립니다.
+        이전 실행이 중단되어 진행 중으로 남은 태스크는 미완료로 되돌립니다.
+        
         Args:
             workshop_path: Workshop 디렉토리 경로
             target_lang: 타겟 언어 코드
             files: 번역 대상 파일 목록
             tasks_path: tasks.md 경로 (선택)
-            force_reset: True면 기존 tasks.md 무시하고 새로 생성
+            force_reset: True면 기존 tasks.md 무시하고 새로 생성 (번역 메모리/이전 번역도 재사용하지 않음)
+            source_lang: 소스 언어 코드 (기본: en)
         
         Returns:
             str: 생성된 tasks.md 경로
         """
         self._workshop_path = workshop_path
         self._target_lang = target_lang
+        self._source_lang = source_lang
         self._files = files
         self._tasks_path = tasks_path or os.path.join(
             workshop_path, "translation", "tasks.md"
         )
         self._tasks.clear()
+        self._invalidated_files = []
+        if self._store:
+            self._store.close()
+        self._store = self._open_store()
         
-        # 기존 tasks.md가 있으면 상태 로드 시도
+        # 상태 저장소를 우선 재생하고, 기록이 없으면 (이전 버전) tasks.md에서 상태 로드
+        journal_states = {}
         existing_status = {}
-        if not force_reset and os.path.exists(self._tasks_path):
-            existing_status = self._load_status_from_file()
+        existing_hashes = {}
+        if not force_reset:
+            header, journal_states = self._store.load(target_lang)
+            existing_lang = header.get("target_lang") if header else self._load_target_lang_from_file()
+            if existing_lang not in (None, target_lang):
+                # 다른 타겟 언어의 진행 상태는 재사용하지 않음
+                print(f"Info: 기존 tasks.md는 {existing_lang} 작업이므로 {target_lang} 작업을 새로 시작합니다.")
+                journal_states = {}
+            elif not journal_states and os.path.exists(self._tasks_path):
+                existing_status = self._load_status_from_file()
+                existing_hashes = self._load_hashes_from_file()
         
         # 각 파일당 3개 태스크 생성 (translate, review, validate)
         for i, file_path in enumerate(files, start=1):
             base_id = f"2.{i}"
+            rel_path = self._relative_path(file_path)
+            source_hash, target_hash = existing_hashes.get(rel_path, (None, None))
             
             # 번역 태스크
             task_id = f"{base_id}.1"
@@ -87,7 +142,10 @@ class TaskManager:
                 type=TaskType.TRANSLATE,
                 file_path=file_path,
                 depends_on=[],
-                status=existing_status.get(task_id, TaskStatus.NOT_STARTED)
+                status=existing_status.get(task_id, TaskStatus.NOT_STARTED),
+                source_hash=source_hash,
+                target_hash=target_hash,
+                fresh=force_reset,
             )
             
             # 검토 태스크 (번역 완료 후)
@@ -109,12 +167,222 @@ class TaskManager:
                 depends_on=[f"{base_id}.1", f"{base_id}.2"],
                 status=existing_status.get(task_id, TaskStatus.NOT_STARTED)
             )
+            
+            for suffix in ("1", "2", "3"):
+                task = self._tasks[f"{base_id}.{suffix}"]
+                state = journal_states.get((rel_path, task.type.value))
+                if state:
+                    self._restore_task(task, state)
+                if task.status == TaskStatus.IN_PROGRESS:
+                    task.status = TaskStatus.NOT_STARTED
+            
+            # 내용 해시 기반 무효화
+            if existing_status or journal_states:
+                self._check_content_hashes(base_id, file_path)
+        
+        self._build_indexes()
         
-        # tasks.md 파일 동기화
+        # 현재 상태 스냅샷으로 저장소 압축 후 tasks.md 작성
+        self._store.reset(
+            {"workshop": workshop_path, "target_lang": target_lang, "source_lang": source_lang},
+            [self._state_record(task) for task in self._tasks.values()],
+        )
         self._sync_to_file()
         
         return self._tasks_path
     
+    def _build_indexes(self):
+        """현재 태스크 상태로 인덱스와 준비 큐 생성 (initialize에서 한 번, 내부 함수)"""
+        self._index = {task_type: {status: {} for status in TaskStatus} for task_type in TaskType}
+        self._ready = {task_type: {} for task_type in TaskType}
+        self._unmet_deps = {}
+        self._dependents = {task_id: [] for task_id in self._tasks}
+        
+        for task in self._tasks.values():
+            self._index[task.type][task.status][task.id] = None
+            # 존재하지 않는 의존성은 완료될 수 없으므로 계속 미충족으로 남음
+            self._unmet_deps[task.id] = sum(
+                1 for dep_id in task.depends_on
+                if dep_id not in self._tasks or self._tasks[dep_id].status != TaskStatus.COMPLETED
+            )
+            for dep_id in task.depends_on:
+                if dep_id in self._dependents:
+                    self._dependents[dep_id].append(task.id)
+        
+        for task in self._tasks.values():
+            if task.status == TaskStatus.NOT_STARTED and self._unmet_deps[task.id] == 0:
+                self._ready[task.type][task.id] = None
+    
+    def _set_status(self, task: Task, status: TaskStatus):
+        """
+        태스크 상태 변경 및 인덱스/준비 큐 갱신 (내부 함수)
+        
+        완료되거나 완료가 취소된 태스크는 자신에 의존하는 태스크의 미충족 의존성 수만 갱신합니다.
+        """
+        old = task.status
+        if old == status:
+            return
+        task.status = status
+        del self._index[task.type][old][task.id]
+        self._index[task.type][status][task.id] = None
+        
+        if old == TaskStatus.NOT_STARTED:
+            self._ready[task.type].pop(task.id, None)
+        elif status == TaskStatus.NOT_STARTED and self._unmet_deps[task.id] == 0:
+            self._ready[task.type][task.id] = None
+        
+        if status == TaskStatus.COMPLETED:
+            for dependent_id in self._dependents[task.id]:
+                self._unmet_deps[dependent_id] -= 1
+                dependent = self._tasks[dependent_id]
+                if self._unmet_deps[dependent_id] == 0 and dependent.status == TaskStatus.NOT_STARTED:
+                    self._ready[dependent.type][dependent_id] = None
+        elif old == TaskStatus.COMPLETED:
+            for dependent_id in self._dependents[task.id]:
+                self._unmet_deps[dependent_id] += 1
+                self._ready[self._tasks[dependent_id].type].pop(dependent_id, None)
+    
+    def _open_store(self) -> Union[TaskJournal, SqliteTaskStore]:
+        """TASK_STORE 설정에 따른 상태 저장소 (내부 함수)"""
+        if TASK_STORE == STORE_SQLITE:
+            return SqliteTaskStore(db_path_for(self._tasks_path))
+        return TaskJournal(journal_path_for(self._tasks_path, self._target_lang))
+    
+    def _restore_task(self, task: Task, state: dict):
+        """저장소 레코드의 상태를 태스크에 반영 (내부 함수)"""
+        task.status = TaskStatus(state["status"])
+        task.retry_count = state.get("retry", 0)
+        if task.type == TaskType.TRANSLATE:
+            task.source_hash = state.get("source_hash")
+            task.target_hash = state.get("target_hash")
+            task.fresh = bool(state.get("fresh"))
+        if state.get("started_at"):
+            task.started_at = datetime.fromisoformat(state["started_at"])
+        if state.get("finished_at"):
+            task.finished_at = datetime.fromisoformat(state["finished_at"])
+        if state.get("result"):
+            task.result = TaskResult(**state["result"])
+    
+    def _state_record(self, task: Task) -> dict:
+        """태스크의 현재 상태를 저널 레코드로 변환 (내부 함수)"""
+        record = {
+            "type": "task",
+            "path": self._relative_path(task.file_path),
+            "kind": task.type.value,
+            "status": task.status.value,
+            "retry": task.retry_count,
+        }
+        if task.source_hash:
+            record["source_hash"] = task.source_hash
+        if task.target_hash:
+            record["target_hash"] = task.target_hash
+        if task.fresh:
+            record["fresh"] = True
+        if task.started_at:
+            record["started_at"] = task.started_at.isoformat()
+        if task.finished_at:
+            record["finished_at"] = task.finished_at.isoformat()
+            if task.started_at and task.finished_at >= task.started_at:
+                record["elapsed_seconds"] = round((task.finished_at - task.started_at).total_seconds(), 2)
+        if task.result:
+            record["result"] = task.result.to_dict()
+        return record
+    
+    def _record_transition(self, task: Task):
+        """
+        상태 전이를 저장소에 추가하고 tasks.md 갱신 예약 (내부 함수)
+        
+        tasks.md는 마지막 작성 후 TASKS_MD_DEBOUNCE_SECONDS가 지났을 때만 다시 작성합니다.
+        """
+        if self._store:
+            self._store.append(self._state_record(task))
+        self._render_pending = True
+        if time.monotonic() - self._last_render >= TASKS_MD_DEBOUNCE_SECONDS:
+            self._sync_to_file()
+    
+    def flush(self):
+        """저장소를 디스크에 반영하고 미뤄둔 tasks.md 갱신 수행 (Phase 종료 시 호출)"""
+        if self._store:
+            self._store.sync()
+        if self._render_pending:
+            self._sync_to_file()
+    
+    def close(self):
+        """미뤄둔 기록을 반영하고 상태 저장소(저널 파일/SQLite 연결) 닫기 (레지스트리에서 제거할 때 호출)"""
+        self.flush()
+        if self._store:
+            self._store.close()
+            self._store = None
+    
+    def _check_content_hashes(self, base_id: str, file_path: str):
+        """
+        완료된 번역 태스크의 원본/번역 해시를 현재 파일과 비교
+        
+        - 원본이 바뀌었거나 번역 파일이 없으면: 번역/검토/검증 모두 재실행
+        - 번역 파일만 바뀌었으면 (수동 수정): 검토/검증만 재실행
+        - 해시 기록이 없으면 (이전 버전 tasks.md): 현재 해시를 기준으로 채택
+        """
+        translate_task = self._tasks[f"{base_id}.1"]
+        if translate_task.status != TaskStatus.COMPLETED:
+            return
+        
+        current_source = compute_file_hash(file_path)
+        current_target = compute_file_hash(
+            get_target_path(file_path, self._target_lang, self._source_lang)
+        )
+        
+        source_changed = translate_task.source_hash and translate_task.source_hash != current_source
+        if source_changed or current_target is None:
+            for suffix in ("1", "2", "3"):
+                task = self._tasks[f"{base_id}.{suffix}"]
+                task.status = TaskStatus.NOT_STARTED
+                task.retry_count = 0
+            self._invalidated_files.append(file_path)
+            return
+        
+        if translate_task.target_hash and translate_task.target_hash != current_target:
+            for suffix in ("2", "3"):
+                task = self._tasks[f"{base_id}.{suffix}"]
+                task.status = TaskStatus.NOT_STARTED
+                task.retry_count = 0
+        
+        translate_task.source_hash = current_source
+        translate_task.target_hash = current_target
+    
+    def _load_target_lang_from_file(self) -> Optional[str]:
+        """기존 tasks.md 헤더의 타겟 언어 (없으면 None)"""
+        try:
+            with open(self._tasks_path, "r", encoding="utf-8") as f:
+                match = re.search(r'^\*\*타겟 언어\*\*:\s*(\S+)', f.read(), re.MULTILINE)
+            return match.group(1) if match else None
+        except OSError:
+            return None
+    
+    def _load_hashes_from_file(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        기존 tasks.md에서 파일별 원본/번역 해시 로드
+        
+        태스크 ID는 파일 목록이 바뀌면 달라질 수 있으므로 상대 경로를 키로 사용합니다.
+        
+        Returns:
+            Dict[str, Tuple]: 상대 경로 → (원본 해시, 번역 해시)
+        """
+        hash_map = {}
+        
+        try:
+            with open(self._tasks_path, "r", encoding="utf-8") as f:
+                content = f.read()
+            
+            # - [x] 2.1 `path/index.en.md` 처리 <!-- source:abc... target:def... -->
+            pattern = r'-\s+\[.\]\s+\d+\.\d+\s+`([^`]+)`.*?<!--\s*source:([0-9a-f]+)(?:\s+target:([0-9a-f]+))?\s*-->'
+            for match in re.finditer(pattern, content):
+                hash_map[match.group(1)] = (match.group(2), match.group(3))
+                
+        except Exception as e:
+            print(f"Warning: tasks.md 해시 파싱 실패, 해시 없이 진행합니다: {e}")
+        
+        return hash_map
+    
     def _load_status_from_file(self) -> Dict[str, TaskStatus]:
         """
         기존 tasks.md에서 태스크 상태 로드
@@ -154,45 +422,43 @@ class TaskManager:
         
         return status_map
     
-    def get_ready_tasks(self, task_type: TaskType, limit: int = 5) -> List[Task]:
+    def get_ready_tasks(self, task_type: Optional[TaskType] = None, limit: int = 5) -> List[Task]:
         """
         실행 가능한 태스크 반환 (의존성 충족된 것만)
         
         Args:
-            task_type: 태스크 유형
+            task_type: 태스크 유형 (None이면 모든 유형, 파이프라인 실행용)
             limit: 최대 반환 개수 (기본 5개, 병렬 처리용)
         
         Returns:
             List[Task]: 실행 가능한 태스크 목록
+                task_type이 None이면 후행 단계(검증 → 검토 → 번역) 순으로 우선 반환하여
+                이미 시작한 파일이 먼저 끝나도록 함
         """
-        ready = []
-        for task in self._tasks.values():
-            if task.type != task_type:
-                continue
-            if task.status != TaskStatus.NOT_STARTED:
-                continue
-            
-            # 의존성 체크
-            deps_satisfied = all(
-                self._tasks.get(dep_id, Task(id="", type=TaskType.TRANSLATE, file_path="")).status == TaskStatus.COMPLETED
-                for dep_id in task.depends_on
-            )
-            
-            if deps_satisfied:
-                ready.append(task)
+        if task_type is None:
+            ready = []
+            for pipeline_type in PIPELINE_PRIORITY:
+                ready.extend(self.get_ready_tasks(pipeline_type, limit - len(ready)))
                 if len(ready) >= limit:
                     break
+            return ready
+        
+        if limit <= 0 or task_type not in self._ready:
+            return []
         
-        return ready
+        # 준비 큐는 상태 전이 시 갱신되므로 limit개만 읽음
+        return [self._tasks[task_id] for task_id in islice(self._ready[task_type], limit)]
     
     def get_failed_tasks(self, task_type: Optional[TaskType] = None) -> List[Task]:
         """재시도 가능한 실패 태스크 반환"""
         failed = []
-        for task in self._tasks.values():
-            if task_type and task.type != task_type:
+        for indexed_type, by_status in self._index.items():
+            if task_type and indexed_type != task_type:
                 continue
-            if task.status == TaskStatus.FAILED and task.can_retry():
-                failed.append(task)
+            for task_id in by_status[TaskStatus.FAILED]:
+                task = self._tasks[task_id]
+                if task.can_retry():
+                    failed.append(task)
         return failed
     
     def mark_in_progress(self, task_id: str) -> bool:
@@ -201,9 +467,22 @@ class TaskManager:
             return False
         
         task = self._tasks[task_id]
-        task.status = TaskStatus.IN_PROGRESS
+        self._set_status(task, TaskStatus.IN_PROGRESS)
+        task.updated_at = task.started_at = datetime.now()
+        task.finished_at = None
+        self._record_transition(task)
+        return True
+    
+    def mark_not_started(self, task_id: str) -> bool:
+        """진행 중인 태스크를 대기 상태로 되돌림 (실행이 취소된 경우, 재시도 횟수는 그대로)"""
+        task = self._tasks.get(task_id)
+        if task is None or task.status != TaskStatus.IN_PROGRESS:
+            return False
+        
+        self._set_status(task, TaskStatus.NOT_STARTED)
         task.updated_at = datetime.now()
-        self._sync_to_file()
+        task.started_at = None
+        self._record_transition(task)
         return True
     
     def complete_task(self, result: TaskResult) -> bool:
@@ -211,6 +490,7 @@ class TaskManager:
         태스크 완료 처리 (Orchestrator가 호출)
         
         Sub-agent의 결과를 받아 중앙에서 상태 업데이트
+        자동 복구에 실패한 검증 태스크는 번역부터 다시 실행하도록 되돌립니다. (metadata["retranslate"])
         """
         task_id = result.task_id
         if task_id not in self._tasks:
@@ -218,17 +498,55 @@ class TaskManager:
         
         task = self._tasks[task_id]
         task.result = result
-        task.updated_at = datetime.now()
+        task.updated_at = task.finished_at = datetime.now()
         
         if result.success:
-            task.status = TaskStatus.COMPLETED
+            self._set_status(task, TaskStatus.COMPLETED)
+            # 번역 시점의 원본/번역 해시 기록 (증분 재번역용)
+            if task.type == TaskType.TRANSLATE:
+                task.fresh = False
+            if task.type == TaskType.TRANSLATE and result.metadata:
+                task.source_hash = result.metadata.get("source_hash", task.source_hash)
+                task.target_hash = result.metadata.get("target_hash", task.target_hash)
+            # 검증 단계에서 자동 복구로 번역 파일이 바뀌었으면 번역 태스크의 해시도 갱신
+            # (재개 시 복구된 내용을 사용자 수정으로 보고 검토/검증을 다시 돌리지 않도록)
+            if task.type == TaskType.VALIDATE and result.metadata and result.metadata.get("target_hash"):
+                translate_task = self._tasks.get(task_id.rsplit(".", 1)[0] + ".1")
+                if translate_task is not None:
+                    translate_task.target_hash = result.metadata["target_hash"]
+                    self._record_transition(translate_task)
         else:
-            task.status = TaskStatus.FAILED
+            self._set_status(task, TaskStatus.FAILED)
             task.retry_count += 1
+            # 자동 복구로도 고치지 못한 구조 오류는 같은 파일을 다시 검증하지 않고 번역부터 다시 실행
+            if task.type == TaskType.VALIDATE and result.metadata \
+                    and result.metadata.get("repair_attempted") and not result.metadata.get("repaired"):
+                self._retranslate(task)
         
-        self._sync_to_file()
+        self._record_transition(task)
         return True
     
+    def _retranslate(self, validate_task: Task):
+        """
+        검증 실패 파일의 번역/검토/검증 태스크를 미완료로 되돌림 (내부 함수)
+        
+        번역 태스크의 재시도 횟수를 늘려 번역 메모리/이전 번역 없이 새로 번역하게 하고,
+        재시도 한도를 넘으면 검증 실패로 남겨 둡니다.
+        """
+        base_id = validate_task.id.rsplit(".", 1)[0]
+        translate_task = self._tasks.get(f"{base_id}.1")
+        if translate_task is None or not translate_task.can_retry():
+            return
+        translate_task.retry_count += 1
+        for task in (translate_task, self._tasks.get(f"{base_id}.2"), validate_task):
+            if task is None:
+                continue
+            self._set_status(task, TaskStatus.NOT_STARTED)
+            task.updated_at = datetime.now()
+            if task is not validate_task:
+                self._record_transition(task)
+        validate_task.result.metadata["retranslate"] = True
+    
     def reset_for_retry(self, task_id: str) -> bool:
         """실패한 태스크를 재시도를 위해 리셋"""
         if task_id not in self._tasks:
@@ -238,42 +556,34 @@ class TaskManager:
         if not task.can_retry():
             return False
         
-        task.status = TaskStatus.NOT_STARTED
+        self._set_status(task, TaskStatus.NOT_STARTED)
         task.updated_at = datetime.now()
-        self._sync_to_file()
+        self._record_transition(task)
         return True
     
     def get_progress(self) -> WorkflowProgress:
         """전체 워크플로우 진행 상황 반환"""
-        total = len(self._tasks)
-        completed = sum(1 for t in self._tasks.values() if t.status == TaskStatus.COMPLETED)
-        in_progress = sum(1 for t in self._tasks.values() if t.status == TaskStatus.IN_PROGRESS)
-        failed = sum(1 for t in self._tasks.values() if t.status == TaskStatus.FAILED)
-        not_started = sum(1 for t in self._tasks.values() if t.status == TaskStatus.NOT_STARTED)
-        
-        return WorkflowProgress(
-            total=total,
-            completed=completed,
-            in_progress=in_progress,
-            failed=failed,
-            not_started=not_started,
-        )
+        counts = {status: 0 for status in TaskStatus}
+        for by_status in self._index.values():
+            for status, task_ids in by_status.items():
+                counts[status] += len(task_ids)
+        return self._progress_from_counts(counts)
     
     def get_phase_progress(self, task_type: TaskType) -> WorkflowProgress:
         """특정 단계의 진행 상황 반환"""
-        tasks = [t for t in self._tasks.values() if t.type == task_type]
-        total = len(tasks)
-        completed = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
-        in_progress = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
-        failed = sum(1 for t in tasks if t.status == TaskStatus.FAILED)
-        not_started = sum(1 for t in tasks if t.status == TaskStatus.NOT_STARTED)
-        
+        by_status = self._index.get(task_type, {})
+        return self._progress_from_counts(
+            {status: len(by_status.get(status, ())) for status in TaskStatus}
+        )
+    
+    def _progress_from_counts(self, counts: Dict[TaskStatus, int]) -> WorkflowProgress:
+        """상태별 태스크 수를 WorkflowProgress로 변환 (내부 함수)"""
         return WorkflowProgress(
-            total=total,
-            completed=completed,
-            in_progress=in_progress,
-            failed=failed,
-            not_started=not_started,
+            total=sum(counts.values()),
+            completed=counts[TaskStatus.COMPLETED],
+            in_progress=counts[TaskStatus.IN_PROGRESS],
+            failed=counts[TaskStatus.FAILED],
+            not_started=counts[TaskStatus.NOT_STARTED],
         )
     
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -284,6 +594,21 @@ class TaskManager:
         """모든 태스크 반환"""
         return list(self._tasks.values())
     
+    def get_results(self, task_type: TaskType) -> List[TaskResult]:
+        """
+        유형별 마지막 실행 결과 (완료/실패 태스크, 이전 실행에서 저장소로 복원된 결과 포함)
+        
+        리포트를 이번 실행 결과뿐 아니라 workflow 전체 기준으로 만들 때 사용합니다.
+        """
+        by_status = self._index.get(task_type, {})
+        results = []
+        for status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+            for task_id in by_status.get(status, ()):
+                result = self._tasks[task_id].result
+                if result is not None:
+                    results.append(result)
+        return results
+    
     @property
     def tasks_path(self) -> Optional[str]:
         return self._tasks_path
@@ -296,6 +621,21 @@ class TaskManager:
     def workshop_path(self) -> Optional[str]:
         return self._workshop_path
     
+    @property
+    def source_lang(self) -> str:
+        return self._source_lang
+    
+    @property
+    def invalidated_files(self) -> List[str]:
+        """마지막 initialize에서 원본 변경으로 재번역 대상이 된 파일 목록"""
+        return list(self._invalidated_files)
+    
+    def _relative_path(self, file_path: str) -> str:
+        """Workshop 기준 상대 경로 (tasks.md 표시 및 해시 키용)"""
+        if self._workshop_path and self._workshop_path in file_path:
+            return file_path.replace(self._workshop_path, "").lstrip("/")
+        return file_path
+    
     def _sync_to_file(self):
         """메모리 상태를 tasks.md에 동기화 (Orchestrator 전용)"""
         if not self._tasks_path:
@@ -307,8 +647,14 @@ class TaskManager:
         # tasks.md 내용 생성
         content = self._generate_tasks_md()
         
-        with open(self._tasks_path, "w", encoding="utf-8") as f:
+        # 임시 파일에 쓴 뒤 교체 (쓰기 중 중단되어도 tasks.md가 잘리지 않음)
+        tmp_path = self._tasks_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(content)
+        os.replace(tmp_path, self._tasks_path)
+        
+        self._render_pending = False
+        self._last_render = time.monotonic()
     
     def _generate_tasks_md(self) -> str:
         """tasks.md 내용 생성"""
@@ -336,9 +682,7 @@ class TaskManager:
             base_id = f"2.{i}"
             
             # 파일명 추출
-            rel_path = file_path
-            if self._workshop_path and self._workshop_path in file_path:
-                rel_path = file_path.replace(self._workshop_path, "").lstrip("/")
+            rel_path = self._relative_path(file_path)
             
             # 부모 태스크 상태 계산
             subtasks = [
@@ -350,7 +694,17 @@ class TaskManager:
             any_in_progress = any(t and t.status == TaskStatus.IN_PROGRESS for t in subtasks)
             
             parent_checkbox = "[x]" if all_completed else "[~]" if any_in_progress else "[ ]"
-            lines.append(f"- {parent_checkbox} {base_id} `{rel_path}` 처리")
+            
+            # 원본/번역 해시 (재개 시 변경 감지용, Markdown 렌더링 시 숨김)
+            hash_comment = ""
+            translate_task = subtasks[0]
+            if translate_task and translate_task.source_hash:
+                hash_comment = f" <!-- source:{translate_task.source_hash}"
+                if translate_task.target_hash:
+                    hash_comment += f" target:{translate_task.target_hash}"
+                hash_comment += " -->"
+            
+            lines.append(f"- {parent_checkbox} {base_id} `{rel_path}` 처리{hash_comment}")
             
             # 서브태스크
             for task in subtasks:
@@ -404,7 +758,98 @@ class TaskManager:
         return mapping.get(task_type, str(task_type))
 
 
-# 전역 인스턴스 접근 함수
-def get_task_manager() -> TaskManager:
-    """TaskManager 싱글톤 인스턴스 반환"""
-    return TaskManager()
+# 세션별 인스턴스 레지스트리 (세션 ID → TaskManager, 최근 사용 순)
+_managers: "OrderedDict[str, TaskManager]" = OrderedDict()
+_managers_lock = threading.Lock()
+
+# 현재 실행 컨텍스트의 세션 ID (AgentCore 요청 또는 headless 실행 단위로 설정)
+_current_session: ContextVar[str] = ContextVar("wstranslator_session", default=DEFAULT_SESSION)
+
+
+def set_current_session(session_id: Optional[str]) -> Token:
+    """
+    현재 컨텍스트의 세션 ID 설정
+    
+    asyncio 태스크와 asyncio.to_thread로 실행되는 도구는 설정 시점의 컨텍스트를 이어받으므로
+    요청 진입점에서 한 번 설정하면 Orchestrator 도구가 같은 세션의 TaskManager를 사용합니다.
+    
+    Returns:
+        Token: reset_current_session에 전달할 토큰
+    """
+    return _current_session.set(session_id or DEFAULT_SESSION)
+
+
+def reset_current_session(token: Token):
+    """set_current_session 이전 값으로 복원"""
+    _current_session.reset(token)
+
+
+def get_task_manager(session_id: Optional[str] = None) -> TaskManager:
+    """
+    세션의 TaskManager 반환 (없으면 생성)
+    
+    Args:
+        session_id: 세션 ID 또는 workshop 경로 (None이면 현재 컨텍스트의 세션, 기본 DEFAULT_SESSION)
+    
+    Returns:
+        TaskManager: 세션 전용 인스턴스
+    """
+    session_id = session_id or _current_session.get()
+    evicted = []
+    with _managers_lock:
+        manager = _managers.get(session_id)
+        if manager is None:
+            evicted = _evict_idle_managers(MAX_TASK_MANAGERS - 1)
+            manager = TaskManager(session_id)
+            _managers[session_id] = manager
+        _managers.move_to_end(session_id)
+    # 제거된 세션의 저장소는 레지스트리 락 밖에서 반영 후 닫음
+    for idle in evicted:
+        idle.close()
+    return manager
+
+
+def release_task_manager(session_id: Optional[str] = None) -> bool:
+    """
+    세션의 TaskManager를 레지스트리에서 제거 (미뤄둔 기록을 반영하고 저장소를 닫음, 진행 상태는 tasks.md에 유지)
+    
+    Returns:
+        bool: 제거 여부
+    """
+    session_id = session_id or _current_session.get()
+    with _managers_lock:
+        manager = _managers.pop(session_id, None)
+    if manager is None:
+        return False
+    manager.close()
+    return True
+
+
+def find_task_manager(tasks_path: str, exclude_session: Optional[str] = None) -> Optional[TaskManager]:
+    """같은 tasks.md를 사용 중인 다른 세션의 TaskManager 조회 (중복 실행 방지용)"""
+    tasks_path = os.path.abspath(tasks_path)
+    with _managers_lock:
+        for session_id, manager in _managers.items():
+            if session_id == exclude_session or not manager.tasks_path:
+                continue
+            if os.path.abspath(manager.tasks_path) == tasks_path:
+                return manager
+    return None
+
+
+def _evict_idle_managers(keep: int) -> List[TaskManager]:
+    """
+    keep개를 넘으면 진행 중 태스크가 없는 오래된 세션부터 제거 (락 보유 상태에서 호출, 내부 함수)
+
+    Returns:
+        List[TaskManager]: 제거된 인스턴스 (호출자가 락 밖에서 close)
+    """
+    evicted = []
+    for session_id in list(_managers):
+        if len(_managers) <= keep:
+            break
+        manager = _managers[session_id]
+        if manager.get_progress().in_progress:
+            continue
+        evicted.append(_managers.pop(session_id))
+    return evicted
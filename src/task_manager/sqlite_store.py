@@ -0,0 +1,163 @@
+# 태스크 상태 SQLite 저장소 (WAL)
+# 저널과 같은 레코드를 (타겟 언어, 상대 경로, 유형) 단위 행으로 저장하여 여러 언어의 상태와 결과를 함께 보관
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .journal import FSYNC_BATCH, FSYNC_INTERVAL_SECONDS
+
+# 저장소 파일명 (translation/ 디렉토리 기준)
+DB_FILENAME = "tasks.db"
+
+# 레코드 필드 → 컬럼 (result는 JSON 문자열로 저장)
+_COLUMNS = [
+    "path", "kind", "status", "retry", "source_hash", "target_hash",
+    "started_at", "finished_at", "elapsed_seconds", "result", "fresh",
+]
+
+
+def db_path_for(tasks_path: str) -> str:
+    """tasks.md 경로에 대응하는 SQLite 경로 (translation/tasks.db)"""
+    return os.path.join(os.path.dirname(tasks_path), DB_FILENAME)
+
+
+class SqliteTaskStore:
+    """
+    SQLite 기반 태스크 상태 저장소 (TaskJournal과 같은 인터페이스)
+
+    - workflows: 타겟 언어별 헤더 (workshop, source_lang, created)
+    - tasks: (target_lang, path, kind) → 상태, 재시도 횟수, 해시, 시각, 결과 JSON
+
+    타겟 언어별로 행이 분리되므로 한 workshop의 여러 언어 진행 상태를 함께 보관합니다.
+    쓰기는 FSYNC_BATCH개 또는 FSYNC_INTERVAL_SECONDS마다 한 번에 커밋합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._target_lang: Optional[str] = None
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS workflows (
+                target_lang TEXT PRIMARY KEY,
+                workshop TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                created TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                target_lang TEXT NOT NULL,
+                path TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                retry INTEGER NOT NULL DEFAULT 0,
+                source_hash TEXT,
+                target_hash TEXT,
+                started_at TEXT,
+                finished_at TEXT,
+                elapsed_seconds REAL,
+                result TEXT,
+                fresh INTEGER,
+                PRIMARY KEY (target_lang, path, kind)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (target_lang, kind, status);
+            """
+        )
+        # 이전 버전 DB에 없는 컬럼 추가
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if "fresh" not in columns:
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN fresh INTEGER")
+        self._conn.commit()
+
+    def load(self, target_lang: str) -> Tuple[Optional[dict], Dict[Tuple[str, str], dict]]:
+        """
+        타겟 언어의 헤더와 태스크별 상태 레코드 조회
+
+        Returns:
+            Tuple: (헤더 또는 None, (상대 경로, 유형 값) → 상태 레코드)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT workshop, source_lang, created FROM workflows WHERE target_lang = ?",
+                (target_lang,),
+            ).fetchone()
+            if row is None:
+                return None, {}
+            header = {"workshop": row[0], "target_lang": target_lang, "source_lang": row[1], "created": row[2]}
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE target_lang = ?",
+                (target_lang,),
+            ).fetchall()
+
+        states = {}
+        for row in rows:
+            record = {"type": "task"}
+            for column, value in zip(_COLUMNS, row):
+                if value is None:
+                    continue
+                record[column] = json.loads(value) if column == "result" else value
+            states[(record["path"], record["kind"])] = record
+        return header, states
+
+    def reset(self, header: dict, records: list):
+        """타겟 언어의 상태를 현재 스냅샷으로 교체 (다른 언어의 행은 유지)"""
+        self._target_lang = header["target_lang"]
+        with self._lock:
+            self._conn.execute("DELETE FROM tasks WHERE target_lang = ?", (self._target_lang,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO workflows (target_lang, workshop, source_lang, created) VALUES (?, ?, ?, ?)",
+                (self._target_lang, header["workshop"], header["source_lang"], datetime.now().isoformat()),
+            )
+            self._conn.executemany(self._upsert_sql(), [self._row(record) for record in records])
+            self._conn.commit()
+            self._pending = 0
+            self._last_commit = time.monotonic()
+
+    def append(self, record: dict):
+        """태스크 상태 한 건 저장 (배치 커밋)"""
+        with self._lock:
+            self._conn.execute(self._upsert_sql(), self._row(record))
+            self._pending += 1
+            if self._pending >= FSYNC_BATCH or time.monotonic() - self._last_commit >= FSYNC_INTERVAL_SECONDS:
+                self._commit()
+
+    def sync(self):
+        """커밋되지 않은 변경 반영"""
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def _commit(self):
+        """락 보유 상태에서 호출 (내부 함수)"""
+        if self._pending == 0:
+            return
+        self._conn.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def _upsert_sql(self) -> str:
+        placeholders = ", ".join("?" * (len(_COLUMNS) + 1))
+        return f"INSERT OR REPLACE INTO tasks (target_lang, {', '.join(_COLUMNS)}) VALUES ({placeholders})"
+
+    def _row(self, record: dict) -> List:
+        row = [self._target_lang]
+        for column in _COLUMNS:
+            value = record.get(column)
+            if column == "result" and value is not None:
+                value = json.dumps(value, ensure_ascii=False, default=str)
+            row.append(value)
+        return row
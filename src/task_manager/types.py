@@ -60,8 +60,13 @@ class Task:
     result: Optional[TaskResult] = None  # 실행 결과
     retry_count: int = 0                 # 재시도 횟수
     max_retries: int = 3                 # 최대 재시도 횟수
+    source_hash: Optional[str] = None    # 번역 시점 원본 내용 해시 (번역 태스크)
+    target_hash: Optional[str] = None    # 번역 결과 내용 해시 (번역 태스크)
+    fresh: bool = False                  # 번역 메모리/이전 번역 없이 새로 번역 (force_reset 후 번역 태스크)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None   # 마지막 실행 시작 시각
+    finished_at: Optional[datetime] = None  # 마지막 실행 종료 시각
     
     def can_retry(self) -> bool:
         """재시도 가능 여부"""
@@ -75,6 +80,10 @@ class Task:
             "status": self.status.value,
             "depends_on": self.depends_on,
             "retry_count": self.retry_count,
+            "source_hash": self.source_hash,
+            "target_hash": self.target_hash,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
             "result": self.result.to_dict() if self.result else None,
         }
 
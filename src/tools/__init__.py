@@ -2,19 +2,34 @@
 from .file_tools import (
     read_workshop_file,
     write_translated_file,
+    get_target_path,
     list_workshop_files,
     read_contentspec,
     detect_source_language,
+    list_unlabelled_files,
+    normalize_file_names,
+    detect_text_language,
+    detect_file_languages,
     extract_lang_from_filename,
+    compute_file_hash,
     SUPPORTED_LANG_CODES,
 )
+from .workshop_index import get_workshop_index, WorkshopIndex
 
 __all__ = [
     "read_workshop_file",
     "write_translated_file",
+    "get_target_path",
     "list_workshop_files",
     "read_contentspec",
     "detect_source_language",
+    "list_unlabelled_files",
+    "normalize_file_names",
+    "detect_text_language",
+    "detect_file_languages",
     "extract_lang_from_filename",
+    "compute_file_hash",
     "SUPPORTED_LANG_CODES",
+    "get_workshop_index",
+    "WorkshopIndex",
 ]
@@ -1,11 +1,15 @@
 # 파일 처리 도구
 import os
-import glob
+import hashlib
+import math
 import re
 import yaml
+from collections import Counter
 from pathlib import Path
 from typing import Optional, Tuple
 
+from .workshop_index import get_search_path, get_workshop_index
+
 # 지원하는 언어 코드 목록 (파일명에 사용되는 2자리 코드)
 SUPPORTED_LANG_CODES = [
     "en",  # English (en-US)
@@ -57,6 +61,46 @@ def read_workshop_file(file_path: str) -> str:
         return f.read()
 
 
+def read_workshop_file_with_hash(file_path: str) -> Tuple[str, str]:
+    """
+    Workshop 파일을 한 번만 읽어 내용과 SHA-256 해시를 함께 반환합니다.
+    
+    해시는 compute_file_hash와 같은 바이트 기준이므로, 읽은 뒤 파일이 바뀌어도
+    반환된 해시는 반환된 내용과 일치합니다.
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        Tuple[str, str]: (파일 내용, 16진수 해시)
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    # 텍스트 모드로 읽은 것과 같게 줄바꿈 정규화 (read_workshop_file과 동일한 내용)
+    content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return content, hashlib.sha256(data).hexdigest()
+
+
+def compute_file_hash(file_path: str) -> Optional[str]:
+    """
+    파일 내용의 SHA-256 해시를 반환합니다.
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        str: 16진수 해시 (파일이 없으면 None)
+    """
+    if not os.path.exists(file_path):
+        return None
+    
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def extract_lang_from_filename(filename: str) -> Optional[str]:
     """
     파일명에서 언어 코드를 추출합니다.
@@ -77,6 +121,366 @@ def extract_lang_from_filename(filename: str) -> Optional[str]:
     return None
 
 
+def get_target_path(source_path: str, target_lang: str, source_lang: str = "en") -> str:
+    """
+    원본 경로에서 번역 파일 경로를 계산합니다.
+    예: index.en.md → index.ko.md
+    
+    Args:
+        source_path: 원본 파일 경로
+        target_lang: 타겟 언어 코드
+        source_lang: 소스 언어 코드 (기본: en)
+    
+    Returns:
+        str: 번역 파일 경로
+    """
+    return source_path.replace(f".{source_lang}.md", f".{target_lang}.md")
+
+
+def get_labelled_path(file_path: str, lang: str) -> str:
+    """
+    언어 코드가 없는 파일에 언어 코드를 붙인 경로를 계산합니다.
+    예: setup.md → setup.ko.md
+    
+    Args:
+        file_path: 파일 경로
+        lang: 언어 코드
+    
+    Returns:
+        str: 언어 코드가 붙은 파일 경로
+    """
+    return f"{file_path[:-len('.md')]}.{lang}.md"
+
+
+def normalize_file_names(detected: dict[str, str]) -> list[Tuple[str, str, str]]:
+    """
+    감지된 언어에 따라 파일명을 일괄 변경합니다. (index.md → index.en.md)
+    같은 이름의 파일이 이미 있으면 덮어쓰지 않고 건너뜁니다.
+    
+    Args:
+        detected: 파일 경로 → 언어 코드
+    
+    Returns:
+        list[Tuple[str, str, str]]: 변경된 (원래 경로, 새 경로, 언어 코드) 목록
+    """
+    renamed = []
+    for file_path, lang in sorted(detected.items()):
+        new_path = get_labelled_path(file_path, lang)
+        if os.path.exists(new_path):
+            continue
+        os.rename(file_path, new_path)
+        renamed.append((file_path, new_path, lang))
+    return renamed
+
+
+def read_text_sample(file_path: str, max_chars: int = 600) -> str:
+    """
+    언어 감지용 본문 샘플을 읽습니다.
+    front matter와 코드 블록을 건너뛰고 앞부분 문장만 max_chars까지 모읍니다.
+    
+    Args:
+        file_path: 파일 경로
+        max_chars: 최대 글자 수
+    
+    Returns:
+        str: 본문 샘플 (본문이 없으면 빈 문자열)
+    """
+    sample = []
+    length = 0
+    in_front_matter = False
+    in_fence = False
+    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f):
+            stripped = line.strip()
+            if line_no == 0 and stripped == "---":
+                in_front_matter = True
+                continue
+            if in_front_matter:
+                in_front_matter = stripped != "---"
+                continue
+            if stripped.startswith(("```", "~~~")):
+                in_fence = not in_fence
+                continue
+            if in_fence or not stripped or stripped.startswith(("{{", "<!--", "![")):
+                continue
+            sample.append(stripped)
+            length += len(stripped) + 1
+            if length >= max_chars:
+                break
+    return "\n".join(sample)[:max_chars]
+
+
+# 언어 감지 설정
+# - DETECT_MIN_LETTERS: 이보다 글자가 적은 샘플은 판단하지 않음 (모델로 넘김)
+# - DETECT_SCRIPT_RATIO: 라틴 문자 외 문자 체계가 이 비율 이상이면 문자 체계로 결정
+# - DETECT_MIN_MARGIN: 라틴 문자 언어의 1, 2위 n-gram 유사도 차이가 이보다 작으면 모호한 것으로 판단
+DETECT_MIN_LETTERS = 20
+DETECT_SCRIPT_RATIO = 0.2
+DETECT_MIN_MARGIN = 0.03
+
+# 문자 체계별 Unicode 범위
+_SCRIPT_RANGES = [
+    ("hangul", 0xAC00, 0xD7A3),
+    ("hangul", 0x1100, 0x11FF),
+    ("hangul", 0x3130, 0x318F),
+    ("kana", 0x3040, 0x30FF),
+    ("han", 0x4E00, 0x9FFF),
+    ("han", 0x3400, 0x4DBF),
+    ("cyrillic", 0x0400, 0x04FF),
+    ("arabic", 0x0600, 0x06FF),
+    ("arabic", 0x0750, 0x077F),
+]
+
+# 우크라이나어에만 있는 키릴 문자 (러시아어 등과 구분)
+_UKRAINIAN_LETTERS = set("іїєґІЇЄҐ")
+
+# 라틴 문자 언어별 n-gram 프로필 원문 (workshop 문서에 자주 나오는 문장)
+_LATIN_SEED_TEXT = {
+    "en": (
+        "In this workshop you will learn how to create and deploy the application on the cloud. "
+        "First, open the console and select the service that you want to use. Then choose the region "
+        "and click the button to create a new resource. When the deployment is complete, you can check "
+        "the status of the stack and verify that everything is working as expected. This step takes a few "
+        "minutes. If you have any questions about the configuration, please refer to the documentation "
+        "for more information. In the next section we will add a database and connect it to the function. "
+        "Amazon provides a broad set of services for storage, databases, analytics and machine "
+        "learning. Each service has its own pricing and limits, so make sure to clean up the resources "
+        "after the lab to avoid unexpected charges. You should also review the security settings and "
+        "grant only the permissions that are required."
+    ),
+    "es": (
+        "En este taller aprenderá a crear y desplegar la aplicación en la nube. Primero, abra la consola "
+        "y seleccione el servicio que desea utilizar. Luego elija la región y haga clic en el botón para "
+        "crear un nuevo recurso. Cuando la implementación esté completa, puede comprobar el estado de la "
+        "pila y verificar que todo funciona como se espera. Este paso tarda unos minutos. Si tiene alguna "
+        "pregunta sobre la configuración, consulte la documentación para obtener más información. En la "
+        "siguiente sección agregaremos una base de datos y la conectaremos a la función. "
+        "Amazon ofrece un amplio conjunto de servicios de almacenamiento, bases de datos, análisis y "
+        "aprendizaje automático. Cada servicio tiene sus propios precios y límites, por lo que debe "
+        "eliminar los recursos después del laboratorio para evitar cargos inesperados. También debe "
+        "revisar la configuración de seguridad y otorgar solo los permisos que son necesarios."
+    ),
+    "fr": (
+        "Dans cet atelier, vous apprendrez à créer et à déployer l'application dans le cloud. Tout "
+        "d'abord, ouvrez la console et sélectionnez le service que vous souhaitez utiliser. Ensuite, "
+        "choisissez la région et cliquez sur le bouton pour créer une nouvelle ressource. Lorsque le "
+        "déploiement est terminé, vous pouvez vérifier l'état de la pile et vous assurer que tout "
+        "fonctionne comme prévu. Cette étape prend quelques minutes. Si vous avez des questions sur la "
+        "configuration, consultez la documentation pour plus d'informations. Dans la section suivante, "
+        "nous allons ajouter une base de données et la connecter à la fonction. "
+        "Amazon propose un large éventail de services de stockage, de bases de données, d'analyse et "
+        "d'apprentissage automatique. Chaque service a ses propres tarifs et limites, il est donc "
+        "important de supprimer les ressources après l'atelier pour éviter des frais inattendus. Vous "
+        "devez également examiner les paramètres de sécurité et n'accorder que les autorisations "
+        "nécessaires."
+    ),
+    "pt": (
+        "Neste workshop, você aprenderá a criar e implantar a aplicação na nuvem. Primeiro, abra o "
+        "console e selecione o serviço que deseja usar. Em seguida, escolha a região e clique no botão "
+        "para criar um novo recurso. Quando a implantação estiver concluída, você pode verificar o status "
+        "da pilha e confirmar que tudo está funcionando como esperado. Esta etapa leva alguns minutos. Se "
+        "você tiver alguma dúvida sobre a configuração, consulte a documentação para obter mais "
+        "informações. Na próxima seção, vamos adicionar um banco de dados e conectá-lo à função. "
+        "A Amazon oferece um amplo conjunto de serviços de armazenamento, bancos de dados, análise e "
+        "aprendizado de máquina. Cada serviço tem seus próprios preços e limites, portanto não se "
+        "esqueça de excluir os recursos depois do laboratório para evitar cobranças inesperadas. Você "
+        "também deve revisar as configurações de segurança e conceder apenas as permissões que são "
+        "necessárias."
+    ),
+    "de": (
+        "In diesem Workshop lernen Sie, wie Sie die Anwendung in der Cloud erstellen und bereitstellen. "
+        "Öffnen Sie zuerst die Konsole und wählen Sie den Dienst aus, den Sie verwenden möchten. Wählen "
+        "Sie dann die Region und klicken Sie auf die Schaltfläche, um eine neue Ressource zu erstellen. "
+        "Wenn die Bereitstellung abgeschlossen ist, können Sie den Status des Stacks überprüfen und "
+        "sicherstellen, dass alles wie erwartet funktioniert. Dieser Schritt dauert einige Minuten. Wenn "
+        "Sie Fragen zur Konfiguration haben, finden Sie weitere Informationen in der Dokumentation. Im "
+        "nächsten Abschnitt fügen wir eine Datenbank hinzu und verbinden sie mit der Funktion. "
+        "Amazon bietet eine breite Palette von Diensten für Speicher, Datenbanken, Analysen und "
+        "maschinelles Lernen. Jeder Dienst hat eigene Preise und Limits, daher sollten Sie die "
+        "Ressourcen nach dem Lab löschen, um unerwartete Kosten zu vermeiden. Außerdem sollten Sie die "
+        "Sicherheitseinstellungen prüfen und nur die Berechtigungen erteilen, die wirklich erforderlich "
+        "sind."
+    ),
+    "it": (
+        "In questo workshop imparerai a creare e distribuire l'applicazione nel cloud. Per prima cosa, "
+        "apri la console e seleziona il servizio che desideri utilizzare. Quindi scegli la regione e fai "
+        "clic sul pulsante per creare una nuova risorsa. Quando la distribuzione è completata, puoi "
+        "controllare lo stato dello stack e verificare che tutto funzioni come previsto. Questo passaggio "
+        "richiede alcuni minuti. Se hai domande sulla configurazione, consulta la documentazione per "
+        "ulteriori informazioni. Nella sezione successiva aggiungeremo un database e lo collegheremo "
+        "alla funzione. "
+        "Amazon offre un'ampia gamma di servizi per l'archiviazione, i database, l'analisi e "
+        "l'apprendimento automatico. Ogni servizio ha i propri prezzi e limiti, quindi assicurati di "
+        "eliminare le risorse dopo il laboratorio per evitare addebiti imprevisti. Dovresti anche "
+        "rivedere le impostazioni di sicurezza e concedere solo le autorizzazioni che sono necessarie."
+    ),
+    "pl": (
+        "W tych warsztatach dowiesz się, jak utworzyć i wdrożyć aplikację w chmurze. Najpierw otwórz "
+        "konsolę i wybierz usługę, której chcesz użyć. Następnie wybierz region i kliknij przycisk, aby "
+        "utworzyć nowy zasób. Po zakończeniu wdrożenia możesz sprawdzić stan stosu i upewnić się, że "
+        "wszystko działa zgodnie z oczekiwaniami. Ten krok zajmuje kilka minut. Jeśli masz pytania "
+        "dotyczące konfiguracji, zapoznaj się z dokumentacją, aby uzyskać więcej informacji. W następnej "
+        "sekcji dodamy bazę danych i połączymy ją z funkcją. "
+        "Amazon oferuje szeroki zestaw usług do przechowywania danych, baz danych, analityki i uczenia "
+        "maszynowego. Każda usługa ma własne ceny i limity, dlatego po zakończeniu laboratorium usuń "
+        "zasoby, aby uniknąć nieoczekiwanych opłat. Powinieneś również przejrzeć ustawienia "
+        "zabezpieczeń i przyznać tylko te uprawnienia, które są niezbędne."
+    ),
+    "id": (
+        "Dalam lokakarya ini, Anda akan belajar cara membuat dan menerapkan aplikasi di cloud. Pertama, "
+        "buka konsol dan pilih layanan yang ingin Anda gunakan. Kemudian pilih wilayah dan klik tombol "
+        "untuk membuat sumber daya baru. Setelah penerapan selesai, Anda dapat memeriksa status tumpukan "
+        "dan memastikan bahwa semuanya berjalan seperti yang diharapkan. Langkah ini memerlukan waktu "
+        "beberapa menit. Jika Anda memiliki pertanyaan tentang konfigurasi, silakan lihat dokumentasi "
+        "untuk informasi lebih lanjut. Pada bagian berikutnya, kita akan menambahkan basis data dan "
+        "menghubungkannya ke fungsi. "
+        "Amazon menyediakan berbagai layanan untuk penyimpanan, basis data, analitik, dan pembelajaran "
+        "mesin. Setiap layanan memiliki harga dan batasnya sendiri, jadi pastikan untuk menghapus "
+        "sumber daya setelah lab selesai agar tidak ada biaya yang tidak terduga. Anda juga harus "
+        "meninjau pengaturan keamanan dan hanya memberikan izin yang diperlukan."
+    ),
+    "nl": (
+        "In deze workshop leert u hoe u de applicatie in de cloud maakt en implementeert. Open eerst de "
+        "console en selecteer de service die u wilt gebruiken. Kies vervolgens de regio en klik op de "
+        "knop om een nieuwe resource te maken. Wanneer de implementatie is voltooid, kunt u de status van "
+        "de stack controleren en nagaan of alles werkt zoals verwacht. Deze stap duurt enkele minuten. "
+        "Als u vragen hebt over de configuratie, raadpleeg dan de documentatie voor meer informatie. In "
+        "de volgende sectie voegen we een database toe en verbinden we deze met de functie. "
+        "Amazon biedt een breed scala aan services voor opslag, databases, analyses en machine "
+        "learning. Elke service heeft zijn eigen prijzen en limieten, dus zorg ervoor dat u de "
+        "resources na het lab verwijdert om onverwachte kosten te voorkomen. U moet ook de "
+        "beveiligingsinstellingen controleren en alleen de machtigingen verlenen die echt nodig zijn."
+    ),
+}
+
+# 라틴 문자 언어별 trigram 프로필 (처음 사용할 때 생성)
+_latin_profiles: Optional[dict] = None
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+def _trigram_counts(text: str) -> Counter:
+    """단어 경계를 공백으로 표시한 문자 trigram 빈도 (내부 함수)"""
+    counts = Counter()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            counts[padded[i:i + 3]] += 1
+    return counts
+
+
+def _normalized(counts: Counter) -> dict:
+    """벡터 길이 1로 정규화 (내부 함수)"""
+    norm = math.sqrt(sum(value * value for value in counts.values())) or 1.0
+    return {key: value / norm for key, value in counts.items()}
+
+
+def _get_latin_profiles() -> dict:
+    global _latin_profiles
+    if _latin_profiles is None:
+        _latin_profiles = {
+            lang: _normalized(_trigram_counts(text)) for lang, text in _LATIN_SEED_TEXT.items()
+        }
+    return _latin_profiles
+
+
+def _script_histogram(text: str) -> Counter:
+    """문자 체계별 글자 수 (라틴 문자는 "latin", 내부 함수)"""
+    histogram = Counter()
+    for char in text:
+        if not char.isalpha():
+            continue
+        code = ord(char)
+        if code < 0x0250:
+            histogram["latin"] += 1
+            continue
+        for script, low, high in _SCRIPT_RANGES:
+            if low <= code <= high:
+                histogram[script] += 1
+                break
+        else:
+            histogram["other"] += 1
+    return histogram
+
+
+def detect_text_language(text: str) -> Tuple[Optional[str], float]:
+    """
+    본문 텍스트의 언어를 로컬에서 감지합니다.
+    
+    1. Unicode 문자 체계 분포: 한글 → ko, 가나 → ja, 한자만 → zh, 아랍 문자 → ar,
+       우크라이나어 고유 문자가 있는 키릴 문자 → uk
+    2. 라틴 문자: 언어별 문자 trigram 프로필과 코사인 유사도 비교
+    
+    글자가 너무 적거나, 다른 키릴 문자 언어일 수 있거나, 라틴 문자 언어의 1, 2위 차이가
+    작으면 모호한 것으로 보고 None을 반환합니다.
+    
+    Args:
+        text: 본문 텍스트 (코드 블록 제외 권장)
+    
+    Returns:
+        Tuple[Optional[str], float]: (언어 코드 또는 None, 신뢰도 0~1)
+    """
+    histogram = _script_histogram(text)
+    letters = sum(histogram.values())
+    if letters < DETECT_MIN_LETTERS:
+        return None, 0.0
+    
+    # 라틴 문자 외 문자 체계 (기술 용어가 영어로 섞여 있어도 일정 비율 이상이면 해당 언어)
+    hangul = histogram["hangul"]
+    kana = histogram["kana"]
+    cjk = hangul + kana + histogram["han"]
+    if cjk / letters >= DETECT_SCRIPT_RATIO:
+        if hangul >= kana and hangul >= histogram["han"] * 0.5:
+            return "ko", hangul / cjk
+        if kana:
+            return "ja", (kana + histogram["han"]) / cjk
+        return "zh", histogram["han"] / cjk
+    if histogram["arabic"] / letters >= DETECT_SCRIPT_RATIO:
+        return "ar", histogram["arabic"] / letters
+    if histogram["cyrillic"] / letters >= DETECT_SCRIPT_RATIO:
+        if any(char in _UKRAINIAN_LETTERS for char in text):
+            return "uk", histogram["cyrillic"] / letters
+        return None, 0.0
+    if histogram["latin"] / letters < 1 - DETECT_SCRIPT_RATIO:
+        return None, 0.0
+    
+    # 라틴 문자 언어: trigram 코사인 유사도
+    sample = _normalized(_trigram_counts(text))
+    scores = sorted(
+        (
+            (sum(weight * profile.get(gram, 0.0) for gram, weight in sample.items()), lang)
+            for lang, profile in _get_latin_profiles().items()
+        ),
+        reverse=True,
+    )
+    (best, lang), (second, _) = scores[0], scores[1]
+    if best - second < DETECT_MIN_MARGIN:
+        return None, round(best, 3)
+    return lang, round(best, 3)
+
+
+def detect_file_languages(file_paths: list[str], max_chars: int = 600) -> Tuple[dict[str, str], list[str]]:
+    """
+    여러 파일의 언어를 본문 샘플로 한 번에 감지합니다.
+    
+    Args:
+        file_paths: 파일 경로 목록
+        max_chars: 파일당 샘플 글자 수
+    
+    Returns:
+        Tuple[dict[str, str], list[str]]: (파일 경로 → 언어 코드, 로컬에서 판단하지 못한 파일 목록)
+    """
+    detected = {}
+    ambiguous = []
+    for file_path in file_paths:
+        lang, _ = detect_text_language(read_text_sample(file_path, max_chars))
+        if lang is None:
+            ambiguous.append(file_path)
+        else:
+            detected[file_path] = lang
+    return detected, ambiguous
+
+
 def write_translated_file(
     source_path: str, 
     content: str, 
@@ -97,7 +501,7 @@ def write_translated_file(
         str: 저장된 파일 경로
     """
     # .{source_lang}.md → .{target_lang}.md
-    target_path = source_path.replace(f".{source_lang}.md", f".{target_lang}.md")
+    target_path = get_target_path(source_path, target_lang, source_lang)
     
     # 디렉토리 생성 (필요시)
     os.makedirs(os.path.dirname(target_path), exist_ok=True)
@@ -119,36 +523,37 @@ def detect_source_language(workshop_path: str) -> Tuple[str, list[str]]:
     Returns:
         Tuple[str, list[str]]: (소스 언어 코드, 파일 목록)
     """
-    content_path = os.path.join(workshop_path, "content")
-    if os.path.exists(content_path):
-        search_path = content_path
-    else:
-        search_path = workshop_path
-    
-    # 1. 먼저 .en.md 파일 탐색
-    en_files = glob.glob(os.path.join(search_path, "**/*.en.md"), recursive=True)
-    if en_files:
-        return "en", sorted(en_files)
+    search_path = get_search_path(workshop_path)
+    index = get_workshop_index(workshop_path)
+    languages = index.languages()
     
-    # 2. .en.md가 없으면 다른 언어 파일 탐색
+    # 1. .en.md 우선, 없으면 SUPPORTED_LANG_CODES 순서로 다른 언어 파일 탐색
     for lang in SUPPORTED_LANG_CODES:
-        if lang == "en":
-            continue
-        pattern = f"**/*.{lang}.md"
-        files = glob.glob(os.path.join(search_path, pattern), recursive=True)
-        if files:
-            return lang, sorted(files)
-    
-    # 3. 언어 코드 없는 .md 파일도 확인 (기본 언어로 간주)
-    md_files = glob.glob(os.path.join(search_path, "**/*.md"), recursive=True)
-    # 언어 코드가 있는 파일 제외
-    plain_md_files = [f for f in md_files if not extract_lang_from_filename(f)]
+        if languages.get(lang):
+            return lang, _join_paths(search_path, index.markdown_files(lang))
+    
+    # 2. 언어 코드 없는 .md 파일도 확인 (기본 언어로 간주, 지원하지 않는 코드 포함)
+    plain_md_files = _unlabelled_rel_paths(index)
     if plain_md_files:
-        return "unknown", sorted(plain_md_files)
+        return "unknown", _join_paths(search_path, plain_md_files)
     
     return "none", []
 
 
+def list_unlabelled_files(workshop_path: str) -> list[str]:
+    """
+    언어 코드가 없는 .md 파일 목록을 반환합니다. (예: index.md, setup.md)
+    
+    Args:
+        workshop_path: Workshop 루트 경로
+    
+    Returns:
+        list[str]: 파일 경로 목록 (정렬됨)
+    """
+    index = get_workshop_index(workshop_path)
+    return _join_paths(get_search_path(workshop_path), _unlabelled_rel_paths(index))
+
+
 def list_workshop_files(
     workshop_path: str, 
     source_lang: str = None
@@ -164,20 +569,28 @@ def list_workshop_files(
     Returns:
         Tuple[str, list[str]]: (소스 언어 코드, 파일 경로 목록)
     """
-    content_path = os.path.join(workshop_path, "content")
-    if os.path.exists(content_path):
-        search_path = content_path
-    else:
-        search_path = workshop_path
-    
     # 소스 언어가 지정되지 않으면 자동 감지
     if source_lang is None:
         return detect_source_language(workshop_path)
     
-    # 소스 언어가 지정된 경우 해당 패턴으로 탐색
-    pattern = f"**/*.{source_lang}.md"
-    files = glob.glob(os.path.join(search_path, pattern), recursive=True)
-    return source_lang, sorted(files)
+    # 소스 언어가 지정된 경우 파일 인덱스에서 해당 언어 파일 조회
+    index = get_workshop_index(workshop_path)
+    return source_lang, _join_paths(get_search_path(workshop_path), index.markdown_files(source_lang))
+
+
+def _unlabelled_rel_paths(index) -> list[str]:
+    """인덱스에서 지원 언어 코드가 없는 .md 파일의 상대 경로 (내부 함수)"""
+    return [
+        path
+        for lang in index.languages()
+        if lang not in SUPPORTED_LANG_CODES
+        for path in index.markdown_files(lang)
+    ]
+
+
+def _join_paths(search_path: str, rel_paths: list[str]) -> list[str]:
+    """인덱스의 상대 경로를 탐색 루트 기준 경로로 변환 (정렬됨, 내부 함수)"""
+    return sorted(os.path.join(search_path, rel_path) for rel_path in rel_paths)
 
 
 def read_contentspec(workshop_path: str) -> Optional[dict]:
@@ -0,0 +1,228 @@
+# Markdown 블록 분할 도구
+# 번역 메모리, 증분 번역 등에서 공통으로 사용하는 블록(세그먼트) 단위 처리
+
+import difflib
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+# 코드 펜스 시작/종료 (``` 또는 ~~~, 들여쓰기 3칸까지 허용)
+FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+
+# ATX 헤더 (# ~ ######)
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+')
+
+# 한 줄 전체가 Hugo shortcode인 줄 ({{% notice %}}, {{< /tab >}} 등)
+SHORTCODE_LINE_PATTERN = re.compile(r'^\s*\{\{[<%].*?[%>]\}\}\s*$')
+
+# 구조 요소 패턴 (번역 전 마스킹에서 사용, Validator는 tools/markdown_structure.py의 스캐너 사용)
+SHORTCODE_PATTERN = re.compile(r'\{\{[<%].*?[%>]\}\}')
+# 링크 대상은 한 단계 괄호 짝 허용 (https://en.wikipedia.org/wiki/A_(b))
+LINK_TARGET_PATTERN = re.compile(r'\]\(((?:[^()\n]|\([^()\n]*\))+)\)')
+INLINE_CODE_PATTERN = re.compile(r'(`+)[^`\n]+?\1')
+# 일반 URL은 괄호 짝을 허용하고, 문장 끝 구두점(.,;:!?)은 포함하지 않음
+BARE_URL_PATTERN = re.compile(
+    r'https?://(?:[^\s()<>\[\]"\']|\([^\s()]*\))*(?:[^\s()<>\[\]"\'.,;:!?]|\([^\s()]*\))'
+)
+FENCED_BLOCK_PATTERN = re.compile(
+    r'^ {0,3}(`{3,}|~{3,})[^\n]*\n.*?(?:^ {0,3}\1[`~]*[ \t]*$|\Z)',
+    re.MULTILINE | re.DOTALL,
+)
+
+
+@dataclass
+class Segment:
+    """
+    번역 단위 세그먼트
+
+    prefix + text + suffix == 원본 블록 (byte-exact)
+    번역 시 text만 교체하고 prefix/suffix(앞뒤 개행)는 원본 그대로 유지
+    """
+    prefix: str
+    text: str
+    suffix: str
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.text.strip()
+
+    @property
+    def hash(self) -> str:
+        return segment_hash(self.text)
+
+
+def split_blocks(content: str) -> List[str]:
+    """
+    Markdown을 빈 줄 기준 블록으로 분할합니다.
+
+    - Front matter(파일 시작의 --- ... ---)는 하나의 블록
+    - 코드 펜스는 내부에 빈 줄이 있어도 하나의 블록
+    - 헤더, 코드 펜스, 한 줄짜리 Hugo shortcode는 빈 줄이 없어도 블록 경계
+    - 각 블록은 뒤따르는 빈 줄을 포함하므로 "".join(blocks) == content
+
+    Args:
+        content: Markdown 내용
+
+    Returns:
+        List[str]: 블록 목록
+    """
+    lines = content.splitlines(keepends=True)
+    blocks: List[str] = []
+    current: List[str] = []
+    i = 0
+    boundary = False  # 다음 내용 줄에서 새 블록 시작 (front matter/펜스 종료 직후)
+
+    def has_content(block_lines: List[str]) -> bool:
+        return any(l.strip() for l in block_lines)
+
+    # Front matter
+    if lines and lines[0].rstrip("\r\n") == "---":
+        for j in range(1, len(lines)):
+            if lines[j].rstrip("\r\n") == "---":
+                current = lines[:j + 1]
+                i = j + 1
+                boundary = True
+                break
+
+    fence = None  # 열린 코드 펜스 마커
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        match = FENCE_PATTERN.match(line)
+
+        if fence:
+            current.append(line)
+            # 같은 문자로 같거나 긴 마커만 있는 줄이면 펜스 종료
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not stripped.lstrip(fence[0]):
+                fence = None
+                boundary = True
+        elif match or HEADING_PATTERN.match(line) or SHORTCODE_LINE_PATTERN.match(line):
+            # 코드 펜스, 헤더, shortcode 줄은 빈 줄 없이 붙어 있어도 새 블록 시작
+            if has_content(current):
+                blocks.append("".join(current))
+                current = []
+            current.append(line)
+            fence = match.group(1) if match else None
+            # shortcode 줄은 단독 블록 (다음 내용 줄에서 새 블록)
+            boundary = bool(SHORTCODE_LINE_PATTERN.match(line)) and not match
+        elif not stripped:
+            current.append(line)
+        else:
+            # 빈 줄 뒤에 새 내용이 시작되면 이전 블록 종료
+            if has_content(current) and (boundary or not current[-1].strip()):
+                blocks.append("".join(current))
+                current = []
+            current.append(line)
+            boundary = False
+        i += 1
+
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
+def split_segments(content: str) -> List[Segment]:
+    """
+    블록을 (앞 개행, 본문, 뒤 공백) 세그먼트로 분해합니다.
+
+    Returns:
+        List[Segment]: "".join(s.prefix + s.text + s.suffix) == content
+    """
+    segments = []
+    for block in split_blocks(content):
+        match = re.match(r'^(\s*\n)?(.*?)(\s*)$', block, re.DOTALL)
+        segments.append(Segment(
+            prefix=match.group(1) or "",
+            text=match.group(2),
+            suffix=match.group(3),
+        ))
+    return segments
+
+
+def normalize_segment(text: str) -> str:
+    """
+    해시 계산용 정규화 (개행 통일, 줄 끝 공백 제거, 앞뒤 빈 줄 제거)
+
+    줄 안의 공백은 코드 들여쓰기 때문에 유지합니다.
+    """
+    text = text.replace("\r\n", "\n")
+    lines = [line.rstrip() for line in text.split("\n")]
+    return "\n".join(lines).strip("\n")
+
+
+def segment_hash(text: str) -> str:
+    """정규화된 세그먼트의 SHA-256 해시"""
+    return hashlib.sha256(normalize_segment(text).encode("utf-8")).hexdigest()
+
+
+def match_unchanged_segments(old: List[Segment], new: List[Segment]) -> Dict[int, int]:
+    """
+    이전/현재 세그먼트 목록을 순서를 보존하며 정렬하여 변경되지 않은 블록을 찾습니다.
+
+    Args:
+        old: 이전 원본 세그먼트 목록
+        new: 현재 원본 세그먼트 목록
+
+    Returns:
+        Dict[int, int]: 현재 세그먼트 인덱스 → 내용이 같은 이전 세그먼트 인덱스
+    """
+    matcher = difflib.SequenceMatcher(
+        a=[segment.hash for segment in old],
+        b=[segment.hash for segment in new],
+        autojunk=False,
+    )
+    mapping = {}
+    for tag, i1, i2, j1, _ in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                mapping[j1 + offset] = i1 + offset
+    return mapping
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 근사치 (모델 호출 없이 계산)
+
+    ASCII는 약 4자당 1토큰, 그 외(한글/한자/가나 등)는 1자당 약 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def chunk_segments(
+    segments: List[Tuple[str, str]],
+    max_tokens: int
+) -> List[List[Tuple[str, str]]]:
+    """
+    (세그먼트 ID, 원문) 목록을 순서를 유지하며 토큰 예산 이하의 청크로 묶습니다.
+
+    - 세그먼트 중간에서는 자르지 않음 (예산보다 큰 세그먼트는 단독 청크)
+    - 청크가 예산의 절반 이상 찼으면 헤더로 시작하는 세그먼트 앞에서 우선 분할
+
+    Args:
+        segments: (세그먼트 ID, 원문) 목록
+        max_tokens: 청크당 최대 토큰 수 (근사치)
+
+    Returns:
+        List[List[Tuple[str, str]]]: 청크 목록
+    """
+    chunks: List[List[Tuple[str, str]]] = []
+    current: List[Tuple[str, str]] = []
+    current_tokens = 0
+
+    for seg_id, text in segments:
+        tokens = estimate_tokens(text)
+        over_budget = current_tokens + tokens > max_tokens
+        heading_break = current_tokens >= max_tokens // 2 and HEADING_PATTERN.match(text)
+        if current and (over_budget or heading_break):
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append((seg_id, text))
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
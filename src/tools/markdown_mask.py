@@ -0,0 +1,79 @@
+# 번역 전 마스킹 도구
+# 코드 블록, Hugo shortcode, 링크 URL, 인라인 코드를 자리표시자로 바꿔
+# 모델에는 번역할 문장만 전달하고, 번역 후 원문 그대로 복원
+
+import re
+from typing import List, Optional, Tuple
+
+from .markdown_blocks import (
+    FENCED_BLOCK_PATTERN,
+    INLINE_CODE_PATTERN,
+    SHORTCODE_PATTERN,
+    LINK_TARGET_PATTERN,
+    BARE_URL_PATTERN,
+)
+
+# 자리표시자 형식: ⟦N⟧ (Markdown/Hugo 문법과 겹치지 않는 문자 사용)
+PLACEHOLDER_PATTERN = re.compile(r'⟦(\d+)⟧')
+
+# 문자(letter)가 하나라도 있으면 번역 대상
+_LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+
+def _placeholder(index: int) -> str:
+    return f"⟦{index}⟧"
+
+
+def mask_text(text: str) -> Tuple[str, List[str]]:
+    """
+    번역하지 않을 구간을 자리표시자로 치환합니다.
+
+    치환 순서: 원문의 ⟦N⟧ → 코드 펜스 → 인라인 코드 → Hugo shortcode → 링크/이미지 URL → 일반 URL
+    (앞에서 치환된 구간은 뒤 패턴에 다시 매칭되지 않음)
+    원문에 이미 있는 ⟦N⟧도 자리표시자로 바꿔 두므로 복원 시 자리표시자와 섞이지 않습니다.
+
+    Args:
+        text: 세그먼트 원문
+
+    Returns:
+        Tuple[str, List[str]]: (마스킹된 텍스트, 자리표시자 순서대로의 원문 목록)
+    """
+    originals: List[str] = []
+
+    def replace_whole(match: re.Match) -> str:
+        originals.append(match.group(0))
+        return _placeholder(len(originals) - 1)
+
+    def replace_link_target(match: re.Match) -> str:
+        originals.append(match.group(1))
+        return f"]({_placeholder(len(originals) - 1)})"
+
+    masked = PLACEHOLDER_PATTERN.sub(replace_whole, text)
+    masked = FENCED_BLOCK_PATTERN.sub(replace_whole, masked)
+    masked = INLINE_CODE_PATTERN.sub(replace_whole, masked)
+    masked = SHORTCODE_PATTERN.sub(replace_whole, masked)
+    masked = LINK_TARGET_PATTERN.sub(replace_link_target, masked)
+    masked = BARE_URL_PATTERN.sub(replace_whole, masked)
+    return masked, originals
+
+
+def unmask_text(text: str, originals: List[str]) -> Optional[str]:
+    """
+    자리표시자를 원문으로 복원합니다.
+
+    Args:
+        text: 모델이 번역한 마스킹 텍스트
+        originals: mask_text가 반환한 원문 목록
+
+    Returns:
+        str: 복원된 텍스트 (자리표시자가 누락/중복/변형되었으면 None)
+    """
+    found = [int(index) for index in PLACEHOLDER_PATTERN.findall(text)]
+    if sorted(found) != list(range(len(originals))):
+        return None
+    return PLACEHOLDER_PATTERN.sub(lambda m: originals[int(m.group(1))], text)
+
+
+def needs_translation(masked_text: str) -> bool:
+    """자리표시자를 제외하고 번역할 문자가 남아 있는지 확인"""
+    return bool(_LETTER_PATTERN.search(PLACEHOLDER_PATTERN.sub("", masked_text)))
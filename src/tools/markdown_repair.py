@@ -0,0 +1,252 @@
+# Markdown 구조 자동 복구
+# 검증에서 발견된 구조 오류 중 번역 대상이 아닌 구간(front matter 구분자, 코드 펜스 닫힘,
+# Hugo shortcode 태그, 이미지 경로)을 정렬된 원본에서 그대로 옮겨 모델 호출 없이 수정
+
+from typing import List, Optional, Tuple
+
+from .markdown_structure import (
+    FRONT_MATTER_KEY_PATTERN,
+    MarkdownStructure,
+    align_blocks,
+    scan_structure,
+)
+
+# 줄 편집: (시작 줄, 삭제할 줄 수, 넣을 줄 목록)
+Edit = Tuple[int, int, List[str]]
+
+
+def repair_structure(
+    source_content: str,
+    target_content: str,
+    source: Optional[MarkdownStructure] = None,
+) -> Tuple[str, List[dict]]:
+    """
+    원본 구조를 기준으로 번역본의 구조 오류를 복구합니다.
+
+    단계마다 번역본을 다시 스캔하므로 앞 단계의 수정으로 줄 번호가 바뀌어도 됩니다.
+    1. Front matter: 빠진 ---를 추가 (키 줄까지 모두 빠졌으면 복구하지 않음)
+    2. 코드 펜스: 닫히지 않은 펜스의 본문이 원본과 같으면 원본의 닫는 줄 추가 (깨진 닫는 줄은 교체)
+    3. Shortcode: 이름/종류가 바뀐 태그는 원본 태그로 교체, 빠진 단독 줄 태그는 같은 위치에 삽입
+    4. 이미지: 원본과 이미지 수가 같으면 순서대로 경로를 원본 경로로 교체
+
+    번역본에만 있는 블록은 지우지 않습니다. 복구 후 결과는 호출자가 다시 검증합니다.
+
+    Args:
+        source_content: 원본 내용
+        target_content: 번역 내용
+        source: 원본 구조 지문 (None이면 스캔)
+
+    Returns:
+        Tuple[str, List[dict]]: (복구된 번역 내용, 수정 내역 목록 {"type", "line", ...})
+    """
+    if source is None:
+        source = scan_structure(source_content)
+    newline = "\r\n" if "\r\n" in target_content else "\n"
+    trailing = target_content.endswith(("\n", "\r"))
+    source_lines = source_content.splitlines()
+    lines = target_content.splitlines()
+    repairs: List[dict] = []
+
+    for stage in (_repair_front_matter, _repair_fences, _repair_shortcodes, _repair_images):
+        target = scan_structure(newline.join(lines))
+        lines = stage(source, source_lines, target, lines, repairs)
+
+    content = newline.join(lines)
+    if trailing:
+        content += newline
+    return content, repairs
+
+
+def _apply_edits(lines: List[str], edits: List[Edit]) -> List[str]:
+    """줄 편집을 뒤에서부터 적용 (같은 위치의 삽입은 입력 순서 유지, 내부 함수)"""
+    lines = list(lines)
+    ordered = sorted(enumerate(edits), key=lambda item: (item[1][0], item[0]), reverse=True)
+    for _, (start, delete, insert) in ordered:
+        lines[start:start + delete] = insert
+    return lines
+
+
+def _leading_yaml_lines(lines: List[str], start: int) -> int:
+    """start부터 YAML(front matter 키와 들여쓴/목록 줄)로 보이는 줄 수 (내부 함수)"""
+    end = start
+    while end < len(lines):
+        line = lines[end]
+        if line.rstrip() == "---" or (end == start and not FRONT_MATTER_KEY_PATTERN.match(line)):
+            break
+        if not (FRONT_MATTER_KEY_PATTERN.match(line) or line.startswith((" ", "\t", "- "))):
+            break
+        end += 1
+    return end - start
+
+
+def _repair_front_matter(
+    source: MarkdownStructure,
+    source_lines: List[str],
+    target: MarkdownStructure,
+    lines: List[str],
+    repairs: List[dict],
+) -> List[str]:
+    """front matter 구분자 복구 (내부 함수)"""
+    if not source.has_front_matter or source.front_matter[1] is None:
+        return lines
+
+    if target.has_front_matter:
+        if target.front_matter[1] is not None:
+            return lines
+        # 닫는 --- 누락: 키 줄이 끝나는 위치에 추가
+        count = _leading_yaml_lines(lines, 1)
+        if count == 0:
+            return lines
+        repairs.append({"type": "front_matter_delimiter", "line": count + 2})
+        return _apply_edits(lines, [(1 + count, 0, ["---"])])
+
+    count = _leading_yaml_lines(lines, 0)
+    if count and count < len(lines) and lines[count].rstrip() == "---":
+        # 여는 --- 누락
+        repairs.append({"type": "front_matter_delimiter", "line": 1})
+        return _apply_edits(lines, [(0, 0, ["---"])])
+    if count:
+        # 여는/닫는 --- 모두 누락
+        repairs.append({"type": "front_matter_delimiter", "line": 1})
+        return _apply_edits(lines, [(count, 0, ["---"]), (0, 0, ["---"])])
+
+    # front matter 전체 누락: title 등 번역할 값이 있으므로 원본을 복사하지 않고 재번역에 맡김
+    return lines
+
+
+def _repair_fences(
+    source: MarkdownStructure,
+    source_lines: List[str],
+    target: MarkdownStructure,
+    lines: List[str],
+    repairs: List[dict],
+) -> List[str]:
+    """닫히지 않은 코드 펜스 복구 (펜스 하나를 고치면 다시 스캔, 내부 함수)"""
+    for _ in range(len(source.fences)):
+        unclosed = [index for index, fence in enumerate(target.fences) if not fence.closed]
+        if not unclosed:
+            break
+        index = unclosed[0]
+        if index >= len(source.fences) or not source.fences[index].closed:
+            break
+
+        source_fence = source.fences[index]
+        target_fence = target.fences[index]
+        body = source_lines[source_fence.start_line + 1:source_fence.end_line]
+        body_start = target_fence.start_line + 1
+        target_body = lines[body_start:body_start + len(body)]
+        if [line.rstrip() for line in target_body] != [line.rstrip() for line in body]:
+            break  # 코드 내용이 바뀌었으면 자동 복구하지 않음
+
+        close_at = body_start + len(body)
+        closing = source_lines[source_fence.end_line]
+        # 깨진 닫는 줄(``, ```` ```text ```` 등)은 교체, 없으면 삽입
+        broken = close_at < len(lines) and lines[close_at].lstrip().startswith(("`", "~"))
+        lines = _apply_edits(lines, [(close_at, 1 if broken else 0, [closing])])
+        repairs.append({"type": "fence_closed", "line": close_at + 1})
+        target = scan_structure("\n".join(lines))
+    return lines
+
+
+def _repair_shortcodes(
+    source: MarkdownStructure,
+    source_lines: List[str],
+    target: MarkdownStructure,
+    lines: List[str],
+    repairs: List[dict],
+) -> List[str]:
+    """정렬된 원본 shortcode 태그로 교체/삽입 (내부 함수)"""
+    diffs = align_blocks(source.blocks, target.blocks)
+    missing_indexes = {diff.source_index for diff in diffs if diff.op == "missing"}
+    edits: List[Edit] = []
+    last_inserted = (-2, 0)  # (원본 블록 인덱스, 삽입 위치): 연속으로 빠진 태그는 같은 위치에 순서대로 삽입
+
+    for diff in diffs:
+        if diff.kind != "shortcode":
+            continue
+        if diff.op == "changed" and diff.source_block.kind == diff.target_block.kind == "shortcode":
+            block = diff.target_block
+            original = "\n".join(lines[block.start_line:block.end_line + 1])
+            if block.text not in original:
+                continue
+            replaced = original.replace(block.text, diff.source_block.text, 1)
+            edits.append((block.start_line, block.end_line - block.start_line + 1, replaced.split("\n")))
+            repairs.append({
+                "type": "shortcode_replaced",
+                "line": block.start_line + 1,
+                "from": block.text,
+                "to": diff.source_block.text,
+            })
+        elif diff.op == "missing":
+            block = diff.source_block
+            tag_lines = source_lines[block.start_line:block.end_line + 1]
+            if "\n".join(tag_lines).strip() != block.text:
+                continue  # 문장 안의 shortcode는 위치를 알 수 없음
+            if last_inserted[0] == diff.source_index - 1:
+                position = last_inserted[1]
+            else:
+                position = _insert_position(source, target, diff.source_index, diff.target_index, missing_indexes, len(lines))
+            last_inserted = (diff.source_index, position)
+            edits.append((position, 0, tag_lines))
+            repairs.append({"type": "shortcode_inserted", "line": position + 1, "to": block.text})
+
+    return _apply_edits(lines, edits) if edits else lines
+
+
+def _insert_position(
+    source: MarkdownStructure,
+    target: MarkdownStructure,
+    source_index: int,
+    target_index: int,
+    missing_indexes: set,
+    line_count: int,
+) -> int:
+    """
+    빠진 원본 블록을 넣을 번역본 줄 위치 (내부 함수)
+
+    앞(없으면 뒤)에 정렬된 블록과의 원본 줄 간격을 유지하되, 앞뒤 번역 블록 사이를 벗어나지 않게 합니다.
+    """
+    missing = source.blocks[source_index]
+    previous = source_index - 1
+    while previous in missing_indexes:
+        previous -= 1
+    following = source_index + 1
+    while following in missing_indexes:
+        following += 1
+
+    if previous >= 0 and target_index > 0:
+        gap = missing.start_line - source.blocks[previous].end_line
+        position = target.blocks[target_index - 1].end_line + gap
+    elif following < len(source.blocks) and target_index < len(target.blocks):
+        distance = source.blocks[following].start_line - missing.start_line
+        position = target.blocks[target_index].start_line - distance
+    else:
+        position = line_count - (source.line_count - missing.start_line)
+
+    lower = 0
+    if target_index > 0:
+        lower = target.blocks[target_index - 1].end_line + 1
+    upper = target.blocks[target_index].start_line if target_index < len(target.blocks) else line_count
+    return max(lower, min(position, upper))
+
+
+def _repair_images(
+    source: MarkdownStructure,
+    source_lines: List[str],
+    target: MarkdownStructure,
+    lines: List[str],
+    repairs: List[dict],
+) -> List[str]:
+    """이미지 경로를 원본 경로로 교체 (이미지 수가 같을 때만, 내부 함수)"""
+    if len(source.images) != len(target.images):
+        return lines
+    lines = list(lines)
+    for (source_path, _), (target_path, line_no) in zip(source.images, target.images):
+        if source_path == target_path:
+            continue
+        old, new = f"]({target_path})", f"]({source_path})"
+        if old not in lines[line_no]:
+            continue
+        lines[line_no] = lines[line_no].replace(old, new, 1)
+        repairs.append({"type": "image_path", "line": line_no + 1, "from": target_path, "to": source_path})
+    return lines
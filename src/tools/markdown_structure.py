@@ -0,0 +1,528 @@
+# Markdown 구조 스캐너
+# 한 번의 줄 단위 순회로 헤더, 코드 펜스, Hugo shortcode, 링크/이미지, front matter를 수집하여
+# Validator가 원본과 번역본의 구조 지문(fingerprint)을 비교하는 데 사용
+
+import difflib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .markdown_blocks import FENCE_PATTERN, HEADING_PATTERN
+
+# 한 줄 안의 인라인 요소 (인라인 코드 안의 링크/shortcode는 세지 않음)
+_INLINE_PATTERN = re.compile(
+    r'(?P<code>(`+)[^`\n]+?\2)'
+    r'|(?P<shortcode>\{\{[<%](?s:.*?)[%>]\}\})'
+    r'|(?P<image>!\[[^\]]*\]\((?P<image_target>[^)]+)\))'
+    r'|(?P<link>\[[^\]]+\]\((?P<link_target>[^)]+)\))'
+)
+
+# 여러 줄에 걸친 shortcode 시작 ({{< tab name="..." 다음 줄에 >}})과 끝
+_SHORTCODE_OPEN_PATTERN = re.compile(r'\{\{[<%]')
+_SHORTCODE_CLOSE_PATTERN = re.compile(r'[%>]\}\}')
+
+# 목록 항목 (-, *, +, 1., 1)), 표 행 (|로 시작)
+_LIST_ITEM_PATTERN = re.compile(r'^\s*(?:[-*+]|(\d{1,9})[.)])\s+')
+_TABLE_ROW_PATTERN = re.compile(r'^\s*\|')
+
+# front matter 최상위 키 (들여쓰기 없는 "key:")
+FRONT_MATTER_KEY_PATTERN = re.compile(r'^([A-Za-z0-9_-]+)\s*:')
+
+# shortcode 내부: 닫힘 여부, 이름, self-closing 여부
+_SHORTCODE_INNER_PATTERN = re.compile(r'^\{\{([<%])\s*(/?)\s*([^\s/%>]+)(.*?)(/?)\s*[%>]\}\}$', re.DOTALL)
+
+# 블록 정렬 DP 표 최대 크기 (넘으면 difflib으로 근사 정렬)
+ALIGN_MAX_CELLS = 1_000_000
+
+# 스캔 결과 캐시 크기 (원본 파일은 타겟 언어마다 다시 검증되므로 재사용)
+SCAN_CACHE_SIZE = int(os.getenv("WSTRANSLATOR_STRUCTURE_CACHE_SIZE", "2048"))
+
+
+@dataclass
+class FenceSpan:
+    """코드 펜스 구간 (줄 번호는 0부터, end_line이 None이면 닫히지 않음)"""
+    marker: str
+    info: str
+    start_line: int
+    end_line: Optional[int] = None
+
+    @property
+    def closed(self) -> bool:
+        return self.end_line is not None
+
+
+@dataclass
+class Shortcode:
+    """Hugo shortcode 태그 하나 ({{< tab >}}, {{% /notice %}} 등)"""
+    name: str
+    kind: str  # "open" | "close" | "self"
+    delimiter: str  # "<" 또는 "%"
+    start_line: int
+    end_line: int
+    text: str
+
+
+@dataclass
+class StructureBlock:
+    """
+    구조 블록 하나 (front matter, 헤더, 코드 펜스, shortcode, 목록, 표)
+
+    signature는 원본/번역 비교 키로, 번역으로 바뀌지 않아야 하는 값만 포함합니다.
+    (헤더 레벨, 펜스 문자와 언어, shortcode 종류와 이름, 목록 항목 수, 표 열/행 수)
+    text는 shortcode 블록의 태그 원문 (자동 복구에서 원본 태그를 그대로 옮길 때 사용)
+    """
+    kind: str
+    start_line: int
+    end_line: int
+    signature: tuple
+    text: str = ""
+
+    @property
+    def line_range(self) -> str:
+        """사람이 읽는 줄 범위 (1부터)"""
+        if self.start_line == self.end_line:
+            return f"{self.start_line + 1}"
+        return f"{self.start_line + 1}-{self.end_line + 1}"
+
+
+@dataclass
+class BlockDiff:
+    """
+    정렬된 블록 차이 하나
+
+    - missing: 원본 블록이 번역에 없음 (target_index는 삽입 위치)
+    - extra: 번역에만 있는 블록 (source_index는 삽입 위치)
+    - changed: 같은 종류의 블록이지만 signature가 다름
+    """
+    op: str
+    source_index: int
+    target_index: int
+    source_block: Optional[StructureBlock] = None
+    target_block: Optional[StructureBlock] = None
+
+    @property
+    def kind(self) -> str:
+        return (self.source_block or self.target_block).kind
+
+    def describe(self) -> str:
+        """한 줄 설명"""
+        if self.op == "missing":
+            block = self.source_block
+            return f"원본 블록 #{self.source_index} {block.kind}({block.line_range}줄) 누락"
+        if self.op == "extra":
+            block = self.target_block
+            return f"번역 블록 #{self.target_index} {block.kind}({block.line_range}줄) 추가됨"
+        return (
+            f"블록 #{self.source_index}/#{self.target_index} {self.kind} 불일치: "
+            f"원본 {self.source_block.line_range}줄, 번역 {self.target_block.line_range}줄"
+        )
+
+    def to_dict(self) -> dict:
+        result = {"op": self.op, "kind": self.kind, "source_index": self.source_index, "target_index": self.target_index}
+        if self.source_block:
+            result["source_lines"] = [self.source_block.start_line + 1, self.source_block.end_line + 1]
+            result["expected"] = list(self.source_block.signature)
+        if self.target_block:
+            result["target_lines"] = [self.target_block.start_line + 1, self.target_block.end_line + 1]
+            result["found"] = list(self.target_block.signature)
+        return result
+
+
+@dataclass
+class MarkdownStructure:
+    """
+    Markdown 구조 지문
+
+    - headings: (레벨, 줄 번호)
+    - fences: 코드 펜스 구간
+    - shortcodes: 등장 순서대로의 shortcode 태그
+    - unclosed_shortcodes / stray_shortcodes: 짝이 맞지 않는 열림/닫힘 태그
+    - links / images: (대상, 줄 번호)
+    - front_matter: 있으면 (시작 줄, 끝 줄), 닫히지 않았으면 끝 줄 None
+    - front_matter_keys: front matter 최상위 키 (등장 순서)
+    - blocks: 구조 블록 순서 (align_blocks로 원본/번역 정렬)
+    """
+    line_count: int = 0
+    headings: List[Tuple[int, int]] = field(default_factory=list)
+    fences: List[FenceSpan] = field(default_factory=list)
+    shortcodes: List[Shortcode] = field(default_factory=list)
+    unclosed_shortcodes: List[Shortcode] = field(default_factory=list)
+    stray_shortcodes: List[Shortcode] = field(default_factory=list)
+    links: List[Tuple[str, int]] = field(default_factory=list)
+    images: List[Tuple[str, int]] = field(default_factory=list)
+    front_matter: Optional[Tuple[int, Optional[int]]] = None
+    front_matter_keys: List[str] = field(default_factory=list)
+    blocks: List[StructureBlock] = field(default_factory=list)
+
+    @property
+    def heading_levels(self) -> List[int]:
+        return [level for level, _ in self.headings]
+
+    @property
+    def has_front_matter(self) -> bool:
+        return self.front_matter is not None
+
+    @property
+    def unclosed_fences(self) -> List[FenceSpan]:
+        return [fence for fence in self.fences if not fence.closed]
+
+    @property
+    def shortcode_sequence(self) -> List[Tuple[str, str]]:
+        """(종류, 이름) 순서 (원본/번역 비교용)"""
+        return [(shortcode.kind, shortcode.name) for shortcode in self.shortcodes]
+
+
+def scan_structure(content: str) -> MarkdownStructure:
+    """
+    Markdown을 한 번 순회하며 구조 지문을 만듭니다.
+
+    - Front matter: 파일 첫 줄이 ---이면 다음 --- 까지 (최상위 키 수집)
+    - 코드 펜스: CommonMark 규칙 (같은 문자, 같거나 긴 마커로만 닫힘), 내부는 구조로 세지 않음
+    - 헤더: 코드 펜스 밖의 ATX 헤더
+    - Shortcode: 여러 줄에 걸친 태그 포함, 열림/닫힘 짝을 스택으로 확인
+      (파일 안에서 닫는 태그가 한 번도 없는 이름은 단독 shortcode로 간주)
+    - 링크/이미지: 인라인 코드 밖의 대상 경로
+    - 목록/표: 연속된 목록 항목(들여쓴 연속 줄 포함)과 | 행을 하나의 블록으로
+
+    Args:
+        content: Markdown 내용
+
+    Returns:
+        MarkdownStructure: 구조 지문
+    """
+    structure = MarkdownStructure()
+    lines = content.splitlines()
+    structure.line_count = len(lines)
+    i = 0
+
+    # Front matter
+    if lines and lines[0].rstrip() == "---":
+        structure.front_matter = (0, None)
+        for j in range(1, len(lines)):
+            line = lines[j]
+            if line.rstrip() == "---":
+                structure.front_matter = (0, j)
+                break
+            key = FRONT_MATTER_KEY_PATTERN.match(line)
+            if key:
+                structure.front_matter_keys.append(key.group(1))
+        end_line = structure.front_matter[1]
+        structure.blocks.append(StructureBlock(
+            "front_matter", 0, len(lines) - 1 if end_line is None else end_line, ("front_matter",)
+        ))
+        if end_line is None:
+            # 닫히지 않은 front matter는 본문으로 보지 않음
+            return structure
+        i = end_line + 1
+
+    fence: Optional[FenceSpan] = None
+    fence_block: Optional[StructureBlock] = None
+    pending: List[str] = []  # 아직 닫히지 않은 여러 줄 shortcode
+    pending_start = 0
+    container: Optional[StructureBlock] = None  # 진행 중인 목록/표 블록
+    blank_before = False
+    while i < len(lines):
+        line = lines[i]
+
+        if fence is not None:
+            match = FENCE_PATTERN.match(line)
+            if match and match.group(1)[0] == fence.marker[0] and len(match.group(1)) >= len(fence.marker) \
+                    and not line.strip().lstrip(fence.marker[0]):
+                fence.end_line = i
+                fence_block.end_line = i
+                fence = None
+            i += 1
+            continue
+
+        if pending:
+            pending.append(line)
+            if _SHORTCODE_CLOSE_PATTERN.search(line):
+                _scan_inline(structure, "\n".join(pending), pending_start, i)
+                pending = []
+            i += 1
+            continue
+
+        if not line.strip():
+            blank_before = True
+            i += 1
+            continue
+
+        match = FENCE_PATTERN.match(line)
+        heading = None if match else HEADING_PATTERN.match(line)
+        container = _extend_container(structure, container, line, i, blank_before, bool(match or heading))
+        blank_before = False
+
+        if match:
+            fence = FenceSpan(marker=match.group(1), info=line.strip()[len(match.group(1)):].strip(), start_line=i)
+            structure.fences.append(fence)
+            fence_block = StructureBlock("fence", i, len(lines) - 1, ("fence", fence.marker[0], fence.info))
+            structure.blocks.append(fence_block)
+            i += 1
+            continue
+
+        if heading:
+            structure.headings.append((len(heading.group(1)), i))
+            structure.blocks.append(StructureBlock("heading", i, i, ("heading", len(heading.group(1)))))
+
+        # 줄 끝에서 닫히지 않은 shortcode는 다음 줄과 합쳐서 처리
+        last_open = None
+        for opened in _SHORTCODE_OPEN_PATTERN.finditer(line):
+            last_open = opened
+        if last_open and not _SHORTCODE_CLOSE_PATTERN.search(line, last_open.end()):
+            _scan_inline(structure, line[:last_open.start()], i, i)
+            pending = [line[last_open.start():]]
+            pending_start = i
+        else:
+            _scan_inline(structure, line, i, i)
+        i += 1
+
+    _match_shortcodes(structure)
+    return structure
+
+
+def _extend_container(
+    structure: MarkdownStructure,
+    container: Optional[StructureBlock],
+    line: str,
+    line_no: int,
+    blank_before: bool,
+    is_block_start: bool,
+) -> Optional[StructureBlock]:
+    """
+    목록/표 블록 갱신 (내부 함수)
+
+    - 목록: 항목 줄이면 이어가거나 새로 시작, 들여쓴 줄이나 빈 줄 없는 연속 줄은 같은 목록
+    - 표: 빈 줄 없이 이어지는 | 행
+    - 헤더/코드 펜스는 진행 중인 블록을 끝냄
+
+    Returns:
+        Optional[StructureBlock]: 진행 중인 목록/표 블록 (없으면 None)
+    """
+    if is_block_start:
+        return None
+
+    if _TABLE_ROW_PATTERN.match(line):
+        if container is not None and container.kind == "table" and not blank_before:
+            container.end_line = line_no
+            container.signature = ("table", container.signature[1], container.signature[2] + 1)
+            return container
+        columns = len(line.strip().strip("|").split("|"))
+        table = StructureBlock("table", line_no, line_no, ("table", columns, 1))
+        structure.blocks.append(table)
+        return table
+
+    item = _LIST_ITEM_PATTERN.match(line)
+    if item:
+        ordered = item.group(1) is not None
+        if container is not None and container.kind == "list":
+            container.end_line = line_no
+            container.signature = ("list", container.signature[1], container.signature[2] + 1)
+            return container
+        block = StructureBlock("list", line_no, line_no, ("list", ordered, 1))
+        structure.blocks.append(block)
+        return block
+
+    if container is not None and container.kind == "list" and (line[0] in " \t" or not blank_before):
+        container.end_line = line_no
+        return container
+    return None
+
+
+def _scan_inline(structure: MarkdownStructure, text: str, start_line: int, end_line: int):
+    """한 줄(또는 여러 줄 shortcode)의 인라인 요소 수집 (내부 함수)"""
+    if "[" not in text and "{{" not in text:
+        return
+    for match in _INLINE_PATTERN.finditer(text):
+        if match.group("shortcode"):
+            shortcode = _parse_shortcode(match.group("shortcode"), start_line, end_line)
+            if shortcode:
+                structure.shortcodes.append(shortcode)
+                structure.blocks.append(StructureBlock(
+                    "shortcode", start_line, end_line, ("shortcode", shortcode.kind, shortcode.name), shortcode.text
+                ))
+        elif match.group("image"):
+            structure.images.append((match.group("image_target"), start_line))
+        elif match.group("link"):
+            structure.links.append((match.group("link_target"), start_line))
+
+
+def _parse_shortcode(text: str, start_line: int, end_line: int) -> Optional[Shortcode]:
+    """shortcode 태그 파싱 (주석 {{</* */>}} 등 이름이 없으면 None, 내부 함수)"""
+    match = _SHORTCODE_INNER_PATTERN.match(text)
+    if not match or match.group(3).startswith("*"):
+        return None
+    if match.group(2):
+        kind = "close"
+    elif match.group(5):
+        kind = "self"
+    else:
+        kind = "open"
+    return Shortcode(
+        name=match.group(3),
+        kind=kind,
+        delimiter=match.group(1),
+        start_line=start_line,
+        end_line=end_line,
+        text=text,
+    )
+
+
+def _match_shortcodes(structure: MarkdownStructure):
+    """열림/닫힘 shortcode 짝 확인 (닫는 태그가 있는 이름만 짝 대상, 내부 함수)"""
+    paired_names = {shortcode.name for shortcode in structure.shortcodes if shortcode.kind == "close"}
+    stack: List[Shortcode] = []
+    for shortcode in structure.shortcodes:
+        if shortcode.kind == "open" and shortcode.name in paired_names:
+            stack.append(shortcode)
+        elif shortcode.kind == "close":
+            # 가장 가까운 같은 이름의 열림 태그와 짝 (사이에 남은 열림 태그는 닫히지 않은 것)
+            for depth in range(len(stack) - 1, -1, -1):
+                if stack[depth].name == shortcode.name:
+                    structure.unclosed_shortcodes.extend(stack[depth + 1:])
+                    del stack[depth:]
+                    break
+            else:
+                structure.stray_shortcodes.append(shortcode)
+    structure.unclosed_shortcodes.extend(stack)
+
+
+def align_blocks(source: List[StructureBlock], target: List[StructureBlock]) -> List[BlockDiff]:
+    """
+    원본/번역 블록 순서를 편집 거리로 정렬하여 차이 나는 블록 목록을 반환합니다.
+
+    공통 앞뒤 구간을 먼저 제외하고, 나머지는 Levenshtein DP로 정렬합니다.
+    같은 종류끼리의 치환은 비용 1(changed), 다른 종류는 삭제 + 삽입(비용 2)으로 처리합니다.
+    남은 구간이 ALIGN_MAX_CELLS보다 크면 difflib 정렬로 대신합니다.
+
+    Args:
+        source: 원본 블록 목록
+        target: 번역 블록 목록
+
+    Returns:
+        List[BlockDiff]: 원본 순서 기준 차이 목록 (같으면 빈 목록)
+    """
+    a = [block.signature for block in source]
+    b = [block.signature for block in target]
+
+    prefix = 0
+    while prefix < len(a) and prefix < len(b) and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < len(a) - prefix and suffix < len(b) - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    middle_a = a[prefix:len(a) - suffix]
+    middle_b = b[prefix:len(b) - suffix]
+    if len(middle_a) * len(middle_b) > ALIGN_MAX_CELLS:
+        ops = _align_with_difflib(middle_a, middle_b)
+    else:
+        ops = _align_with_levenshtein(middle_a, middle_b)
+
+    # ops의 (i, j)는 middle 기준 위치 (삭제/삽입은 반대쪽의 삽입 위치)
+    diffs = []
+    for op, i, j in ops:
+        if op == "changed":
+            diffs.append(BlockDiff(op, prefix + i, prefix + j, source[prefix + i], target[prefix + j]))
+        elif op == "missing":
+            diffs.append(BlockDiff(op, prefix + i, prefix + j, source[prefix + i], None))
+        elif op == "extra":
+            diffs.append(BlockDiff(op, prefix + i, prefix + j, None, target[prefix + j]))
+    return diffs
+
+
+def _align_with_levenshtein(a: List[tuple], b: List[tuple]) -> List[Tuple[str, int, int]]:
+    """편집 거리 DP 정렬 (내부 함수)"""
+    n, m = len(a), len(b)
+    # cost[i][j]: a[:i]와 b[:j]의 최소 편집 비용
+    cost = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(1, n + 1):
+        cost[i][0] = i
+    for j in range(1, m + 1):
+        cost[0][j] = j
+    for i in range(1, n + 1):
+        row, prev = cost[i], cost[i - 1]
+        for j in range(1, m + 1):
+            if a[i - 1] == b[j - 1]:
+                substitute = prev[j - 1]
+            elif a[i - 1][0] == b[j - 1][0]:
+                substitute = prev[j - 1] + 1
+            else:
+                substitute = prev[j - 1] + 2
+            row[j] = min(substitute, prev[j] + 1, row[j - 1] + 1)
+
+    ops = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            same_kind = a[i - 1][0] == b[j - 1][0]
+            step = 0 if a[i - 1] == b[j - 1] else (1 if same_kind else 2)
+            if cost[i][j] == cost[i - 1][j - 1] + step:
+                ops.append(("equal" if step == 0 else "changed", i - 1, j - 1))
+                i, j = i - 1, j - 1
+                continue
+        if i > 0 and cost[i][j] == cost[i - 1][j] + 1:
+            ops.append(("missing", i - 1, j))
+            i -= 1
+        else:
+            ops.append(("extra", i, j - 1))
+            j -= 1
+    ops.reverse()
+    return ops
+
+
+def _align_with_difflib(a: List[tuple], b: List[tuple]) -> List[Tuple[str, int, int]]:
+    """큰 블록 목록용 근사 정렬 (내부 함수)"""
+    ops = []
+    matcher = difflib.SequenceMatcher(a=a, b=b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(paired):
+            ops.append(("changed", i1 + offset, j1 + offset))
+        for i in range(i1 + paired, i2):
+            ops.append(("missing", i, j1 + paired))
+        for j in range(j1 + paired, j2):
+            ops.append(("extra", i1 + paired, j))
+    return ops
+
+
+# (경로, mtime_ns, 크기) → 구조 지문
+_scan_cache: "OrderedDict[Tuple[str, int, int], MarkdownStructure]" = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+def scan_file_structure(file_path: str, content: Optional[str] = None) -> MarkdownStructure:
+    """
+    파일의 구조 지문 (파일이 바뀌지 않았으면 캐시 재사용)
+
+    같은 원본은 타겟 언어마다 다시 검증되므로 (경로, mtime, 크기)가 같으면 다시 스캔하지 않습니다.
+
+    Args:
+        file_path: 파일 경로
+        content: 이미 읽은 파일 내용 (None이면 파일을 읽음)
+
+    Returns:
+        MarkdownStructure: 구조 지문
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+        if cached is not None:
+            _scan_cache.move_to_end(key)
+            return cached
+
+    if content is None:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    structure = scan_structure(content)
+
+    with _scan_cache_lock:
+        _scan_cache[key] = structure
+        while len(_scan_cache) > SCAN_CACHE_SIZE:
+            _scan_cache.popitem(last=False)
+    return structure
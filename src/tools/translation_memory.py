@@ -0,0 +1,174 @@
+# 번역 메모리 (Translation Memory)
+# 세그먼트 해시 → 번역 결과를 translation/ 아래 SQLite 파일에 영구 저장
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+# 번역 메모리 파일명 (translation/ 디렉토리 기준)
+MEMORY_FILENAME = "translation_memory.db"
+
+# 용어집이 없을 때의 버전 값
+NO_GLOSSARY = "none"
+
+
+class TranslationMemory:
+    """
+    세그먼트 단위 번역 메모리
+
+    키: (소스 세그먼트 해시, source_lang, target_lang, 용어집 버전)
+    값: 번역된 세그먼트
+
+    여러 워커 스레드에서 동시에 사용할 수 있도록 하나의 연결을 Lock으로 보호합니다.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS segments (
+                source_hash TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                glossary_version TEXT NOT NULL,
+                target_text TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (source_hash, source_lang, target_lang, glossary_version)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def lookup(
+        self,
+        source_hashes: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        glossary_version: str = NO_GLOSSARY,
+    ) -> Dict[str, str]:
+        """
+        세그먼트 해시 목록에 대한 번역 조회
+
+        Returns:
+            Dict[str, str]: 해시 → 번역 (적중한 것만)
+        """
+        hashes = list(dict.fromkeys(source_hashes))
+        hits: Dict[str, str] = {}
+        if not hashes:
+            return hits
+
+        with self._lock:
+            # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"""
+                    SELECT source_hash, target_text FROM segments
+                    WHERE source_lang = ? AND target_lang = ? AND glossary_version = ?
+                      AND source_hash IN ({placeholders})
+                    """,
+                    [source_lang, target_lang, glossary_version, *chunk],
+                ).fetchall()
+                hits.update(rows)
+        return hits
+
+    def store(
+        self,
+        entries: Iterable[Tuple[str, str]],
+        source_lang: str,
+        target_lang: str,
+        glossary_version: str = NO_GLOSSARY,
+    ) -> int:
+        """
+        (세그먼트 해시, 번역) 목록 저장 (기존 항목은 덮어씀)
+
+        Returns:
+            int: 저장된 항목 수
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (source_hash, source_lang, target_lang, glossary_version, target_text, now)
+            for source_hash, target_text in entries
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO segments
+                    (source_hash, source_lang, target_lang, glossary_version, target_text, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def get_glossary_version(workshop_path: str) -> str:
+    """
+    용어집 버전 계산 (translation/design.md의 용어집 섹션 해시)
+
+    용어집이 바뀌면 이전 번역을 재사용하지 않도록 메모리 키에 포함됩니다.
+    용어집 섹션이 없으면 design.md 전체를 기준으로 합니다.
+
+    Args:
+        workshop_path: Workshop 루트 경로
+
+    Returns:
+        str: 용어집 버전 (design.md가 없으면 "none")
+    """
+    design_path = os.path.join(workshop_path, "translation", "design.md")
+    if not os.path.exists(design_path):
+        return NO_GLOSSARY
+
+    with open(design_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    match = re.search(r'^##\s+Technical Term Glossary\s*$(.*?)(?=^##\s|\Z)', content, re.MULTILINE | re.DOTALL)
+    glossary = match.group(1) if match else content
+    return hashlib.sha256(glossary.strip().encode("utf-8")).hexdigest()[:16]
+
+
+# Workshop별 번역 메모리 인스턴스
+_memories: Dict[str, TranslationMemory] = {}
+_memories_lock = threading.Lock()
+
+
+def get_translation_memory(workshop_path: str) -> Optional[TranslationMemory]:
+    """
+    Workshop의 번역 메모리 인스턴스 반환 (경로별로 하나만 생성)
+
+    Args:
+        workshop_path: Workshop 루트 경로
+
+    Returns:
+        TranslationMemory: 번역 메모리 (열 수 없으면 None)
+    """
+    db_path = os.path.join(os.path.abspath(workshop_path), "translation", MEMORY_FILENAME)
+    with _memories_lock:
+        if db_path not in _memories:
+            try:
+                _memories[db_path] = TranslationMemory(db_path)
+            except sqlite3.Error as e:
+                print(f"Warning: 번역 메모리를 열 수 없습니다, 메모리 없이 진행합니다: {e}")
+                return None
+        return _memories[db_path]
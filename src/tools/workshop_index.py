@@ -0,0 +1,214 @@
+# Workshop 파일 인덱스
+# os.scandir로 트리를 한 번만 순회하여 디렉토리별 Markdown 파일(크기, mtime)을 기록하고,
+# 이후 실행에서는 디렉토리 mtime이 바뀐 디렉토리만 다시 읽음
+
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# 인덱스 파일명 (translation/ 디렉토리 기준)
+INDEX_FILENAME = "file_index.json"
+INDEX_VERSION = 1
+
+# 파일명의 언어 접미사 (index.en.md → en), 접미사가 없는 .md는 "" 그룹
+_LANG_SUFFIX = re.compile(r'\.([a-z]{2})\.md$')
+
+# 인덱스에서 제외할 workshop 루트 바로 아래 디렉토리 (번역 작업 폴더: 스냅샷, 리포트)
+EXCLUDED_ROOT_DIRS = {"translation"}
+
+
+def get_search_path(workshop_path: str) -> str:
+    """번역 대상 탐색 루트 (content/가 있으면 content/, 없으면 workshop 루트)"""
+    content_path = os.path.join(workshop_path, "content")
+    if os.path.exists(content_path):
+        return content_path
+    return workshop_path
+
+
+class WorkshopIndex:
+    """
+    탐색 루트 아래 디렉토리별 항목 인덱스
+
+    디렉토리 항목: {"mtime_ns", "subdirs": [이름], "files": [Markdown 외 파일 이름],
+                   "md": {파일명: [크기, mtime_ns]}}
+
+    파일이 추가/삭제/이름 변경되면 부모 디렉토리의 mtime이 바뀌므로 refresh는 디렉토리마다
+    stat 한 번으로 변경 여부를 판단합니다. 파일 내용만 바뀐 경우 크기/mtime은
+    해당 디렉토리를 다시 읽을 때까지 이전 값이 유지됩니다.
+    """
+
+    def __init__(self, root: str, dirs: Optional[Dict[str, dict]] = None, excluded: Optional[set] = None):
+        self.root = root
+        self._dirs: Dict[str, dict] = dirs or {}
+        self._excluded = excluded or set()
+        self._by_lang: Optional[Dict[str, List[str]]] = None
+
+    def refresh(self) -> int:
+        """
+        변경된 디렉토리만 다시 읽어 인덱스 갱신
+
+        Returns:
+            int: 다시 읽은 디렉토리 수 (0이면 변경 없음)
+        """
+        rescanned = 0
+        dirs: Dict[str, dict] = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                mtime_ns = os.stat(os.path.join(self.root, rel_dir)).st_mtime_ns
+            except OSError:
+                continue
+            entry = self._dirs.get(rel_dir)
+            if entry is None or entry["mtime_ns"] != mtime_ns:
+                entry = self._scan_dir(rel_dir, mtime_ns)
+                rescanned += 1
+            dirs[rel_dir] = entry
+            stack.extend(os.path.join(rel_dir, name) for name in entry["subdirs"])
+
+        if rescanned or len(dirs) != len(self._dirs):
+            self._dirs = dirs
+            self._by_lang = None
+            rescanned = max(rescanned, 1)
+        return rescanned
+
+    def markdown_files(self, lang: Optional[str] = None) -> List[str]:
+        """
+        언어 접미사별 Markdown 파일 상대 경로 (정렬됨)
+
+        Args:
+            lang: 언어 코드 ("en" → *.en.md), ""이면 접미사 없는 .md, None이면 전체
+        """
+        by_lang = self._language_index()
+        if lang is None:
+            return sorted(path for paths in by_lang.values() for path in paths)
+        return list(by_lang.get(lang, []))
+
+    def languages(self) -> Dict[str, int]:
+        """언어 접미사 → 파일 수 (접미사 없는 .md는 "")"""
+        return {lang: len(paths) for lang, paths in self._language_index().items()}
+
+    def file_stat(self, rel_path: str) -> Optional[Tuple[int, int]]:
+        """Markdown 파일의 (크기, mtime_ns) (인덱스에 없으면 None)"""
+        rel_dir, name = os.path.split(rel_path)
+        entry = self._dirs.get(rel_dir)
+        if entry is None or name not in entry["md"]:
+            return None
+        size, mtime_ns = entry["md"][name]
+        return size, mtime_ns
+
+    def tree(self, max_depth: int = 3) -> str:
+        """get_directory_structure와 같은 형식의 트리 문자열 (파일 시스템을 다시 읽지 않음)"""
+        return "\n".join(self._tree_lines("", "", max_depth))
+
+    def to_dict(self) -> dict:
+        return {"version": INDEX_VERSION, "root": self.root, "dirs": self._dirs}
+
+    def _scan_dir(self, rel_dir: str, mtime_ns: int) -> dict:
+        """디렉토리 하나를 os.scandir로 읽음 (내부 함수)"""
+        entry = {"mtime_ns": mtime_ns, "subdirs": [], "files": [], "md": {}}
+        try:
+            with os.scandir(os.path.join(self.root, rel_dir)) as it:
+                for item in it:
+                    if item.name.startswith("."):
+                        continue
+                    if item.is_dir():
+                        if not (rel_dir == "" and item.name in self._excluded):
+                            entry["subdirs"].append(item.name)
+                    elif item.name.endswith(".md"):
+                        stat = item.stat()
+                        entry["md"][item.name] = [stat.st_size, stat.st_mtime_ns]
+                    else:
+                        entry["files"].append(item.name)
+        except OSError:
+            pass
+        entry["subdirs"].sort()
+        return entry
+
+    def _language_index(self) -> Dict[str, List[str]]:
+        """언어 접미사별 상대 경로 목록 (인덱스가 바뀔 때만 다시 계산, 내부 함수)"""
+        if self._by_lang is None:
+            by_lang: Dict[str, List[str]] = {}
+            for rel_dir, entry in self._dirs.items():
+                for name in entry["md"]:
+                    match = _LANG_SUFFIX.search(name)
+                    by_lang.setdefault(match.group(1) if match else "", []).append(os.path.join(rel_dir, name))
+            self._by_lang = {lang: sorted(paths) for lang, paths in by_lang.items()}
+        return self._by_lang
+
+    def _tree_lines(self, rel_dir: str, prefix: str, depth: int) -> List[str]:
+        if depth == 0 or rel_dir not in self._dirs:
+            return []
+        entry = self._dirs[rel_dir]
+        subdirs = set(entry["subdirs"])
+        items = sorted(entry["subdirs"] + entry["files"] + list(entry["md"]))
+        lines = []
+        for i, name in enumerate(items):
+            is_last = i == len(items) - 1
+            lines.append(f"{prefix}{'└── ' if is_last else '├── '}{name}")
+            if name in subdirs:
+                lines.extend(self._tree_lines(
+                    os.path.join(rel_dir, name), prefix + ("    " if is_last else "│   "), depth - 1
+                ))
+        return lines
+
+
+# 프로세스 내 캐시 (workshop 절대 경로 → 인덱스)
+_indexes: Dict[str, WorkshopIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_workshop_index(workshop_path: str, persist: bool = True) -> WorkshopIndex:
+    """
+    Workshop 파일 인덱스 반환 (메모리 → translation/file_index.json → 전체 순회 순으로 사용)
+
+    반환 전에 refresh로 변경된 디렉토리만 다시 읽고, 바뀐 내용이 있으면 파일에 저장합니다.
+
+    Args:
+        workshop_path: Workshop 루트 경로
+        persist: True면 translation/file_index.json에 저장
+
+    Returns:
+        WorkshopIndex: 최신 인덱스
+    """
+    workshop_path = os.path.abspath(workshop_path)
+    root = get_search_path(workshop_path)
+    excluded = EXCLUDED_ROOT_DIRS if root == workshop_path else set()
+    index_path = os.path.join(workshop_path, "translation", INDEX_FILENAME)
+
+    with _indexes_lock:
+        index = _indexes.get(workshop_path)
+        if index is None or index.root != root:
+            index = WorkshopIndex(root, _load_dirs(index_path, root), excluded)
+            _indexes[workshop_path] = index
+
+        if index.refresh() and persist:
+            _save_index(index, index_path)
+        return index
+
+
+def _load_dirs(index_path: str, root: str) -> Optional[Dict[str, dict]]:
+    """저장된 인덱스의 디렉토리 항목 (형식/루트가 다르면 None, 내부 함수)"""
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != INDEX_VERSION or data.get("root") != root:
+        return None
+    return data.get("dirs")
+
+
+def _save_index(index: WorkshopIndex, index_path: str):
+    """임시 파일에 쓴 뒤 교체 (내부 함수)"""
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        # 읽기 전용 workshop이어도 메모리 인덱스로 계속 진행
+        print(f"Warning: 파일 인덱스 저장 실패: {e}")
@@ -0,0 +1,7 @@
+# 테스트 공통 설정
+# src/ 아래 모듈(tools, task_manager, model 등)을 패키지 설치 없이 import
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -0,0 +1,108 @@
+# AIMD 동시성 제어기 테스트
+
+import asyncio
+
+import pytest
+
+from model.concurrency import AdaptiveConcurrencyController, is_throttling_error
+
+
+class ThrottlingException(Exception):
+    pass
+
+
+class FakeClientError(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+def test_is_throttling_error():
+    assert is_throttling_error(ThrottlingException())
+    assert is_throttling_error(FakeClientError("TooManyRequestsException"))
+    assert not is_throttling_error(FakeClientError("ValidationException"))
+    assert not is_throttling_error(ValueError())
+
+
+def test_try_acquire_respects_limit():
+    controller = AdaptiveConcurrencyController(initial=2, min_limit=1, max_limit=4)
+    first = controller.try_acquire()
+    second = controller.try_acquire()
+    assert first is not None and second is not None
+    assert controller.try_acquire() is None
+    controller.release(first, failed=True)
+    assert controller.try_acquire() is not None
+
+
+def test_additive_increase_is_about_one_per_window_of_successes():
+    controller = AdaptiveConcurrencyController(initial=4, min_limit=1, max_limit=8)
+    for _ in range(3):
+        controller.release(controller.acquire())
+    assert controller.limit == 4
+    for _ in range(2):
+        controller.release(controller.acquire())
+    assert controller.limit == 5
+
+
+def test_increase_stops_at_max():
+    controller = AdaptiveConcurrencyController(initial=3, min_limit=1, max_limit=3)
+    for _ in range(20):
+        controller.release(controller.acquire())
+    assert controller.limit == 3
+
+
+def test_throttling_halves_limit_down_to_min():
+    controller = AdaptiveConcurrencyController(initial=8, min_limit=2, max_limit=8)
+    controller.release(controller.acquire(), throttled=True)
+    assert controller.limit == 4
+    controller.release(controller.acquire(), throttled=True)
+    controller.release(controller.acquire(), throttled=True)
+    assert controller.limit == 2
+    assert controller.snapshot()["throttled"] == 3
+
+
+def test_throttles_from_requests_started_before_decrease_count_once():
+    controller = AdaptiveConcurrencyController(initial=8, min_limit=1, max_limit=8)
+    in_flight = [controller.acquire() for _ in range(4)]
+    for started in in_flight:
+        controller.release(started, throttled=True)
+    assert controller.limit == 4
+    assert controller.in_flight == 0
+
+
+def test_failed_requests_do_not_increase_limit():
+    controller = AdaptiveConcurrencyController(initial=2, min_limit=1, max_limit=8)
+    for _ in range(10):
+        controller.release(controller.acquire(), failed=True)
+    assert controller.limit == 2
+
+
+def test_slot_releases_on_exception():
+    controller = AdaptiveConcurrencyController(initial=1, min_limit=1, max_limit=1)
+    with pytest.raises(ThrottlingException):
+        with controller.slot():
+            raise ThrottlingException()
+    assert controller.in_flight == 0
+    assert controller.snapshot()["throttled"] == 1
+
+
+def test_async_waiters_are_served_in_order_and_cancellation_frees_slot():
+    async def scenario():
+        controller = AdaptiveConcurrencyController(initial=2, min_limit=1, max_limit=2)
+        order = []
+
+        async def job(index):
+            async with controller.async_slot():
+                order.append(index)
+                await asyncio.sleep(0.01)
+
+        jobs = [asyncio.ensure_future(job(i)) for i in range(8)]
+        await asyncio.sleep(0)
+        jobs[4].cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+        return order, controller.snapshot()
+
+    order, snapshot = asyncio.run(scenario())
+    assert order == [0, 1, 2, 3, 5, 6, 7]
+    assert snapshot["in_flight"] == 0
+    assert snapshot["async_waiters"] == 0
@@ -0,0 +1,126 @@
+# 내용 해시 기반 증분 재번역 테스트 (파일 단위 무효화, 블록 단위 재사용)
+
+import re
+
+import pytest
+
+from agents.workers import translator_worker
+from agents.workers.translator_worker import commit_translation, translate_single_file
+from task_manager import manager as manager_module
+from task_manager.manager import TaskManager
+from task_manager.types import TaskResult, TaskStatus
+from tools.file_tools import compute_file_hash
+
+SOURCE = """# Title
+
+Alpha paragraph.
+
+Beta paragraph.
+
+Gamma paragraph.
+"""
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """모델에 보낸 세그먼트 목록 (응답은 대문자 변환)"""
+    sent = []
+
+    def send(prompt):
+        segments = re.findall(r'<segment id="([^"]+)">\n(.*?)\n</segment>', prompt, re.DOTALL)
+        sent.extend(text for _, text in segments)
+        return "\n".join(f'<segment id="{seg_id}">\n{text.upper()}\n</segment>' for seg_id, text in segments)
+
+    monkeypatch.setattr(translator_worker, "_create_sender", lambda: send)
+    return sent
+
+
+@pytest.fixture
+def workshop(tmp_path):
+    source = tmp_path / "index.en.md"
+    source.write_text(SOURCE, encoding="utf-8")
+    return tmp_path, source
+
+
+def test_changed_block_is_retranslated_and_neighbours_reused(workshop, sent):
+    root, source = workshop
+    translate_single_file(str(source), "ko", "en", str(root))
+    target = root / "index.ko.md"
+    # 사람이 고친 이웃 블록은 그대로 유지되어야 함
+    target.write_text(target.read_text(encoding="utf-8").replace("ALPHA", "Edited alpha"), encoding="utf-8")
+    commit_translation(str(root), str(source), "ko")
+    sent.clear()
+
+    source.write_text(SOURCE.replace("Beta paragraph.", "Beta paragraph, revised."), encoding="utf-8")
+    result = translate_single_file(str(source), "ko", "en", str(root))
+
+    assert sent == ["Beta paragraph, revised."]
+    assert result.metadata["reused_segments"] == 3
+    assert target.read_text(encoding="utf-8") == (
+        "# TITLE\n\nEdited alpha PARAGRAPH.\n\nBETA PARAGRAPH, REVISED.\n\nGAMMA PARAGRAPH.\n"
+    )
+
+
+@pytest.fixture
+def translated(workshop, monkeypatch):
+    """번역/검토/검증이 끝난 상태로 저장된 workshop"""
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_JOURNAL)
+    root, source = workshop
+    target = root / "index.ko.md"
+    target.write_text(SOURCE.upper(), encoding="utf-8")
+
+    task_manager = TaskManager("test")
+    task_manager.initialize(str(root), "ko", [str(source)])
+    for task_id, metadata in (
+        ("2.1.1", {"source_hash": compute_file_hash(str(source)), "target_hash": compute_file_hash(str(target))}),
+        ("2.1.2", {}),
+        ("2.1.3", {}),
+    ):
+        task_manager.mark_in_progress(task_id)
+        task_manager.complete_task(TaskResult(task_id=task_id, success=True, metadata=metadata))
+    task_manager.flush()
+    return root, source, target, task_manager
+
+
+def _resume(root, source):
+    task_manager = TaskManager("test")
+    task_manager.initialize(str(root), "ko", [str(source)])
+    return task_manager, [task_manager.get_task(f"2.1.{n}").status for n in (1, 2, 3)]
+
+
+def test_unchanged_file_is_skipped(translated):
+    root, source, _, _ = translated
+    task_manager, statuses = _resume(root, source)
+    assert statuses == [TaskStatus.COMPLETED] * 3
+    assert task_manager.invalidated_files == []
+
+
+def test_changed_source_resets_the_whole_chain(translated):
+    root, source, _, _ = translated
+    source.write_text(SOURCE + "\nDelta paragraph.\n", encoding="utf-8")
+    task_manager, statuses = _resume(root, source)
+    assert statuses == [TaskStatus.NOT_STARTED] * 3
+    assert task_manager.invalidated_files == [str(source)]
+
+
+def test_edited_target_reruns_review_and_validation_only(translated):
+    root, source, target, _ = translated
+    target.write_text(SOURCE.upper() + "\n수동 수정\n", encoding="utf-8")
+    _, statuses = _resume(root, source)
+    assert statuses == [TaskStatus.COMPLETED, TaskStatus.NOT_STARTED, TaskStatus.NOT_STARTED]
+
+
+def test_validate_repair_updates_target_hash(translated):
+    root, source, target, task_manager = translated
+    # 검증 재실행 중 자동 복구로 번역 파일이 바뀜
+    target.write_text(SOURCE.upper().replace("ALPHA", "Alpha"), encoding="utf-8")
+    task_manager.mark_in_progress("2.1.3")
+    task_manager.complete_task(TaskResult(
+        task_id="2.1.3", success=True,
+        metadata={"repaired": True, "target_hash": compute_file_hash(str(target))},
+    ))
+    assert task_manager.get_task("2.1.1").target_hash == compute_file_hash(str(target))
+    task_manager.flush()
+
+    _, statuses = _resume(root, source)
+    assert statuses == [TaskStatus.COMPLETED] * 3
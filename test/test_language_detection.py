@@ -0,0 +1,61 @@
+# 로컬 언어 감지 테스트 (문자 체계/n-gram 판단과 모호한 샘플 처리)
+
+import pytest
+
+from tools.file_tools import detect_file_languages, detect_text_language, read_text_sample
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("이 워크샵에서는 Amazon Bedrock을 사용하여 생성형 AI 애플리케이션을 구축합니다.", "ko"),
+    ("このワークショップでは Amazon Bedrock を使用して生成 AI アプリケーションを構築します。", "ja"),
+    ("在本研讨会中，您将使用 Amazon Bedrock 构建生成式人工智能应用程序并部署到云端。", "zh"),
+])
+def test_cjk_scripts(text, expected):
+    lang, confidence = detect_text_language(text)
+    assert lang == expected
+    assert confidence > 0.5
+
+
+def test_latin_language_by_trigrams():
+    text = (
+        "In this workshop you will build a generative AI application and deploy it "
+        "to the cloud. Follow the steps below to create the resources you need."
+    )
+    assert detect_text_language(text)[0] == "en"
+
+
+def test_short_sample_is_ambiguous():
+    assert detect_text_language("Amazon Bedrock 콘솔") == (None, 0.0)
+
+
+def test_cyrillic_without_ukrainian_letters_is_ambiguous():
+    assert detect_text_language("Этот семинар поможет вам создать приложение в облаке")[0] is None
+    assert detect_text_language("Цей семінар допоможе вам створити застосунок у хмарі")[0] == "uk"
+
+
+def test_mixed_scripts_are_ambiguous():
+    text = "Этот семинар поможет вам. This workshop will help you build. Ce atelier vous aidera."
+    assert detect_text_language(text)[0] is None
+
+
+def test_sample_skips_front_matter_and_code(tmp_path):
+    path = tmp_path / "index.md"
+    path.write_text(
+        "---\ntitle: \"워크샵 소개 페이지입니다 워크샵 소개 페이지입니다\"\n---\n"
+        "```bash\necho 'run this command to build the application in the cloud'\n```\n"
+        "{{% notice info %}}\n![diagram](img.png)\n"
+        "In this workshop you will build a generative AI application.\n",
+        encoding="utf-8",
+    )
+    assert read_text_sample(str(path)) == "In this workshop you will build a generative AI application."
+
+
+def test_files_are_split_into_detected_and_ambiguous(tmp_path):
+    korean = tmp_path / "a.md"
+    korean.write_text("# 소개\n\n이 워크샵에서는 생성형 AI 애플리케이션을 구축하고 배포하는 방법을 배웁니다.\n", encoding="utf-8")
+    code_only = tmp_path / "b.md"
+    code_only.write_text("```python\nprint('이 워크샵에서는 생성형 AI 애플리케이션을 구축합니다')\n```\n", encoding="utf-8")
+
+    detected, ambiguous = detect_file_languages([str(korean), str(code_only)])
+    assert detected == {str(korean): "ko"}
+    assert ambiguous == [str(code_only)]
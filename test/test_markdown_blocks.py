@@ -0,0 +1,90 @@
+# Markdown 블록 분할/청크 테스트
+
+from tools.markdown_blocks import (
+    chunk_segments,
+    estimate_tokens,
+    match_unchanged_segments,
+    segment_hash,
+    split_blocks,
+    split_segments,
+)
+
+SAMPLE = """---
+title: "Intro"
+weight: 10
+---
+# Title
+
+First paragraph
+continues here.
+
+```bash
+echo one
+
+echo two
+```
+{{% notice info %}}
+Note text
+{{% /notice %}}
+
+## Sub
+Last line
+"""
+
+
+def test_split_blocks_round_trip():
+    blocks = split_blocks(SAMPLE)
+    assert "".join(blocks) == SAMPLE
+    assert blocks[0].startswith("---\ntitle")
+
+
+def test_fence_with_blank_line_is_one_block():
+    blocks = split_blocks(SAMPLE)
+    fences = [block for block in blocks if block.lstrip().startswith("```")]
+    assert len(fences) == 1
+    assert "echo one" in fences[0] and "echo two" in fences[0]
+
+
+def test_heading_and_shortcode_start_new_blocks():
+    starts = [block.lstrip("\n").split("\n", 1)[0] for block in split_blocks(SAMPLE)]
+    assert "# Title" in starts
+    assert "## Sub" in starts
+    assert "{{% notice info %}}" in starts
+
+
+def test_split_segments_round_trip():
+    for content in (SAMPLE, SAMPLE.replace("\n", "\r\n"), "", "\n\n", "no trailing newline"):
+        segments = split_segments(content)
+        assert "".join(s.prefix + s.text + s.suffix for s in segments) == content
+
+
+def test_segment_hash_ignores_trailing_whitespace_and_newline_style():
+    assert segment_hash("a  \nb\n") == segment_hash("a\r\nb")
+    assert segment_hash("  a") != segment_hash("a")
+
+
+def test_match_unchanged_segments():
+    old = split_segments("# A\n\none\n\ntwo\n")
+    new = split_segments("# A\n\nchanged\n\ntwo\n")
+    assert match_unchanged_segments(old, new) == {0: 0, 2: 2}
+
+
+def test_chunk_segments_keeps_order_and_budget():
+    segments = [(str(i), "word " * 40) for i in range(10)]
+    chunks = chunk_segments(segments, max_tokens=120)
+    assert [item for chunk in chunks for item in chunk] == segments
+    for chunk in chunks:
+        assert len(chunk) == 1 or sum(estimate_tokens(text) for _, text in chunk) <= 120
+
+
+def test_chunk_segments_oversized_segment_is_alone():
+    segments = [("0", "a"), ("1", "x" * 4000), ("2", "b")]
+    chunks = chunk_segments(segments, max_tokens=100)
+    assert [("1", "x" * 4000)] in chunks
+
+
+def test_chunk_segments_prefers_heading_boundary():
+    segments = [("0", "word " * 60), ("1", "## Next\nbody"), ("2", "tail")]
+    chunks = chunk_segments(segments, max_tokens=100)
+    assert chunks[0] == [("0", "word " * 60)]
+    assert chunks[1][0][0] == "1"
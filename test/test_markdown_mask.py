@@ -0,0 +1,56 @@
+# 번역 전 마스킹 테스트
+
+import pytest
+
+from tools.markdown_mask import mask_text, needs_translation, unmask_text
+
+
+@pytest.mark.parametrize("text", [
+    "Run `make build` then see [docs](https://docs.aws.amazon.com/lambda/).",
+    "```python\n# comment\nprint('hi')\n```\nAfter the code.",
+    "{{% notice info %}}\nUse the console.\n{{% /notice %}}",
+    "![diagram](/static/images/arch.png) shows the flow.",
+    "Literal ⟦0⟧ and ⟦7⟧ stay as written, `code` too.",
+])
+def test_mask_unmask_round_trip(text):
+    masked, originals = mask_text(text)
+    assert unmask_text(masked, originals) == text
+
+
+def test_code_shortcode_and_url_are_hidden():
+    masked, originals = mask_text(
+        "Call `aws s3 ls` in {{< tab >}} or open https://console.aws.amazon.com now."
+    )
+    assert "aws s3 ls" not in masked
+    assert "{{<" not in masked
+    assert "console.aws" not in masked
+    assert "`aws s3 ls`" in originals
+
+
+def test_link_target_with_parentheses_is_masked_whole():
+    masked, originals = mask_text("See [wiki](https://en.wikipedia.org/wiki/A_(b)) now.")
+    assert masked == "See [wiki](⟦0⟧) now."
+    assert originals == ["https://en.wikipedia.org/wiki/A_(b)"]
+
+
+def test_bare_url_excludes_trailing_punctuation():
+    masked, originals = mask_text("Visit https://aws.amazon.com. Then (https://x.com/a_(b)), ok?")
+    assert originals == ["https://aws.amazon.com", "https://x.com/a_(b)"]
+    assert masked == "Visit ⟦0⟧. Then (⟦1⟧), ok?"
+
+
+def test_translated_text_with_placeholders_unmasks():
+    masked, originals = mask_text("Run `ls` first.")
+    assert unmask_text(masked.replace("Run", "실행").replace("first", "먼저"), originals) == "실행 `ls` 먼저."
+
+
+@pytest.mark.parametrize("translated", ["⟦0⟧ ⟦0⟧", "nothing left", "⟦1⟧"])
+def test_unmask_rejects_missing_or_duplicated_placeholders(translated):
+    _, originals = mask_text("Run `ls`.")
+    assert unmask_text(translated, originals) is None
+
+
+def test_needs_translation():
+    assert not needs_translation(mask_text("```\ncode\n```")[0])
+    assert not needs_translation("⟦0⟧ ⟦1⟧ 123")
+    assert needs_translation(mask_text("Open `x` now")[0])
@@ -0,0 +1,129 @@
+# Markdown 구조 자동 복구 테스트
+
+from tools.markdown_repair import repair_structure
+
+SOURCE = '''---
+title: "Intro"
+weight: 10
+---
+# Title
+
+Intro text.
+
+![diagram](/static/images/a.png)
+
+{{% notice info %}}
+Note text.
+{{% /notice %}}
+
+```bash
+echo hi
+```
+
+{{< tabs >}}
+{{< tab name="a" >}}
+body
+{{< /tab >}}
+{{< /tabs >}}
+
+## Next
+
+Closing text.
+'''
+
+TRANSLATED = (
+    SOURCE.replace('title: "Intro"', 'title: "소개"')
+    .replace("Intro text.", "소개 문장.")
+    .replace("Note text.", "참고 문장.")
+    .replace("Closing text.", "마무리 문장.")
+)
+
+
+def _types(repairs):
+    return [repair["type"] for repair in repairs]
+
+
+def test_clean_translation_is_unchanged():
+    content, repairs = repair_structure(SOURCE, TRANSLATED)
+    assert content == TRANSLATED
+    assert repairs == []
+
+
+def test_restores_fence_shortcode_and_image():
+    damaged = (
+        TRANSLATED.replace("{{% /notice %}}", "{{% /notiz %}}")
+        .replace("/static/images/a.png", "/static/images/b.png")
+        .replace("echo hi\n```\n", "echo hi\n")
+    )
+    content, repairs = repair_structure(SOURCE, damaged)
+    assert content == TRANSLATED
+    assert sorted(_types(repairs)) == ["fence_closed", "image_path", "shortcode_replaced"]
+
+
+def test_inserts_missing_shortcode_lines():
+    damaged = TRANSLATED.replace("{{< /tab >}}\n{{< /tabs >}}\n", "")
+    content, repairs = repair_structure(SOURCE, damaged)
+    assert content == TRANSLATED
+    assert len(repairs) == 2
+
+
+def test_restores_front_matter_delimiters():
+    closing_lost = TRANSLATED.replace("weight: 10\n---\n", "weight: 10\n\n", 1)
+    assert repair_structure(SOURCE, closing_lost)[0].startswith('---\ntitle: "소개"\nweight: 10\n---\n')
+
+    opening_lost = TRANSLATED[len("---\n"):]
+    assert repair_structure(SOURCE, opening_lost)[0] == TRANSLATED
+
+
+def test_missing_front_matter_is_not_rebuilt():
+    damaged = TRANSLATED.split("---\n", 2)[2]
+    content, repairs = repair_structure(SOURCE, damaged)
+    assert content == damaged
+    assert "front_matter_restored" not in _types(repairs)
+
+
+def test_changed_code_body_is_not_closed():
+    damaged = TRANSLATED.replace("echo hi\n```\n", "echo 안녕\n")
+    content, repairs = repair_structure(SOURCE, damaged)
+    assert "fence_closed" not in _types(repairs)
+    assert "echo 안녕\n" in content
+
+
+def test_keeps_crlf_and_missing_trailing_newline():
+    damaged = TRANSLATED.replace("{{% /notice %}}", "{{% /notiz %}}").rstrip("\n").replace("\n", "\r\n")
+    content, repairs = repair_structure(SOURCE, damaged)
+    assert content == TRANSLATED.rstrip("\n").replace("\n", "\r\n")
+    assert _types(repairs) == ["shortcode_replaced"]
+
+
+def test_validator_writes_repaired_file(tmp_path):
+    from agents.workers.validator_worker import validate_single_file
+    from tools.file_tools import compute_file_hash
+
+    source_path = tmp_path / "index.en.md"
+    target_path = tmp_path / "index.ko.md"
+    source_path.write_text(SOURCE, encoding="utf-8")
+    target_path.write_text(TRANSLATED.replace("{{% /notice %}}", "{{% /notiz %}}"), encoding="utf-8")
+
+    result = validate_single_file(str(source_path), str(target_path), "ko")
+
+    assert result.success
+    assert result.metadata["repaired"] is True
+    assert target_path.read_text(encoding="utf-8") == TRANSLATED
+    assert result.metadata["target_hash"] == compute_file_hash(str(target_path))
+
+
+def test_validator_leaves_unrepairable_file(tmp_path):
+    from agents.workers.validator_worker import validate_single_file
+
+    source_path = tmp_path / "index.en.md"
+    target_path = tmp_path / "index.ko.md"
+    damaged = TRANSLATED.split("---\n", 2)[2]
+    source_path.write_text(SOURCE, encoding="utf-8")
+    target_path.write_text(damaged, encoding="utf-8")
+
+    result = validate_single_file(str(source_path), str(target_path), "ko")
+
+    assert not result.success
+    assert result.metadata["repaired"] is False
+    assert target_path.read_text(encoding="utf-8") == damaged
@@ -0,0 +1,186 @@
+# Markdown 구조 스캐너 테스트
+
+from tools import markdown_structure
+from tools.markdown_structure import align_blocks, scan_file_structure, scan_structure
+
+SAMPLE = '''---
+title: "Intro"
+weight: 10
+---
+# Title
+
+Some [link](http://a) and ![img](/static/a.png) and `[not](link)`.
+
+```bash
+# not a heading
+{{< notice >}}
+```
+
+{{% notice info %}}
+Note text
+{{% /notice %}}
+
+{{< tabs
+   name="x" >}}
+{{< tab name="a" >}}
+body
+{{< /tab >}}
+{{< /tabs >}}
+
+````md
+```
+nested
+```
+````
+
+## Sub
+'''
+
+
+def test_front_matter_and_keys():
+    structure = scan_structure(SAMPLE)
+    assert structure.front_matter == (0, 3)
+    assert structure.front_matter_keys == ["title", "weight"]
+
+
+def test_unclosed_front_matter():
+    structure = scan_structure("---\ntitle: x\n# Body\n")
+    assert structure.has_front_matter
+    assert structure.front_matter[1] is None
+
+
+def test_headings_ignore_code_fences():
+    structure = scan_structure(SAMPLE)
+    assert structure.heading_levels == [1, 2]
+
+
+def test_fences_pair_by_marker_length():
+    structure = scan_structure(SAMPLE)
+    assert [(fence.marker, fence.start_line, fence.end_line) for fence in structure.fences] == [
+        ("```", 8, 11),
+        ("````", 24, 28),
+    ]
+    assert structure.fences[0].info == "bash"
+    assert not structure.unclosed_fences
+
+
+def test_unclosed_fence_is_reported():
+    structure = scan_structure("text\n\n```python\nprint(1)\n")
+    assert len(structure.unclosed_fences) == 1
+    assert structure.unclosed_fences[0].start_line == 2
+
+
+def test_shortcodes_outside_code_including_multiline():
+    structure = scan_structure(SAMPLE)
+    assert structure.shortcode_sequence == [
+        ("open", "notice"), ("close", "notice"),
+        ("open", "tabs"), ("open", "tab"), ("close", "tab"), ("close", "tabs"),
+    ]
+    tabs = structure.shortcodes[2]
+    assert (tabs.start_line, tabs.end_line) == (17, 18)
+    assert not structure.unclosed_shortcodes and not structure.stray_shortcodes
+
+
+def test_unbalanced_shortcodes():
+    # 닫는 태그가 있는 이름만 짝 대상 ({{< figure >}}처럼 단독 사용 가능)
+    structure = scan_structure("{{% notice %}}\ntext\n{{% /notiz %}}\n")
+    assert not structure.unclosed_shortcodes
+    assert [shortcode.name for shortcode in structure.stray_shortcodes] == ["notiz"]
+
+    structure = scan_structure("{{< tabs >}}\n{{< tab >}}\nbody\n{{< /tabs >}}\n{{< tab >}}\n{{< /tab >}}\n")
+    assert [(shortcode.name, shortcode.start_line) for shortcode in structure.unclosed_shortcodes] == [("tab", 1)]
+    assert not structure.stray_shortcodes
+
+
+def test_links_and_images_skip_inline_code():
+    structure = scan_structure(SAMPLE)
+    assert structure.links == [("http://a", 6)]
+    assert structure.images == [("/static/a.png", 6)]
+
+
+def test_blocks_in_document_order():
+    kinds = [block.kind for block in scan_structure(SAMPLE).blocks]
+    assert kinds[0] == "front_matter"
+    assert kinds[1] == "heading"
+    assert kinds[-1] == "heading"
+    assert "fence" in kinds and "shortcode" in kinds
+
+
+def test_list_and_table_blocks():
+    content = "- a\n- b\n  cont\n\n- c\n\n| x | y |\n|---|---|\n| 1 | 2 |\n\n1. one\n2. two\n"
+    blocks = scan_structure(content).blocks
+    assert [(block.signature, block.line_range) for block in blocks] == [
+        (("list", False, 3), "1-5"),
+        (("table", 2, 3), "7-9"),
+        (("list", True, 2), "11-12"),
+    ]
+
+
+def test_scan_file_structure_caches_until_file_changes(tmp_path):
+    path = tmp_path / "a.en.md"
+    path.write_text("# One\n", encoding="utf-8")
+    first = scan_file_structure(str(path))
+    assert scan_file_structure(str(path)) is first
+
+    path.write_text("# One\n## Two\n", encoding="utf-8")
+    assert scan_file_structure(str(path)).heading_levels == [1, 2]
+
+
+ALIGN_SOURCE = """# Title
+
+Intro text.
+
+```bash
+echo hi
+```
+
+{{% notice info %}}
+Note
+{{% /notice %}}
+
+- a
+- b
+
+## Next
+
+Closing text.
+"""
+
+
+def _diffs(target: str):
+    return align_blocks(scan_structure(ALIGN_SOURCE).blocks, scan_structure(target).blocks)
+
+
+def test_align_identical_structure():
+    translated = ALIGN_SOURCE.replace("Intro text.", "소개 문장.").replace("Closing text.", "마무리.")
+    assert _diffs(translated) == []
+
+
+def test_align_reports_missing_block():
+    diffs = _diffs(ALIGN_SOURCE.replace("```bash\necho hi\n```\n\n", ""))
+    assert [(diff.op, diff.kind, diff.source_index) for diff in diffs] == [("missing", "fence", 1)]
+    assert diffs[0].target_block is None
+    assert "누락" in diffs[0].describe()
+
+
+def test_align_reports_extra_block():
+    diffs = _diffs(ALIGN_SOURCE.replace("## Next\n", "## Next\n\n{{< figure src=\"a.png\" >}}\n"))
+    assert [(diff.op, diff.kind) for diff in diffs] == [("extra", "shortcode")]
+    assert diffs[0].to_dict()["target_lines"] == [18, 18]
+
+
+def test_align_same_kind_is_changed():
+    diffs = _diffs(ALIGN_SOURCE.replace("- a\n- b\n", "- a\n- b\n- c\n"))
+    assert [(diff.op, diff.kind, diff.source_index, diff.target_index) for diff in diffs] == [
+        ("changed", "list", 4, 4)
+    ]
+    result = diffs[0].to_dict()
+    assert result["expected"] == ["list", False, 2]
+    assert result["found"] == ["list", False, 3]
+
+
+def test_align_falls_back_to_difflib(monkeypatch):
+    target = ALIGN_SOURCE.replace("```bash\necho hi\n```\n\n", "")
+    expected = [(diff.op, diff.source_index) for diff in _diffs(target)]
+    monkeypatch.setattr(markdown_structure, "ALIGN_MAX_CELLS", 0)
+    assert [(diff.op, diff.source_index) for diff in _diffs(target)] == expected
@@ -0,0 +1,91 @@
+# 작은 파일 묶음 번역 테스트 (실행 단위 구성, 파일별 결과 분배)
+
+import re
+
+import pytest
+
+from agents import scheduler
+from agents.scheduler import _build_units, execute_phase
+from agents.workers import translator_worker
+from agents.workers.translator_worker import is_packable, translate_files_packed
+from task_manager import manager as manager_module
+from task_manager.manager import TaskManager
+from task_manager.types import Task, TaskResult, TaskStatus, TaskType
+
+
+def _task(task_id, path, task_type=TaskType.TRANSLATE):
+    return Task(id=task_id, type=task_type, file_path=str(path))
+
+
+@pytest.fixture
+def files(tmp_path):
+    """작은 파일 a, b, c와 PACK_MAX_LINES를 넘는 큰 파일"""
+    paths = {}
+    for name in ("a", "b", "c"):
+        paths[name] = tmp_path / f"{name}.en.md"
+        paths[name].write_text(f"# {name.upper()} title\n\nBody of {name}.\n", encoding="utf-8")
+    paths["big"] = tmp_path / "big.en.md"
+    paths["big"].write_text("line\n\n" * translator_worker.PACK_MAX_LINES, encoding="utf-8")
+    return paths
+
+
+def test_is_packable_uses_line_limit(files, tmp_path):
+    assert is_packable(str(files["a"]))
+    assert not is_packable(str(files["big"]))
+    assert not is_packable(str(tmp_path / "missing.en.md"))
+
+
+def test_small_translations_are_packed_in_order(files, monkeypatch):
+    monkeypatch.setattr(scheduler, "PACK_MAX_FILES", 2)
+    tasks = [
+        _task("1", files["a"]),
+        _task("2", files["big"]),
+        _task("3", files["b"]),
+        _task("4", files["a"], TaskType.REVIEW),
+        _task("5", files["c"]),
+    ]
+    cache = {}
+    units = _build_units(tasks, True, cache)
+
+    assert [[task.id for task in unit] for unit in units] == [["1", "3"], ["2"], ["4"], ["5"]]
+    assert cache == {str(files["a"]): True, str(files["big"]): False, str(files["b"]): True, str(files["c"]): True}
+
+
+def test_packing_can_be_disabled(files):
+    tasks = [_task("1", files["a"]), _task("2", files["b"])]
+    assert [[task.id for task in unit] for unit in _build_units(tasks, False, {})] == [["1"], ["2"]]
+
+
+def test_packed_response_is_split_back_to_files(files, monkeypatch):
+    prompts = []
+
+    def send(prompt):
+        prompts.append(prompt)
+        segments = re.findall(r'<segment id="([^"]+)">\n(.*?)\n</segment>', prompt, re.DOTALL)
+        # 응답 순서가 바뀌어도 ID로 파일별로 나뉘어야 함
+        return "\n".join(f'<segment id="{seg_id}">\n{text.upper()}\n</segment>' for seg_id, text in reversed(segments))
+
+    monkeypatch.setattr(translator_worker, "_create_sender", lambda: send)
+    missing = files["a"].parent / "missing.en.md"
+    results = translate_files_packed([str(files["a"]), str(missing), str(files["b"])], "ko")
+
+    assert len(prompts) == 1
+    assert [result.success for result in results] == [True, False, True]
+    assert results[0].metadata["packed_files"] == 2
+    assert (files["a"].parent / "a.ko.md").read_text(encoding="utf-8") == "# A TITLE\n\nBODY OF A.\n"
+    assert (files["b"].parent / "b.ko.md").read_text(encoding="utf-8") == "# B TITLE\n\nBODY OF B.\n"
+
+
+def test_short_pack_results_fail_the_remaining_tasks(files, monkeypatch):
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_JOURNAL)
+    task_manager = TaskManager("test")
+    task_manager.initialize(str(files["a"].parent), "ko", [str(files["a"]), str(files["b"])])
+
+    def pack_worker(tasks, target_lang, source_lang, workshop_path):
+        return [TaskResult(task_id="", success=True)]  # 두 번째 파일 결과 누락
+
+    execution = execute_phase(task_manager, TaskType.TRANSLATE, max_concurrent=1, pack_worker=pack_worker)
+
+    assert [result.task_id for result in execution.results] == ["2.1.1", "2.2.1"]
+    assert task_manager.get_task("2.1.1").status == TaskStatus.COMPLETED
+    assert task_manager.get_task("2.2.1").status == TaskStatus.FAILED
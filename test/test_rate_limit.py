@@ -0,0 +1,114 @@
+# 모델별 Token Bucket 속도 제한 테스트
+
+import asyncio
+import time
+
+import pytest
+
+from model import rate_limit
+from model.rate_limit import ModelRateLimiter, Reservation, TokenBucket
+
+
+class FakeClock:
+    """time.monotonic/time.sleep 대체 (sleep하면 시각만 전진)"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limit.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_bucket_starts_full(clock):
+    bucket = TokenBucket(60)
+    assert bucket.available == 60
+    assert bucket.take(60) == 0
+    assert bucket.available == 0
+
+
+def test_bucket_refills_per_second(clock):
+    bucket = TokenBucket(60)  # 초당 1개
+    bucket.take(60)
+    clock.now += 2.5
+    assert bucket.available == pytest.approx(2.5)
+
+
+def test_take_waits_for_refill(clock):
+    bucket = TokenBucket(60)
+    bucket.take(60)
+    waited = bucket.take(3)
+    assert waited == pytest.approx(3.0)
+    assert all(seconds <= 1.0 for seconds in clock.slept)
+
+
+def test_take_is_clamped_to_capacity(clock):
+    bucket = TokenBucket(10)
+    assert bucket.take(1_000) == 0
+    assert bucket.available == 0
+
+
+def test_give_is_capped_and_can_create_debt(clock):
+    bucket = TokenBucket(100)
+    bucket.take(30)
+    bucket.give(50)
+    assert bucket.available == 100
+    bucket.give(-120)
+    assert bucket.available == -20
+
+
+def test_reconcile_returns_unused_estimate(clock):
+    limiter = ModelRateLimiter("model", rpm=10, tpm=1_000)
+    reservation = limiter.reserve(800)
+    assert limiter.tokens.available == 200
+    reservation.actual_tokens = 300
+    limiter.reconcile(reservation)
+    assert limiter.tokens.available == 700
+    assert limiter.snapshot()["actual_tokens"] == 300
+
+
+def test_reconcile_charges_extra_agent_requests(clock):
+    limiter = ModelRateLimiter("model", rpm=10, tpm=1_000)
+    reservation = limiter.reserve(10)
+    reservation.actual_requests = 4
+    limiter.reconcile(reservation)
+    assert limiter.requests.available == 10 - 4
+
+
+def test_reservation_defaults_skip_reconcile(clock):
+    limiter = ModelRateLimiter("model", rpm=10, tpm=1_000)
+    limiter.reconcile(Reservation(model_id="model", estimated_tokens=500))
+    assert limiter.tokens.available == 1_000
+
+
+def test_take_async_serves_callers_in_arrival_order():
+    async def scenario():
+        bucket = TokenBucket(6_000)  # 초당 100개
+        bucket.give(-bucket.available)
+        order = []
+
+        async def take(name, amount):
+            await bucket.take_async(amount)
+            order.append(name)
+
+        large = asyncio.ensure_future(take("large", 5))
+        await asyncio.sleep(0)
+        small = [asyncio.ensure_future(take(i, 1)) for i in range(5)]
+        await asyncio.gather(large, *small)
+        return order
+
+    started = time.monotonic()
+    assert asyncio.run(scenario()) == ["large", 0, 1, 2, 3, 4]
+    assert time.monotonic() - started < 5
@@ -0,0 +1,96 @@
+# 모델 호출 재시도 및 서킷 브레이커 테스트
+
+import asyncio
+
+import pytest
+
+from model import retry
+from model.retry import CircuitBreaker, CircuitOpenError, call_with_retry, call_with_retry_async
+
+
+class ThrottlingException(Exception):
+    pass
+
+
+class ServerError(Exception):
+    def __init__(self):
+        super().__init__("boom")
+        self.response = {"Error": {"Code": "InternalServerException"}, "ResponseMetadata": {"HTTPStatusCode": 500}}
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """threshold 2, cooldown 0인 브레이커를 "test-model"에 등록 (백오프 대기 없음)"""
+    breaker = CircuitBreaker(threshold=2, cooldown=0)
+    monkeypatch.setitem(retry._breakers, "test-model", breaker)
+    monkeypatch.setattr(retry, "backoff_delay", lambda attempt: 0)
+    return breaker
+
+
+def _fail(error):
+    def call():
+        raise error
+    return call
+
+
+def test_server_errors_open_the_circuit(breaker):
+    with pytest.raises(ServerError):
+        call_with_retry("test-model", _fail(ServerError()), max_attempts=2)
+    assert breaker.is_open
+
+
+def test_throttling_does_not_open_the_circuit(breaker):
+    for _ in range(5):
+        with pytest.raises(ThrottlingException):
+            call_with_retry("test-model", _fail(ThrottlingException()), max_attempts=2)
+    assert not breaker.is_open
+    assert call_with_retry("test-model", lambda: "ok") == "ok"
+
+
+def test_throttled_trial_keeps_circuit_half_open(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    with pytest.raises(ThrottlingException):
+        call_with_retry("test-model", _fail(ThrottlingException()), max_attempts=1)
+    assert breaker.is_open
+    assert call_with_retry("test-model", lambda: "ok") == "ok"
+    assert not breaker.is_open
+
+
+def test_interrupted_trial_releases_the_circuit(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    with pytest.raises(KeyboardInterrupt):
+        call_with_retry("test-model", _fail(KeyboardInterrupt()))
+    assert call_with_retry("test-model", lambda: "ok") == "ok"
+
+
+def test_cancelled_async_trial_releases_the_circuit(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def ok():
+        return "ok"
+
+    async def scenario():
+        task = asyncio.ensure_future(call_with_retry_async("test-model", hang))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await call_with_retry_async("test-model", ok)
+
+    assert asyncio.run(scenario()) == "ok"
+
+
+def test_running_trial_blocks_other_calls(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.before_call() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release_trial()
+    assert breaker.before_call() is True
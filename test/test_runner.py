@@ -0,0 +1,82 @@
+# Headless 파이프라인 실행기 종료 코드 테스트
+
+import pytest
+
+from agents import runner
+from agents.runner import EXIT_ERROR, EXIT_FAILED, EXIT_INTERRUPTED, EXIT_OK, run_headless
+from task_manager import manager as manager_module
+from task_manager.manager import release_task_manager
+from task_manager.types import TaskResult
+
+
+@pytest.fixture
+def workshop(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_JOURNAL)
+    content = tmp_path / "content"
+    content.mkdir()
+    for name in ("a", "b"):
+        (content / f"{name}.en.md").write_text(f"# {name}\n", encoding="utf-8")
+    yield tmp_path
+    release_task_manager(str(tmp_path))
+
+
+def fake_pipeline(fail=()):
+    """준비된 태스크를 모두 실행하는 execute_pipeline 대체 (fail의 파일명 접두사는 번역 실패)"""
+    calls = []
+
+    def execute(manager, max_concurrent=None, source_lang="en", on_result=None):
+        calls.append(manager.get_progress().completed)
+        while True:
+            ready = manager.get_ready_tasks(None, limit=100)
+            if not ready:
+                return
+            for task in ready:
+                manager.mark_in_progress(task.id)
+                failed = task.id.endswith(".1") and any(f"/{name}." in task.file_path for name in fail)
+                result = TaskResult(task_id=task.id, success=not failed, error="boom" if failed else None)
+                manager.complete_task(result)
+                if on_result:
+                    on_result(result)
+
+    execute.calls = calls
+    return execute
+
+
+def test_completed_run_exits_zero(workshop, monkeypatch):
+    monkeypatch.setattr(runner, "execute_pipeline", fake_pipeline())
+    logs = []
+    assert run_headless(str(workshop), ["ko"], log=logs.append) == EXIT_OK
+    assert any(line.startswith("[ko] Done in") and "6/6 completed, 0 failed" in line for line in logs)
+    assert (workshop / ".gitignore").exists()
+
+
+def test_failed_tasks_exit_one_after_retries(workshop, monkeypatch):
+    pipeline = fake_pipeline(fail=("b",))
+    monkeypatch.setattr(runner, "execute_pipeline", pipeline)
+    assert run_headless(str(workshop), ["ko"], retries=2, log=lambda line: None) == EXIT_FAILED
+    assert len(pipeline.calls) == 3
+
+
+def test_source_language_is_skipped(workshop, monkeypatch):
+    monkeypatch.setattr(runner, "execute_pipeline", fake_pipeline())
+    assert run_headless(str(workshop), ["en"], log=lambda line: None) == EXIT_ERROR
+    assert run_headless(str(workshop), ["en", "ko"], log=lambda line: None) == EXIT_OK
+
+
+def test_invalid_workshop_exits_two(tmp_path):
+    logs = []
+    assert run_headless(str(tmp_path / "missing"), ["ko"], log=logs.append) == EXIT_ERROR
+    assert logs[0].startswith("Error: workshop path not found")
+
+    (tmp_path / "empty").mkdir()
+    assert run_headless(str(tmp_path / "empty"), ["ko"], log=lambda line: None) == EXIT_ERROR
+
+
+def test_interrupt_exits_130(workshop, monkeypatch):
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(runner, "execute_pipeline", interrupted)
+    logs = []
+    assert run_headless(str(workshop), ["ko"], log=logs.append) == EXIT_INTERRUPTED
+    assert "Interrupted" in logs[-1]
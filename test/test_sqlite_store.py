@@ -0,0 +1,99 @@
+# SQLite 태스크 상태 저장소 테스트
+
+import pytest
+
+from task_manager import manager as manager_module
+from task_manager.manager import TaskManager
+from task_manager.sqlite_store import SqliteTaskStore
+from task_manager.types import TaskResult, TaskStatus
+
+
+def _record(path, kind, status, **extra):
+    return {"type": "task", "path": path, "kind": kind, "status": status, "retry": 0, **extra}
+
+
+def _header(lang):
+    return {"workshop": "w", "target_lang": lang, "source_lang": "en"}
+
+
+def test_reset_and_load_round_trip(tmp_path):
+    store = SqliteTaskStore(str(tmp_path / "tasks.db"))
+    result = {"task_id": "2.1.1", "success": True, "metadata": {"score": 9}}
+    store.reset(_header("ko"), [_record("a.en.md", "translate", "completed", source_hash="h", result=result)])
+    store.close()
+
+    header, states = SqliteTaskStore(str(tmp_path / "tasks.db")).load("ko")
+    state = states[("a.en.md", "translate")]
+    assert header["workshop"] == "w"
+    assert state["status"] == "completed"
+    assert state["source_hash"] == "h"
+    assert state["result"]["metadata"] == {"score": 9}
+    assert "target_hash" not in state
+
+
+def test_append_upserts_and_survives_reopen(tmp_path):
+    store = SqliteTaskStore(str(tmp_path / "tasks.db"))
+    store.reset(_header("ko"), [_record("a.en.md", "review", "not_started")])
+    store.append(_record("a.en.md", "review", "in_progress"))
+    store.append(_record("a.en.md", "review", "failed", retry=1))
+    store.close()
+
+    _, states = SqliteTaskStore(str(tmp_path / "tasks.db")).load("ko")
+    assert len(states) == 1
+    assert states[("a.en.md", "review")]["status"] == "failed"
+    assert states[("a.en.md", "review")]["retry"] == 1
+
+
+def test_languages_are_kept_separately(tmp_path):
+    store = SqliteTaskStore(str(tmp_path / "tasks.db"))
+    store.reset(_header("ko"), [_record("a.en.md", "translate", "completed")])
+    store.reset(_header("ja"), [_record("a.en.md", "translate", "not_started")])
+
+    assert store.load("ko")[1][("a.en.md", "translate")]["status"] == "completed"
+    assert store.load("ja")[1][("a.en.md", "translate")]["status"] == "not_started"
+    assert store.load("zh") == (None, {})
+    store.close()
+
+
+@pytest.fixture
+def workshop(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_SQLITE)
+    source = tmp_path / "a.en.md"
+    source.write_text("# A\n", encoding="utf-8")
+    (tmp_path / "a.ko.md").write_text("# 가\n", encoding="utf-8")
+    return str(tmp_path), [str(source)]
+
+
+def test_manager_resumes_from_sqlite(workshop):
+    path, files = workshop
+    first = TaskManager("first")
+    first.initialize(path, "ko", files)
+    first.mark_in_progress("2.1.1")
+    first.complete_task(TaskResult(task_id="2.1.1", success=True, metadata={"target_hash": "x"}))
+    first.flush()
+
+    TaskManager("other").initialize(path, "ja", files)
+
+    resumed = TaskManager("resumed")
+    resumed.initialize(path, "ko", files)
+    assert resumed.get_task("2.1.1").status == TaskStatus.COMPLETED
+    assert resumed.get_task("2.1.1").result.success
+
+
+def test_old_database_gains_fresh_column(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "tasks.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE tasks (target_lang TEXT NOT NULL, path TEXT NOT NULL, kind TEXT NOT NULL, "
+        "status TEXT NOT NULL, retry INTEGER NOT NULL DEFAULT 0, source_hash TEXT, target_hash TEXT, "
+        "started_at TEXT, finished_at TEXT, elapsed_seconds REAL, result TEXT, "
+        "PRIMARY KEY (target_lang, path, kind))"
+    )
+    conn.commit()
+    conn.close()
+
+    store = SqliteTaskStore(path)
+    store.reset(_header("ko"), [_record("a.en.md", "translate", "not_started", fresh=True)])
+    assert store.load("ko")[1][("a.en.md", "translate")]["fresh"]
@@ -0,0 +1,92 @@
+# 태스크 상태 저널 테스트
+
+import os
+
+import pytest
+
+from task_manager import manager as manager_module
+from task_manager.journal import TaskJournal, journal_path_for, replay_journal
+from task_manager.manager import TaskManager
+from task_manager.types import TaskResult, TaskStatus
+
+
+def _record(path, kind, status, **extra):
+    return {"type": "task", "path": path, "kind": kind, "status": status, "retry": 0, **extra}
+
+
+def test_journal_path_is_per_language(tmp_path):
+    tasks_path = str(tmp_path / "translation" / "tasks.md")
+    assert journal_path_for(tasks_path, "ko").endswith("tasks.ko.journal.jsonl")
+    assert journal_path_for(tasks_path, "ko") != journal_path_for(tasks_path, "ja")
+
+
+def test_replay_keeps_last_record_per_task(tmp_path):
+    journal = TaskJournal(str(tmp_path / "t" / "tasks.ko.journal.jsonl"))
+    journal.reset({"workshop": "w", "target_lang": "ko", "source_lang": "en"},
+                  [_record("a.en.md", "translate", "not_started")])
+    journal.append(_record("a.en.md", "translate", "in_progress"))
+    journal.append(_record("a.en.md", "translate", "completed", source_hash="abc"))
+    journal.close()
+
+    header, states = journal.load("ko")
+    assert header["target_lang"] == "ko"
+    assert states[("a.en.md", "translate")]["status"] == "completed"
+    assert states[("a.en.md", "translate")]["source_hash"] == "abc"
+
+
+def test_replay_ignores_truncated_last_line(tmp_path):
+    path = str(tmp_path / "tasks.ko.journal.jsonl")
+    journal = TaskJournal(path)
+    journal.reset({"workshop": "w", "target_lang": "ko", "source_lang": "en"},
+                  [_record("a.en.md", "review", "completed")])
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "task", "path": "a.en.md", "kind": "rev')
+
+    _, states = replay_journal(path)
+    assert states[("a.en.md", "review")]["status"] == "completed"
+
+
+def test_replay_missing_journal(tmp_path):
+    assert replay_journal(str(tmp_path / "missing.jsonl")) == (None, {})
+
+
+@pytest.fixture
+def workshop(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_JOURNAL)
+    source = tmp_path / "a.en.md"
+    source.write_text("# A\n", encoding="utf-8")
+    (tmp_path / "a.ko.md").write_text("# 가\n", encoding="utf-8")
+    return str(tmp_path), [str(source)]
+
+
+def test_resume_restores_completed_task(workshop):
+    path, files = workshop
+    first = TaskManager("first")
+    first.initialize(path, "ko", files)
+    first.mark_in_progress("2.1.1")
+    first.complete_task(TaskResult(task_id="2.1.1", success=True))
+    first.mark_in_progress("2.1.2")
+    first.flush()
+
+    resumed = TaskManager("resumed")
+    resumed.initialize(path, "ko", files)
+    assert resumed.get_task("2.1.1").status == TaskStatus.COMPLETED
+    # 중단되어 진행 중으로 남은 태스크는 미완료로 복구
+    assert resumed.get_task("2.1.2").status == TaskStatus.NOT_STARTED
+
+
+def test_other_language_run_keeps_progress(workshop):
+    path, files = workshop
+    korean = TaskManager("ko")
+    korean.initialize(path, "ko", files)
+    korean.mark_in_progress("2.1.1")
+    korean.complete_task(TaskResult(task_id="2.1.1", success=True))
+    korean.flush()
+
+    TaskManager("ja").initialize(path, "ja", files)
+
+    resumed = TaskManager("ko-again")
+    resumed.initialize(path, "ko", files)
+    assert resumed.get_task("2.1.1").status == TaskStatus.COMPLETED
+    assert os.path.exists(journal_path_for(resumed.tasks_path, "ja"))
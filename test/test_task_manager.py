@@ -0,0 +1,209 @@
+# TaskManager 준비 큐/의존성 인덱스와 세션별 인스턴스 테스트
+
+import pytest
+
+from task_manager import manager as manager_module
+from task_manager.manager import (
+    TaskManager,
+    get_task_manager,
+    release_task_manager,
+    reset_current_session,
+    set_current_session,
+)
+from task_manager.types import TaskResult, TaskStatus, TaskType
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_JOURNAL)
+    files = []
+    for name in ("a", "b", "c"):
+        source = tmp_path / f"{name}.en.md"
+        source.write_text(f"# {name}\n", encoding="utf-8")
+        files.append(str(source))
+    task_manager = TaskManager("test")
+    task_manager.initialize(str(tmp_path), "ko", files)
+    return task_manager
+
+
+def _complete(task_manager, task_id, success=True):
+    task_manager.mark_in_progress(task_id)
+    task_manager.complete_task(TaskResult(task_id=task_id, success=success))
+
+
+def _ids(tasks):
+    return [task.id for task in tasks]
+
+
+def test_only_translations_are_ready_initially(manager):
+    assert _ids(manager.get_ready_tasks(TaskType.TRANSLATE, limit=10)) == ["2.1.1", "2.2.1", "2.3.1"]
+    assert manager.get_ready_tasks(TaskType.REVIEW, limit=10) == []
+    assert manager.get_ready_tasks(TaskType.VALIDATE, limit=10) == []
+
+
+def test_limit_is_respected(manager):
+    assert _ids(manager.get_ready_tasks(TaskType.TRANSLATE, limit=2)) == ["2.1.1", "2.2.1"]
+    assert manager.get_ready_tasks(TaskType.TRANSLATE, limit=0) == []
+
+
+def test_in_progress_task_leaves_ready_queue(manager):
+    manager.mark_in_progress("2.1.1")
+    assert "2.1.1" not in _ids(manager.get_ready_tasks(TaskType.TRANSLATE, limit=10))
+
+
+def test_completion_releases_dependents_in_order(manager):
+    _complete(manager, "2.2.1")
+    assert _ids(manager.get_ready_tasks(TaskType.REVIEW, limit=10)) == ["2.2.2"]
+    assert manager.get_ready_tasks(TaskType.VALIDATE, limit=10) == []
+
+    _complete(manager, "2.2.2")
+    assert _ids(manager.get_ready_tasks(TaskType.VALIDATE, limit=10)) == ["2.2.3"]
+
+
+def test_pipeline_prefers_later_phases(manager):
+    _complete(manager, "2.1.1")
+    _complete(manager, "2.1.2")
+    assert _ids(manager.get_ready_tasks(None, limit=3)) == ["2.1.3", "2.2.1", "2.3.1"]
+
+
+def test_failed_task_does_not_release_dependents(manager):
+    _complete(manager, "2.1.1", success=False)
+    assert manager.get_ready_tasks(TaskType.REVIEW, limit=10) == []
+    assert _ids(manager.get_failed_tasks(TaskType.TRANSLATE)) == ["2.1.1"]
+
+    assert manager.reset_for_retry("2.1.1")
+    assert "2.1.1" in _ids(manager.get_ready_tasks(TaskType.TRANSLATE, limit=10))
+
+
+def test_mark_not_started_requeues_without_retry_count(manager):
+    manager.mark_in_progress("2.1.1")
+    assert manager.mark_not_started("2.1.1")
+    task = manager.get_task("2.1.1")
+    assert task.status == TaskStatus.NOT_STARTED
+    assert task.retry_count == 0
+    assert not manager.mark_not_started("2.1.1")
+
+
+def test_progress_counters_follow_transitions(manager):
+    _complete(manager, "2.1.1")
+    _complete(manager, "2.2.1", success=False)
+    manager.mark_in_progress("2.3.1")
+
+    progress = manager.get_progress()
+    assert (progress.total, progress.completed, progress.failed, progress.in_progress) == (9, 1, 1, 1)
+    assert manager.get_phase_progress(TaskType.TRANSLATE).completed == 1
+
+
+def test_sessions_get_separate_managers():
+    try:
+        first = get_task_manager("session-a")
+        assert get_task_manager("session-a") is first
+        assert get_task_manager("session-b") is not first
+
+        token = set_current_session("session-a")
+        try:
+            assert get_task_manager() is first
+        finally:
+            reset_current_session(token)
+    finally:
+        release_task_manager("session-a")
+        release_task_manager("session-b")
+    assert not release_task_manager("session-a")
+
+
+@pytest.mark.parametrize("store", ["journal", "sqlite"])
+def test_release_flushes_and_closes_the_store(tmp_path, monkeypatch, store):
+    monkeypatch.setattr(manager_module, "TASK_STORE", store)
+    source = tmp_path / "a.en.md"
+    source.write_text("# a\n", encoding="utf-8")
+    (tmp_path / "a.ko.md").write_text("# 가\n", encoding="utf-8")
+    session = get_task_manager("session-release")
+    session.initialize(str(tmp_path), "ko", [str(source)])
+    _complete(session, "2.1.1")
+
+    assert release_task_manager("session-release")
+    assert session._store is None
+
+    resumed = TaskManager("test")
+    resumed.initialize(str(tmp_path), "ko", [str(source)])
+    assert resumed.get_task("2.1.1").status == TaskStatus.COMPLETED
+
+
+def test_evicted_idle_manager_is_closed(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_module, "TASK_STORE", manager_module.STORE_JOURNAL)
+    monkeypatch.setattr(manager_module, "MAX_TASK_MANAGERS", 1)
+    source = tmp_path / "a.en.md"
+    source.write_text("# a\n", encoding="utf-8")
+    (tmp_path / "a.ko.md").write_text("# 가\n", encoding="utf-8")
+    try:
+        idle = get_task_manager("session-idle")
+        idle.initialize(str(tmp_path), "ko", [str(source)])
+        _complete(idle, "2.1.1")
+        get_task_manager("session-new")
+        assert idle._store is None
+    finally:
+        release_task_manager("session-idle")
+        release_task_manager("session-new")
+
+    resumed = TaskManager("test")
+    resumed.initialize(str(tmp_path), "ko", [str(source)])
+    assert resumed.get_task("2.1.1").status == TaskStatus.COMPLETED
+
+
+@pytest.mark.parametrize("store", ["journal", "sqlite"])
+def test_force_reset_marks_translations_fresh_until_done(tmp_path, monkeypatch, store):
+    monkeypatch.setattr(manager_module, "TASK_STORE", store)
+    source = tmp_path / "a.en.md"
+    source.write_text("# a\n", encoding="utf-8")
+    task_manager = TaskManager("test")
+    task_manager.initialize(str(tmp_path), "ko", [str(source)], force_reset=True)
+    assert task_manager.get_task("2.1.1").fresh
+    task_manager.flush()
+
+    # 중단 후 재개해도 force_reset 상태 유지
+    resumed = TaskManager("test")
+    resumed.initialize(str(tmp_path), "ko", [str(source)])
+    assert resumed.get_task("2.1.1").fresh
+
+    _complete(resumed, "2.1.1")
+    assert not resumed.get_task("2.1.1").fresh
+
+
+def _fail_validation(task_manager, base_id, **metadata):
+    task_manager.mark_in_progress(f"{base_id}.3")
+    result = TaskResult(task_id=f"{base_id}.3", success=False, error="구조 오류", metadata=metadata)
+    task_manager.complete_task(result)
+    return result
+
+
+def test_failed_repair_sends_file_back_to_translation(manager):
+    _complete(manager, "2.1.1")
+    _complete(manager, "2.1.2")
+    result = _fail_validation(manager, "2.1", repair_attempted=True, repaired=False)
+
+    assert result.metadata["retranslate"]
+    assert [manager.get_task(f"2.1.{n}").status for n in (1, 2, 3)] == [TaskStatus.NOT_STARTED] * 3
+    assert manager.get_task("2.1.1").retry_count == 1
+    assert "2.1.1" in _ids(manager.get_ready_tasks(TaskType.TRANSLATE, limit=10))
+    assert manager.get_ready_tasks(TaskType.VALIDATE, limit=10) == []
+
+    _complete(manager, "2.1.1")
+    _complete(manager, "2.1.2")
+    assert _ids(manager.get_ready_tasks(TaskType.VALIDATE, limit=10)) == ["2.1.3"]
+
+
+def test_validation_failure_without_repair_stays_failed(manager):
+    _complete(manager, "2.1.1")
+    _complete(manager, "2.1.2")
+    _fail_validation(manager, "2.1")
+    assert manager.get_task("2.1.3").status == TaskStatus.FAILED
+    assert manager.get_task("2.1.1").status == TaskStatus.COMPLETED
+
+
+def test_retranslation_stops_at_retry_limit(manager):
+    manager.get_task("2.1.1").retry_count = manager.get_task("2.1.1").max_retries
+    _complete(manager, "2.1.1")
+    _complete(manager, "2.1.2")
+    _fail_validation(manager, "2.1", repair_attempted=True, repaired=False)
+    assert manager.get_task("2.1.3").status == TaskStatus.FAILED
+    assert manager.get_task("2.1.1").status == TaskStatus.COMPLETED
@@ -0,0 +1,146 @@
+# 번역 워커 테스트 (번역 메모리/스냅샷 확정, 증분 재번역)
+
+import re
+
+import pytest
+
+from agents.workers import translator_worker
+from agents.workers.translator_worker import commit_translation, translate_single_file
+from tools.markdown_blocks import split_segments
+from tools.translation_memory import NO_GLOSSARY, get_translation_memory
+
+SOURCE = """# Getting Started
+
+First paragraph.
+
+Second paragraph.
+
+```bash
+echo hi
+```
+"""
+
+
+class FakeSender:
+    """세그먼트를 대문자로 "번역"하고 모델에 보낸 세그먼트를 기록"""
+
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, prompt):
+        segments = re.findall(r'<segment id="([^"]+)">\n(.*?)\n</segment>', prompt, re.DOTALL)
+        self.sent.extend(text for _, text in segments)
+        return "\n".join(f'<segment id="{seg_id}">\n{text.upper()}\n</segment>' for seg_id, text in segments)
+
+
+@pytest.fixture
+def sender(monkeypatch):
+    fake = FakeSender()
+    monkeypatch.setattr(translator_worker, "_create_sender", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def workshop(tmp_path):
+    (tmp_path / "content").mkdir()
+    source_path = tmp_path / "content" / "index.en.md"
+    source_path.write_text(SOURCE, encoding="utf-8")
+    return tmp_path, str(source_path)
+
+
+def _memory_entries(workshop_path):
+    memory = get_translation_memory(str(workshop_path))
+    hashes = [segment.hash for segment in split_segments(SOURCE)]
+    return memory.lookup(hashes, "en", "ko", NO_GLOSSARY)
+
+
+def test_translation_is_not_reused_until_committed(workshop, sender):
+    root, source_path = workshop
+    result = translate_single_file(source_path, "ko", "en", str(root))
+    assert result.success
+    assert result.metadata["model_segments"] == 3
+    assert _memory_entries(root) == {}
+
+    # 검증 전 재실행: 이전 번역/메모리를 재사용하지 않음
+    result = translate_single_file(source_path, "ko", "en", str(root))
+    assert result.metadata["model_segments"] == 3
+    assert result.metadata["reused_segments"] == 0
+
+
+def test_commit_stores_accepted_translation(workshop, sender):
+    root, source_path = workshop
+    translate_single_file(source_path, "ko", "en", str(root))
+    target_path = root / "content" / "index.ko.md"
+    # 검토/복구로 고쳐진 내용이 메모리에 들어가야 함
+    target_path.write_text(target_path.read_text(encoding="utf-8").replace("FIRST", "Reviewed"), encoding="utf-8")
+
+    assert commit_translation(str(root), source_path, "ko") == 3
+    assert "Reviewed PARAGRAPH." in _memory_entries(root).values()
+    assert (root / "translation" / "snapshots" / "ko" / "content" / "index.en.md").exists()
+    assert not (root / "translation" / "snapshots" / "ko.pending" / "content" / "index.en.md").exists()
+
+    result = translate_single_file(source_path, "ko", "en", str(root))
+    assert result.metadata["model_segments"] == 0
+    assert "Reviewed PARAGRAPH." in target_path.read_text(encoding="utf-8")
+
+
+def test_fresh_bypasses_memory_and_snapshot(workshop, sender):
+    root, source_path = workshop
+    translate_single_file(source_path, "ko", "en", str(root))
+    commit_translation(str(root), source_path, "ko")
+    sender.sent.clear()
+
+    result = translate_single_file(source_path, "ko", "en", str(root), fresh=True)
+    assert result.metadata["model_segments"] == 3
+    assert result.metadata["memory_hits"] == 0
+    assert result.metadata["reused_segments"] == 0
+    assert len(sender.sent) == 3
+
+
+def test_commit_without_pending_snapshot_is_noop(workshop):
+    root, source_path = workshop
+    assert commit_translation(str(root), source_path, "ko") == 0
+
+
+def test_validate_task_commits_translation(workshop, sender):
+    from agents.scheduler import run_task
+    from task_manager.types import Task, TaskType
+
+    root, source_path = workshop
+    translate_single_file(source_path, "ko", "en", str(root))
+    result = run_task(Task(id="2.1.3", type=TaskType.VALIDATE, file_path=source_path), "ko", "en", str(root))
+
+    assert result.success
+    assert len(_memory_entries(root)) == 3
+
+
+def test_async_translation_does_file_work_off_the_loop(workshop, monkeypatch):
+    import asyncio
+    import threading
+
+    root, source_path = workshop
+    fake = FakeSender()
+
+    async def send(prompt):
+        return fake(prompt)
+
+    monkeypatch.setattr(translator_worker, "_create_async_sender", lambda: send)
+    threads = []
+    for name in ("_prepare_file", "_prepare_pack", "_finish_file", "_finish_pack"):
+        original = getattr(translator_worker, name)
+
+        def traced(*args, _original=original, **kwargs):
+            threads.append(threading.get_ident())
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(translator_worker, name, traced)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        single = await translator_worker.translate_single_file_async(source_path, "ko", "en", str(root))
+        packed = await translator_worker.translate_files_packed_async([source_path], "ko", "en", str(root))
+        return loop_thread, single, packed
+
+    loop_thread, single, packed = asyncio.run(scenario())
+    assert single.success and packed[0].success
+    assert threads and loop_thread not in threads
@@ -0,0 +1,109 @@
+# Workshop 파일 인덱스 테스트 (변경된 디렉토리만 다시 읽기, 저장된 인덱스 재사용)
+
+import json
+import os
+
+import pytest
+
+from tools import workshop_index
+from tools.workshop_index import INDEX_FILENAME, WorkshopIndex, get_workshop_index
+
+
+@pytest.fixture
+def workshop(tmp_path, monkeypatch):
+    monkeypatch.setattr(workshop_index, "_indexes", {})
+    content = tmp_path / "content"
+    for rel_path in ("_index.en.md", "a/index.en.md", "a/index.ko.md", "b/setup.md", "b/img.png"):
+        path = content / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# x\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    """_scan_dir로 다시 읽은 디렉토리 목록"""
+    dirs = []
+    original = WorkshopIndex._scan_dir
+
+    def scan(self, rel_dir, mtime_ns):
+        dirs.append(rel_dir)
+        return original(self, rel_dir, mtime_ns)
+
+    monkeypatch.setattr(WorkshopIndex, "_scan_dir", scan)
+    return dirs
+
+
+def _touch_dir(path):
+    """디렉토리 mtime을 확실히 바꿈 (파일 시스템 시각 해상도 대비)"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_languages_and_files(workshop):
+    index = get_workshop_index(str(workshop), persist=False)
+    assert index.languages() == {"en": 2, "ko": 1, "": 1}
+    assert index.markdown_files("en") == ["_index.en.md", os.path.join("a", "index.en.md")]
+    assert index.markdown_files("") == [os.path.join("b", "setup.md")]
+    assert "img.png" in index.tree()
+
+
+def test_only_touched_directory_is_rescanned(workshop, scanned):
+    index = get_workshop_index(str(workshop), persist=False)
+    scanned.clear()
+
+    (workshop / "content" / "a" / "extra.en.md").write_text("# y\n", encoding="utf-8")
+    _touch_dir(workshop / "content" / "a")
+    assert index.refresh() == 1
+    assert scanned == ["a"]
+    assert os.path.join("a", "extra.en.md") in index.markdown_files("en")
+
+    scanned.clear()
+    assert index.refresh() == 0
+    assert scanned == []
+
+
+def test_removed_directory_is_dropped(workshop):
+    index = get_workshop_index(str(workshop), persist=False)
+    for name in os.listdir(workshop / "content" / "b"):
+        os.remove(workshop / "content" / "b" / name)
+    os.rmdir(workshop / "content" / "b")
+    _touch_dir(workshop / "content")
+    assert index.refresh() >= 1
+    assert index.markdown_files("") == []
+
+
+def test_persisted_index_is_reused(workshop, scanned, monkeypatch):
+    get_workshop_index(str(workshop))
+    index_path = workshop / "translation" / INDEX_FILENAME
+    assert json.loads(index_path.read_text(encoding="utf-8"))["root"] == str(workshop / "content")
+
+    # 새 프로세스처럼 메모리 캐시 없이 다시 로드하면 디렉토리를 다시 읽지 않음
+    monkeypatch.setattr(workshop_index, "_indexes", {})
+    scanned.clear()
+    index = get_workshop_index(str(workshop))
+    assert scanned == []
+    assert index.languages()["en"] == 2
+
+
+def test_persisted_index_with_other_root_is_ignored(workshop, scanned, monkeypatch):
+    get_workshop_index(str(workshop))
+    index_path = workshop / "translation" / INDEX_FILENAME
+    data = json.loads(index_path.read_text(encoding="utf-8"))
+    data["root"] = "/elsewhere"
+    index_path.write_text(json.dumps(data), encoding="utf-8")
+
+    monkeypatch.setattr(workshop_index, "_indexes", {})
+    scanned.clear()
+    get_workshop_index(str(workshop))
+    assert "" in scanned and "a" in scanned
+
+
+def test_translation_dir_is_excluded_without_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(workshop_index, "_indexes", {})
+    (tmp_path / "index.en.md").write_text("# x\n", encoding="utf-8")
+    (tmp_path / "translation" / "snapshots").mkdir(parents=True)
+    (tmp_path / "translation" / "snapshots" / "index.en.md").write_text("# x\n", encoding="utf-8")
+
+    index = get_workshop_index(str(tmp_path))
+    assert index.markdown_files("en") == ["index.en.md"]